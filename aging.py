@@ -0,0 +1,70 @@
+import heapq
+import math
+import numpy as np
+from event_core import Policy, simulate
+
+# Default priority improvement per time unit waited, used by the optimizer
+DEFAULT_AGING_RATE = 0.1
+
+
+class AgingPriorityPolicy(Policy):
+    """Priority scheduling where the effective priority improves with time waited.
+
+    effective(t) = priority - rate * (t - arrival - executed)
+
+    The `rate * t` term is shared by every ready job, so the ready queue can be
+    ordered by the static key `priority + rate * (arrival + executed)`. Only the
+    running job's key changes (it grows while it runs), so nothing has to be
+    rescanned as time passes: waiting jobs stay put in the heap and the running
+    job is preempted at the moment its key crosses the best waiting key.
+    """
+
+    def __init__(self, aging_rate, preemptive):
+        self.rate = aging_rate
+        self.preempt_on_arrival = preemptive
+        self.preemptive = preemptive
+        self.heap = []  # (key, seq, job)
+
+    def __len__(self):
+        return len(self.heap)
+
+    def add(self, job, now):
+        # A job that has run before (back from I/O, or moved from another core) keeps its key,
+        # and with it the aging credit and CPU time charged so far
+        if job.first_run is None:
+            job.key = job.priority + self.rate * job.arrival
+        heapq.heappush(self.heap, (job.key, job.seq, job))
+
+    def pick(self, now):
+        return heapq.heappop(self.heap)[2]
+
+    def time_slice(self, job, now):
+        if not self.preemptive or not self.heap or self.rate <= 0:
+            return None
+        # First whole time unit at which the running job's key passes the best waiting key
+        gap = self.heap[0][0] - job.key
+        return max(1, math.floor(gap / self.rate) + 1)
+
+    def charge(self, job, ran, now):
+        job.key += self.rate * ran
+
+    def requeue(self, job, ran, now):
+        heapq.heappush(self.heap, (job.key, job.seq, job))
+
+
+def aging_priority_scheduling(processes, aging_rate, preemptive, progress=None):
+    """Run priority scheduling with aging on the event-driven core; returns (rows, gantt_chart)"""
+    return simulate(processes, AgingPriorityPolicy(aging_rate, preemptive), progress=progress)
+
+
+def starvation_report(result):
+    """Tail waiting-time metrics for spotting starvation in a result table"""
+    waiting = np.asarray(result["Waiting"], dtype=float)
+    if not len(waiting):
+        return {"max_waiting": 0.0, "p99_waiting": 0.0, "max_waiting_pid": None}
+    worst = int(np.argmax(waiting))
+    return {
+        "max_waiting": float(waiting[worst]),
+        "p99_waiting": float(np.percentile(waiting, 99)),
+        "max_waiting_pid": np.asarray(result["PID"])[worst:worst + 1].tolist()[0],
+    }
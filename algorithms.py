@@ -0,0 +1,124 @@
+import logging
+import time
+from sim_logging import get_logger, log_event
+
+logger = get_logger(__name__)
+
+# Algorithm names as shown in the GUI dropdown
+ALGORITHMS = ("FCFS", "SJF", "SRTF", "Round Robin", "Priority(Non-Preemptive)", "Priority(Preemptive)",
+              "MLFQ", "CFS", "Stride")
+PRIORITY_ALGORITHMS = ("Priority(Non-Preemptive)", "Priority(Preemptive)")
+PREEMPTIVE_ALGORITHMS = ("Round Robin", "SRTF", "Priority(Preemptive)", "MLFQ", "CFS", "Stride", "EDF", "Rate Monotonic")
+
+# Algorithms that read the Time Quantum box (required for RR, optional base quantum otherwise)
+QUANTUM_ALGORITHMS = ("Round Robin", "MLFQ", "Stride")
+
+# Algorithms the optimizer runs with its tuned Round Robin quantum; Stride keeps its unit quantum
+TUNED_QUANTUM_ALGORITHMS = ("Round Robin", "MLFQ")
+
+# Algorithms that can order jobs by bursts predicted from their history
+PREDICTED_ALGORITHMS = ("SJF", "SRTF")
+
+# Algorithms that use Priority as an optional nice value / ticket share ('-' means default weight)
+WEIGHTED_ALGORITHMS = ("CFS", "Stride")
+
+# Deadline-driven algorithms (realtime.py); they need processes with a Deadline, so they are
+# kept out of ALGORITHMS and only offered where deadlines exist
+REALTIME_ALGORITHMS = ("EDF", "Rate Monotonic")
+
+
+def run_algorithm(algorithm, processes, time_quantum=None, progress=None, **options):
+    """Run the selected scheduling algorithm and return (result, gantt_data)
+
+    Extra keyword options are passed to the policy, e.g. levels/boost_period for MLFQ.
+    """
+    # Schedulers are imported on first use, so the constants above stay cheap to import
+    from fcfs import fcfs_scheduling
+    from sjf import sjf_scheduling
+    from srtf import srtf_scheduling
+    from round_robin import round_robin_scheduling
+    from non_preemptive_priority import priority_scheduling
+    from preemptive_priority import preemptive_priority_scheduling
+    from mlfq import mlfq_scheduling
+    from cfs import cfs_scheduling
+    from stride import stride_scheduling
+    from realtime import realtime_scheduling
+
+    gantt_data = []
+
+    if algorithm == "FCFS":
+        result = fcfs_scheduling(processes, progress=progress)
+        gantt_data = result.rows(["Start", "Completion", "PID"])
+
+    elif algorithm == "SJF":
+        result = sjf_scheduling(processes, progress=progress, **options)
+        gantt_data = result.rows(["Start", "Completion", "PID"])
+
+    elif algorithm == "Round Robin":
+        result, gantt_data = round_robin_scheduling(processes, time_quantum, progress=progress)
+
+    elif algorithm == "SRTF":
+        result, gantt_data = srtf_scheduling(processes, progress=progress, **options)
+
+    elif algorithm == "Priority(Non-Preemptive)":
+        result = priority_scheduling(processes, progress=progress, **options)
+
+        # Ensure 'Start' column exists before using Gantt Chart
+        if "Start" in result.columns:
+            gantt_data = result.rows(["Start", "Completion", "PID"])
+
+    elif algorithm == "Priority(Preemptive)":
+        result, gantt_data = preemptive_priority_scheduling(processes, progress=progress, **options)
+
+    elif algorithm == "MLFQ":
+        if time_quantum:
+            options.setdefault("base_quantum", time_quantum)
+        result, gantt_data = mlfq_scheduling(processes, progress=progress, **options)
+
+    elif algorithm == "CFS":
+        result, gantt_data = cfs_scheduling(processes, progress=progress, **options)
+
+    elif algorithm == "Stride":
+        if time_quantum:
+            options.setdefault("quantum", time_quantum)
+        result, gantt_data = stride_scheduling(processes, progress=progress, **options)
+
+    elif algorithm in REALTIME_ALGORITHMS:
+        result, gantt_data = realtime_scheduling(processes, algorithm, progress=progress)
+
+    else:
+        raise ValueError(f"Unknown scheduling algorithm: {algorithm}")
+
+    return result, gantt_data
+
+
+def simulate(processes, algorithm, time_quantum=None, progress=None, **options):
+    """Run a full simulation and return the display-ready (result, gantt_df) DataFrames
+
+    The schedulers return pandas-free ResultTables; use run_algorithm() directly when
+    only the numbers are needed.
+    """
+    import numpy as np
+    import pandas as pd
+    from gantt_index import compress_gantt
+
+    # Store Original Order (Before Scheduling)
+    original_order = {p["PID"]: i for i, p in enumerate(processes)}
+
+    started = time.perf_counter()
+    result, gantt_data = run_algorithm(algorithm, processes, time_quantum, progress=progress, **options)
+    log_event(logger, logging.DEBUG, "scheduler finished", algorithm=algorithm, processes=len(processes),
+              seconds=round(time.perf_counter() - started, 4))
+
+    # Ensure 'Priority' column only when needed
+    if "Priority" not in result.columns and algorithm not in PRIORITY_ALGORITHMS:
+        result["Priority"] = "-"
+
+    # Sort the result back to original process order
+    order = [original_order[pid] for pid in result["PID"].tolist()]  # Map PIDs to their original index
+    result = result.take(np.argsort(order, kind="stable"))
+
+    # DataFrames are only built here, for display (one segment per contiguous run)
+    gantt_df = pd.DataFrame(compress_gantt(gantt_data), columns=["Start", "Completion", "PID"]) if gantt_data else None
+
+    return result.to_dataframe(), gantt_df
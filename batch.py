@@ -0,0 +1,227 @@
+import argparse
+import time
+from collections import namedtuple
+import numpy as np
+
+# Algorithms simulate_batch() can run over a stack of workloads
+BATCH_ALGORITHMS = ("FCFS", "SJF", "Round Robin")
+
+# Per-workload metrics returned by batch_metrics(), one value per workload each
+BATCH_METRICS = ("avg_turnaround", "avg_waiting", "avg_response", "max_turnaround", "max_waiting",
+                 "max_response", "makespan", "utilization")
+
+# N workloads padded to M processes: (N, M) int64 arrays with each row sorted by arrival
+# (ties in input order) and `lengths` real processes per row. `order` maps every slot
+# back to the process's index in its input workload (-1 for padding). Padding slots have
+# burst 0 and the row's last arrival, so they never change a schedule.
+WorkloadBatch = namedtuple("WorkloadBatch", ["arrivals", "bursts", "lengths", "order"])
+
+
+def batch_from_arrays(arrivals, bursts, lengths=None):
+    """WorkloadBatch from padded (N, M) arrival and burst arrays
+
+    Row i holds its processes in the first `lengths[i]` columns (default: all M); the
+    rest is ignored. Rows need not be sorted.
+    """
+    arrivals = np.array(arrivals, dtype=np.int64, ndmin=2)
+    bursts = np.array(bursts, dtype=np.int64, ndmin=2)
+    if arrivals.shape != bursts.shape:
+        raise ValueError(f"arrivals {arrivals.shape} and bursts {bursts.shape} must have the same shape")
+    n, m = arrivals.shape
+    lengths = np.full(n, m, dtype=np.int64) if lengths is None else np.asarray(lengths, dtype=np.int64)
+    valid = np.arange(m) < lengths[:, None]
+    if np.any(bursts[valid] < 1) or np.any(arrivals[valid] < 0):
+        raise ValueError("bursts must be positive and arrivals non-negative")
+
+    # Stable sort by arrival with the padding pushed to the end of each row
+    order = np.argsort(np.where(valid, arrivals, np.iinfo(np.int64).max), axis=1, kind="stable")
+    arrivals = np.take_along_axis(arrivals, order, axis=1)
+    bursts = np.take_along_axis(bursts, order, axis=1)
+    last = arrivals[np.arange(n), np.maximum(lengths - 1, 0)] * (lengths > 0) if m else np.zeros(n, dtype=np.int64)
+    arrivals = np.where(valid, arrivals, last[:, None])
+    bursts = np.where(valid, bursts, 0)
+    return WorkloadBatch(arrivals, bursts, lengths, np.where(valid, order, -1))
+
+
+def stack_workloads(workloads):
+    """WorkloadBatch from a list of process lists (dicts with "Arrival" and "Burst")"""
+    lengths = np.fromiter((len(processes) for processes in workloads), dtype=np.int64, count=len(workloads))
+    width = int(lengths.max()) if len(lengths) else 0
+    arrivals = np.zeros((len(workloads), width), dtype=np.int64)
+    bursts = np.ones((len(workloads), width), dtype=np.int64)
+    for row, processes in enumerate(workloads):
+        arrivals[row, :len(processes)] = [p["Arrival"] for p in processes]
+        bursts[row, :len(processes)] = [p["Burst"] for p in processes]
+    return batch_from_arrays(arrivals, bursts, lengths)
+
+
+def batch_fcfs(batch):
+    """FCFS over every workload at once; returns (first_run, completion) arrays
+
+    Completion C_i = max(C_(i-1), A_i) + B_i unrolls to S_i + max over j <= i of
+    (A_j - S_(j-1)) with S the running burst total, so the whole stack is a cumulative
+    sum and a cumulative maximum.
+    """
+    totals = np.cumsum(batch.bursts, axis=1)
+    completion = totals + np.maximum.accumulate(batch.arrivals - totals + batch.bursts, axis=1)
+    return completion - batch.bursts, completion
+
+
+def batch_sjf(batch):
+    """Non-preemptive SJF over every workload at once; returns (first_run, completion) arrays
+
+    One process is dispatched per workload per step (M steps), the shortest arrived
+    one with ties going to the earliest arrival, as in sjf.py.
+    """
+    arrivals, bursts, lengths = batch.arrivals, batch.bursts, batch.lengths
+    n, m = arrivals.shape
+    rows = np.arange(n)
+    never = np.iinfo(np.int64).max
+    waiting = np.arange(m) < lengths[:, None]  # Not dispatched yet
+    keys = bursts * m + np.arange(m)  # Burst first, then arrival order
+    start = np.zeros((n, m), dtype=np.int64)
+    now = np.zeros(n, dtype=np.int64)
+
+    for step in range(m):
+        r = rows[step < lengths]
+        pending = waiting[r]
+        # Idle CPU: jump to the earliest arrival still waiting
+        now[r] = np.maximum(now[r], np.where(pending, arrivals[r], never).min(axis=1))
+        ready = pending & (arrivals[r] <= now[r, None])
+        chosen = np.where(ready, keys[r], never).argmin(axis=1)
+        start[r, chosen] = now[r]
+        now[r] += bursts[r, chosen]
+        waiting[r, chosen] = False
+    return start, start + bursts
+
+
+def batch_round_robin(batch, time_quantum):
+    """Round Robin over every workload at once; returns (first_run, completion) arrays
+
+    `time_quantum` is one quantum or one per workload, so a quantum sweep is a stack of
+    copies of one workload. Each step runs one slice on every unfinished workload, with
+    a circular ready queue per row; arrivals during a slice queue ahead of the
+    preempted process, as in round_robin.py.
+    """
+    arrivals, lengths = batch.arrivals, batch.lengths
+    n, m = arrivals.shape
+    quanta = np.broadcast_to(np.asarray(time_quantum, dtype=np.int64), (n,))
+    if np.any(quanta < 1):
+        raise ValueError("time quantum must be at least 1")
+    rows = np.arange(n)
+    remaining = batch.bursts.copy()
+    first_run = np.full((n, m), -1, dtype=np.int64)
+    completion = np.zeros((n, m), dtype=np.int64)
+    queue = np.zeros((n, max(m, 1)), dtype=np.int64)  # Never holds more than the M processes of a row
+    head = np.zeros(n, dtype=np.int64)
+    tail = np.zeros(n, dtype=np.int64)
+    arrived = np.zeros(n, dtype=np.int64)  # Next process to arrive, per row
+    done = np.zeros(n, dtype=np.int64)
+    now = np.zeros(n, dtype=np.int64)
+
+    def admit(r):
+        while len(r):
+            due = arrived[r] < lengths[r]
+            due[due] = arrivals[r[due], arrived[r[due]]] <= now[r[due]]
+            r = r[due]
+            queue[r, tail[r] % m] = arrived[r]
+            tail[r] += 1
+            arrived[r] += 1
+
+    r = rows[lengths > 0]
+    while len(r):
+        admit(r)
+        idle = r[head[r] == tail[r]]
+        now[idle] = arrivals[idle, arrived[idle]]  # Jump to the next arrival
+        admit(idle)
+
+        current = queue[r, head[r] % m]
+        head[r] += 1
+        first = first_run[r, current]
+        first_run[r, current] = np.where(first < 0, now[r], first)
+        ran = np.minimum(quanta[r], remaining[r, current])
+        remaining[r, current] -= ran
+        now[r] += ran
+        admit(r)
+
+        unfinished = remaining[r, current] > 0
+        back = r[unfinished]
+        queue[back, tail[back] % m] = current[unfinished]
+        tail[back] += 1
+        finished = r[~unfinished]
+        completion[finished, current[~unfinished]] = now[finished]
+        done[finished] += 1
+        r = r[done[r] < lengths[r]]
+    return first_run, completion
+
+
+def simulate_batch(batch, algorithm, time_quantum=None):
+    """(first_run, completion) arrays for a WorkloadBatch (or list of workloads) under an algorithm"""
+    if not isinstance(batch, WorkloadBatch):
+        batch = stack_workloads(batch)
+    if algorithm == "FCFS":
+        return batch_fcfs(batch)
+    if algorithm == "SJF":
+        return batch_sjf(batch)
+    if algorithm == "Round Robin":
+        if time_quantum is None:
+            raise ValueError("Round Robin needs a time quantum")
+        return batch_round_robin(batch, time_quantum)
+    raise ValueError(f"Batch simulation supports {', '.join(BATCH_ALGORITHMS)}, not {algorithm}")
+
+
+def batch_metrics(batch, first_run, completion):
+    """Per-workload metrics (BATCH_METRICS, each an (N,) float array) of a batch simulation
+
+    Averages divide exact integer totals, so they equal metrics.compute_metrics on the
+    same schedule. Empty workloads get 0.
+    """
+    valid = np.arange(batch.arrivals.shape[1]) < batch.lengths[:, None]
+    count = np.maximum(batch.lengths, 1)
+    turnaround = completion - batch.arrivals
+    times = {"turnaround": turnaround, "waiting": turnaround - batch.bursts, "response": first_run - batch.arrivals}
+    metrics = {}
+    for name, values in times.items():
+        values = np.where(valid, values, 0)
+        metrics[f"avg_{name}"] = values.sum(axis=1) / count
+        metrics[f"max_{name}"] = values.max(axis=1, initial=0).astype(float)
+    first_arrival = batch.arrivals[:, 0] if valid.shape[1] else 0  # Rows are sorted; empty rows hold 0
+    span = np.where(valid, completion, 0).max(axis=1, initial=0) - first_arrival
+    metrics["makespan"] = span.astype(float)
+    metrics["utilization"] = np.divide(batch.bursts.sum(axis=1), span, out=np.zeros(len(span)), where=span > 0)
+    return metrics
+
+
+if __name__ == "__main__":
+    from event_core import simulate, rows_to_columns
+    from metrics import compute_metrics
+    from policies import make_policy
+    from workload_generator import generate_workload
+
+    parser = argparse.ArgumentParser(description="Batched vs one-call-per-workload simulation throughput")
+    parser.add_argument("--workloads", type=int, default=5000)
+    parser.add_argument("--processes", type=int, default=20)
+    parser.add_argument("-a", "--algorithm", default="Round Robin", choices=BATCH_ALGORITHMS)
+    parser.add_argument("-q", "--quantum", type=int, default=4)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    workloads = [generate_workload(args.processes, seed=int(seed)) for seed in rng.integers(2 ** 32, size=args.workloads)]
+    quantum = args.quantum if args.algorithm == "Round Robin" else None
+
+    started = time.perf_counter()
+    batch = stack_workloads(workloads)
+    batched = batch_metrics(batch, *simulate_batch(batch, args.algorithm, quantum))["avg_waiting"]
+    batch_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    looped = [compute_metrics(rows_to_columns(simulate(processes, make_policy(args.algorithm, quantum))[0]))["avg_waiting"]
+              for processes in workloads]
+    loop_seconds = time.perf_counter() - started
+
+    mismatches = int(np.count_nonzero(batched != np.array(looped)))
+    print(f"{args.workloads} workloads x {args.processes} processes, {args.algorithm}")
+    print(f"  batched:  {batch_seconds:.3f} s")
+    print(f"  per call: {loop_seconds:.3f} s ({loop_seconds / batch_seconds:.1f}x slower)")
+    print(f"  {'OK' if not mismatches else f'MISMATCH in {mismatches} workloads'}: average waiting times agree")
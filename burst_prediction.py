@@ -0,0 +1,115 @@
+from bisect import bisect_left
+import numpy as np
+from event_core import simulate, rows_to_columns
+from metrics import compute_metrics
+from policies import SJFPolicy, SRTFPolicy
+
+# Weight of the most recent burst in the exponential average
+DEFAULT_ALPHA = 0.5
+
+
+class BurstPredictor:
+    """Exponential averaging of burst lengths: tau(n+1) = alpha * t(n) + (1 - alpha) * tau(n)
+
+    Each process's "History" (past bursts, oldest first) seeds its own estimate.
+    Processes without history use a shared estimate that is folded forward in O(1)
+    every time a job completes, so later arrivals benefit from what has run so far.
+    """
+
+    def __init__(self, alpha=DEFAULT_ALPHA, initial=None):
+        if not 0 <= alpha <= 1:
+            raise ValueError("alpha must be between 0 and 1")
+        self.alpha = alpha
+        self.shared = initial  # Estimate for processes without history
+        self.estimates = {}
+
+    def seed(self, processes):
+        """Fold every process's burst history into its estimate"""
+        for p in processes:
+            for burst in p.get("History") or ():
+                self.observe(p["PID"], burst, shared=False)
+        return self
+
+    def predict(self, pid):
+        estimate = self.estimates.get(pid, self.shared)
+        return estimate if estimate is not None else 1
+
+    def observe(self, pid, burst, shared=True):
+        """O(1) update with an actual burst length"""
+        previous = self.estimates.get(pid)
+        self.estimates[pid] = burst if previous is None else self.alpha * burst + (1 - self.alpha) * previous
+        if shared:
+            self.shared = burst if self.shared is None else self.alpha * burst + (1 - self.alpha) * self.shared
+
+
+class PredictedSJFPolicy(SJFPolicy):
+    """SJF ordered by the predicted burst; the true burst is what actually runs
+
+    A job is predicted from the bursts that completed before it arrived, so the
+    prediction does not depend on when an engine hands the arrival to the policy.
+    """
+
+    def __init__(self, predictor):
+        super().__init__()
+        self.predictor = predictor
+        self.predicted = {}  # pid -> prediction used when the job was scheduled
+        self.completions = []  # Completion times, in order
+        self.shared = [predictor.shared]  # Shared estimate before the first and after each completion
+
+    def add(self, job, now):
+        if job.pid not in self.predicted:
+            shared = self.shared[bisect_left(self.completions, job.arrival)]
+            estimate = self.predictor.estimates.get(job.pid, shared)
+            self.predicted[job.pid] = estimate if estimate is not None else 1
+        super().add(job, now)
+
+    def key(self, job):
+        return self.predicted[job.pid]
+
+    def complete(self, job, now):
+        self.predictor.observe(job.pid, job.burst)
+        self.completions.append(now)
+        self.shared.append(self.predictor.shared)
+
+
+class PredictedSRTFPolicy(PredictedSJFPolicy):
+    """SRTF ordered by predicted remaining time (prediction minus time already run)"""
+
+    preempt_on_arrival = True
+
+    def key(self, job):
+        return max(self.predicted[job.pid] - (job.burst - job.remaining), 0)
+
+
+def predicted_scheduling(processes, alpha=DEFAULT_ALPHA, preemptive=False, progress=None, predictor=None):
+    """SJF/SRTF driven by predicted bursts; returns (rows, gantt_chart, predictions)"""
+    predictor = predictor or BurstPredictor(alpha).seed(processes)
+    policy = PredictedSRTFPolicy(predictor) if preemptive else PredictedSJFPolicy(predictor)
+    rows, gantt_chart = simulate(processes, policy, progress=progress)
+    return rows, gantt_chart, policy.predicted
+
+
+def misprediction_report(processes, alpha=DEFAULT_ALPHA, preemptive=False, result=None, predictions=None):
+    """Schedule quality lost by scheduling on predicted instead of true bursts
+
+    Pass the `result` table and `predictions` ({PID: burst}) of a predicted run that
+    has already been made to reuse it; only the oracle schedule is simulated then.
+    """
+    if result is None or predictions is None:
+        rows, gantt, predictions = predicted_scheduling(processes, alpha, preemptive)
+        predicted = compute_metrics(rows_to_columns(rows), gantt)
+    else:
+        predicted = compute_metrics(result)
+    oracle_rows, oracle_gantt = simulate(processes, SRTFPolicy() if preemptive else SJFPolicy())
+    oracle = compute_metrics(rows_to_columns(oracle_rows), oracle_gantt)
+
+    bursts = np.asarray([p["Burst"] for p in processes], dtype=float)
+    guesses = np.asarray([predictions[p["PID"]] for p in processes], dtype=float)
+    loss = predicted["avg_waiting"] - oracle["avg_waiting"]
+    return {
+        "mean_abs_error": float(np.abs(guesses - bursts).mean()) if len(bursts) else 0.0,
+        "avg_waiting": predicted["avg_waiting"],
+        "oracle_avg_waiting": oracle["avg_waiting"],
+        "waiting_loss": loss,
+        "waiting_loss_pct": loss / oracle["avg_waiting"] * 100 if oracle["avg_waiting"] else 0.0,
+    }
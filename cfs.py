@@ -0,0 +1,64 @@
+import heapq
+from event_core import Policy, simulate, process_weight, RESULT_COLUMNS
+from result_table import ResultTable
+
+NICE_0_WEIGHT = 1024
+
+
+class CFSPolicy(Policy):
+    """Completely Fair Scheduler style policy: the ready job with the smallest virtual
+    runtime runs next. Virtual runtime grows inversely to the job's weight, so
+    high-priority (low nice) jobs get a larger share of the CPU."""
+
+    def __init__(self, target_latency=6, min_granularity=1):
+        self.target_latency = target_latency
+        self.min_granularity = min_granularity
+        self.heap = []  # (vruntime, seq, job)
+        self.weights = {}
+        self.total_weight = 0
+        self.min_vruntime = 0.0
+
+    def __len__(self):
+        return len(self.heap)
+
+    def add(self, job, now):
+        weight = process_weight(job.priority)
+        self.weights[job.seq] = weight
+        self.total_weight += weight  # Weight of all runnable jobs, including the running one
+        # New jobs start at the current minimum so they cannot monopolise the CPU
+        job.key = max(job.key, self.min_vruntime)
+        self._push(job)
+
+    def pick(self, now):
+        vruntime, _, job = heapq.heappop(self.heap)
+        self.min_vruntime = max(self.min_vruntime, vruntime)
+        return job
+
+    def time_slice(self, job, now):
+        # Share of the target latency proportional to the job's weight
+        weight = self.weights[job.seq]
+        share = self.target_latency * weight / self.total_weight
+        return max(self.min_granularity, int(round(share)))
+
+    def charge(self, job, ran, now):
+        job.key += ran * NICE_0_WEIGHT / self.weights[job.seq]
+
+    def requeue(self, job, ran, now):
+        self._push(job)
+
+    def complete(self, job, now):
+        self.total_weight -= self.weights.pop(job.seq)
+
+    def _push(self, job):
+        heapq.heappush(self.heap, (job.key, job.seq, job))
+
+
+def cfs_scheduling(processes, target_latency=6, min_granularity=1, progress=None):
+    """CFS-style fair scheduling keyed by virtual runtime (Priority is used as the nice value)"""
+    if not processes:
+        return ResultTable.from_rows([], RESULT_COLUMNS), []
+
+    rows, gantt_chart = simulate(processes, CFSPolicy(target_latency, min_granularity), progress=progress)
+
+    table = ResultTable.from_rows(rows, RESULT_COLUMNS)
+    return table, gantt_chart
@@ -0,0 +1,65 @@
+import weakref
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+
+# ChartCanvas per Tk frame, reused by every plot into that frame
+_canvases = weakref.WeakKeyDictionary()
+
+
+class ChartCanvas:
+    """A Figure and its Tk canvas that live as long as their frame
+
+    Figures are created with matplotlib.figure.Figure rather than pyplot, so they are
+    never registered with pyplot and cannot pile up. Plots update their artists in
+    place and call draw() after structural changes, or blit() to redraw only a few
+    `animated` artists over the cached background.
+    """
+
+    def __init__(self, frame, figsize, **pack_options):
+        self.figure = Figure(figsize=figsize)
+        self.canvas = FigureCanvasTkAgg(self.figure, master=frame)
+        self.canvas.get_tk_widget().pack(fill="both", expand=True, **pack_options)
+        self.artists = {}  # Plot-specific artists kept between updates
+        self.animated = []  # Artists drawn by blit() instead of draw()
+        self.background = None
+        self.pending = False  # A full redraw is scheduled
+        self.canvas.mpl_connect("draw_event", self._on_draw)
+
+    @classmethod
+    def of(cls, frame, figsize, **pack_options):
+        """The frame's chart canvas, created on first use"""
+        chart = _canvases.get(frame)
+        if chart is None:
+            chart = _canvases[frame] = cls(frame, figsize, **pack_options)
+        return chart
+
+    def draw(self):
+        """Schedule a full redraw for when Tk is idle (also refreshes the background used by blit())"""
+        self.pending = True
+        self.canvas.draw_idle()
+
+    def blit(self):
+        """Redraw only the animated artists"""
+        if self.background is None or self.pending:
+            self.draw()  # The full redraw paints the animated artists too
+            return
+        self.canvas.restore_region(self.background)
+        for artist in self.animated:
+            self.figure.draw_artist(artist)
+        self.canvas.blit(self.figure.bbox)
+
+    def _on_draw(self, event):
+        # Cache everything except the animated artists, then paint those on top
+        self.pending = False
+        self.background = self.canvas.copy_from_bbox(self.figure.bbox)
+        for artist in self.animated:
+            self.figure.draw_artist(artist)
+
+
+def clear_chart(frame):
+    """Blank a frame's chart without destroying its figure or canvas"""
+    chart = _canvases.get(frame)
+    if chart is not None:
+        for ax in chart.figure.axes:
+            ax.set_visible(False)
+        chart.draw()
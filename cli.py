@@ -0,0 +1,195 @@
+import argparse
+import csv
+import sys
+from contextlib import nullcontext
+from algorithms import ALGORITHMS, REALTIME_ALGORITHMS
+from event_core import simulate, rows_to_columns
+from gantt_index import GanttIndex
+from io_engine import simulate_io, io_metrics, IO_RESULT_COLUMNS
+from metrics import compute_metrics, format_metric
+from policies import make_policy
+from realtime import (periodic_jobs, hyperperiod, edf_schedulable, rm_schedulable, deadline_metrics,
+                      realtime_scheduling)
+from result_store import ResultFile, write_results, GANTT_COLUMNS, MISSING
+from sim_logging import get_logger, add_logging_arguments, configure_from_args
+from streaming import trace_source, poisson_source, stream_metrics
+
+logger = get_logger(__name__)
+
+# Rows converted per batch when exporting to CSV
+EXPORT_BATCH = 100000
+
+
+def run_command(args):
+    """Simulate a CSV trace and save the results in the binary result format"""
+    processes = list(trace_source(args.trace))
+    policy = make_policy(args.algorithm, args.quantum)
+    metadata = {"algorithm": args.algorithm, "time_quantum": args.quantum, "switch_cost": args.switch_cost,
+                "trace": args.trace}
+    if any("Bursts" in p for p in processes):
+        # CPU/IO burst sequences need the I/O-aware engine
+        rows, gantt, usage = simulate_io(processes, policy, devices=args.devices, switch_cost=args.switch_cost)
+        columns = {col: list(values) for col, values in zip(IO_RESULT_COLUMNS, zip(*rows))}
+        metrics = io_metrics(rows, gantt, usage)
+        metadata["devices"] = args.devices
+    else:
+        rows, gantt = simulate(processes, policy, switch_cost=args.switch_cost)
+        columns = rows_to_columns(rows)
+        metrics = compute_metrics(columns, gantt)
+    write_results(args.output, columns, gantt, compress=args.compress, metadata=metadata)
+    logger.info("wrote %d processes and %d Gantt segments to %s", len(rows), len(gantt), args.output)
+    _print_metrics(metrics)
+
+
+def stream_command(args):
+    """Simulate a trace (or Poisson arrivals) online, keeping only running aggregates in memory"""
+    if (args.trace is None) == (args.rate is None):
+        sys.exit("stream needs either a trace or --rate")
+    if args.trace is not None:
+        source = trace_source(args.trace, follow=args.follow)
+    else:
+        source = poisson_source(args.rate, args.mean_burst, args.burst_cv, args.priority_levels,
+                                duration=args.duration, limit=args.limit, seed=args.seed)
+    try:
+        result = stream_metrics(source, args.algorithm, args.quantum,
+                                progress=lambda done, _: logger.info("%d processes completed", done))
+    except ValueError as e:
+        sys.exit(str(e))
+    print(f"{result.completed} processes, at most {result.max_in_system} in the system, ended at t={result.end_time}")
+    _print_metrics(result.metrics)
+
+
+def info_command(args):
+    """Print a result file's layout, metadata and metrics"""
+    with ResultFile(args.results) as results:
+        print(f"{args.results}: format {results.version}, {len(results)} processes, "
+              f"{'compressed' if results.compressed else 'uncompressed'}")
+        for key, value in results.metadata.items():
+            print(f"  {key}: {value}")
+        for name, (dtype, rows, _, stored) in results.sections.items():
+            print(f"  {name:<18}{dtype.str:<6}{rows:>12} rows{stored:>14} bytes")
+        _print_metrics(compute_metrics(results, results.gantt))
+
+
+def export_command(args):
+    """Write a result file's per-process table (or Gantt segments) as CSV"""
+    with ResultFile(args.results) as results:
+        if args.gantt:
+            gantt = results.gantt
+            if gantt is None:
+                sys.exit(f"{args.results} has no Gantt segments")
+            names, columns = list(GANTT_COLUMNS), [gantt[:, i] for i in range(gantt.shape[1])]
+        else:
+            names, columns = results.columns, [results[name] for name in results.columns]
+        with open(args.csv, "w", newline="") if args.csv != "-" else nullcontext(sys.stdout) as out:
+            writer = csv.writer(out)
+            writer.writerow(names)
+            n = len(columns[0]) if columns else 0
+            for start in range(0, n, EXPORT_BATCH):
+                batch = [column[start:start + EXPORT_BATCH].tolist() for column in columns]
+                writer.writerows([["-" if value == MISSING else value for value in row] for row in zip(*batch)])
+
+
+def gantt_command(args):
+    """Answer "who ran at time t" / "when did PID p run" from a result file's Gantt segments"""
+    with ResultFile(args.results) as results:
+        if results.gantt is None:
+            sys.exit(f"{args.results} has no Gantt segments")
+        index = GanttIndex(results.gantt)
+    print(f"{len(index)} runs, {index.busy_time()} busy time units")
+    for t in args.at or []:
+        pid = index.running_at(t)
+        print(f"  t={t}: {'idle' if pid is None else f'P{pid}'}")
+    for pid in args.pid or []:
+        runs = index.slices_of(pid)
+        print(f"  P{pid}: {len(runs)} runs, {int((runs[:, 1] - runs[:, 0]).sum())} time units")
+        for start, end in runs.tolist():
+            print(f"    {start} - {end}")
+
+
+def realtime_command(args):
+    """Schedulability test and simulation of a periodic task set (Task,Period,Burst[,Deadline,Phase])"""
+    with open(args.tasks, newline="") as f:
+        tasks = [{key: value if key == "Task" else int(value) for key, value in row.items() if value not in (None, "")}
+                 for row in csv.DictReader(f)]
+    if not tasks:
+        sys.exit(f"{args.tasks} has no tasks")
+    test = (edf_schedulable if args.algorithm == "EDF" else rm_schedulable)(tasks)
+    print(f"{len(tasks)} tasks, utilization {test.utilization:.3f} (bound {test.bound:.3f}): "
+          f"{'schedulable' if test.schedulable else 'NOT schedulable'} under {args.algorithm} ({test.test})")
+    if test.response_times:
+        for task, response in zip(tasks, test.response_times):
+            print(f"  {task.get('Task', '?'):<12}worst-case response {response}")
+
+    horizon = args.horizon or hyperperiod(tasks)
+    processes = periodic_jobs(tasks, horizon)
+    result, gantt = realtime_scheduling(processes, args.algorithm)
+    print(f"{len(processes)} jobs released in [0, {horizon})")
+    _print_metrics({**compute_metrics(result, gantt),
+                    **deadline_metrics(result, {p["PID"]: p["Deadline"] for p in processes})})
+
+
+def _print_metrics(metrics):
+    for metric, value in metrics.items():
+        print(f"  {metric:<24}{format_metric(metric, value)}")
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Run schedules and inspect saved results")
+    add_logging_arguments(parser)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="simulate a CSV trace (PID,Arrival,Burst[,Priority])")
+    run.add_argument("trace")
+    run.add_argument("-a", "--algorithm", default="FCFS", choices=ALGORITHMS)
+    run.add_argument("-q", "--quantum", type=int, default=None, help="time quantum (Round Robin)")
+    run.add_argument("--switch-cost", type=int, default=0)
+    run.add_argument("--devices", type=int, default=1, help="I/O devices (traces with a Bursts column)")
+    run.add_argument("-o", "--output", required=True, help="result file to write")
+    run.add_argument("--compress", action="store_true", help="zlib-compress the columns")
+    run.set_defaults(handler=run_command)
+
+    stream = commands.add_parser("stream", help="simulate a trace or Poisson arrivals in bounded memory")
+    stream.add_argument("trace", nargs="?", help="CSV trace (PID,Arrival,Burst[,Priority]) ordered by arrival")
+    stream.add_argument("--follow", action="store_true", help="tail the trace until a line reading EOF")
+    stream.add_argument("--rate", type=float, help="Poisson arrivals per time unit instead of a trace")
+    stream.add_argument("--mean-burst", type=float, default=5.0)
+    stream.add_argument("--burst-cv", type=float, default=1.0)
+    stream.add_argument("--priority-levels", type=int, default=0)
+    stream.add_argument("--duration", type=int, default=None, help="stop Poisson arrivals at this time")
+    stream.add_argument("--limit", type=int, default=None, help="stop after this many Poisson arrivals")
+    stream.add_argument("--seed", type=int, default=None)
+    stream.add_argument("-a", "--algorithm", default="FCFS", choices=ALGORITHMS)
+    stream.add_argument("-q", "--quantum", type=int, default=None, help="time quantum (Round Robin)")
+    stream.set_defaults(handler=stream_command)
+
+    info = commands.add_parser("info", help="summarise a result file")
+    info.add_argument("results")
+    info.set_defaults(handler=info_command)
+
+    export = commands.add_parser("export", help="convert a result file to CSV")
+    export.add_argument("results")
+    export.add_argument("--csv", default="-", help="output path (default: stdout)")
+    export.add_argument("--gantt", action="store_true", help="export Gantt segments instead of processes")
+    export.set_defaults(handler=export_command)
+
+    gantt = commands.add_parser("gantt", help="query who ran when")
+    gantt.add_argument("results")
+    gantt.add_argument("--at", type=int, action="append", metavar="T", help="process running at time T")
+    gantt.add_argument("--pid", type=int, action="append", help="every run of this PID")
+    gantt.set_defaults(handler=gantt_command)
+
+    realtime = commands.add_parser("realtime", help="test and simulate periodic tasks (Task,Period,Burst[,Deadline,Phase])")
+    realtime.add_argument("tasks")
+    realtime.add_argument("-a", "--algorithm", default="EDF", choices=REALTIME_ALGORITHMS)
+    realtime.add_argument("--horizon", type=int, default=None, help="simulated time (default: the hyperperiod)")
+    realtime.set_defaults(handler=realtime_command)
+    return parser
+
+
+if __name__ == "__main__":
+    args = build_parser().parse_args()
+    configure_from_args(args)
+    if args.command in ("run", "stream") and args.algorithm == "Round Robin" and not args.quantum:
+        sys.exit("Round Robin needs --quantum")
+    args.handler(args)
@@ -0,0 +1,624 @@
+import argparse
+import json
+import sys
+import time
+from collections import deque, namedtuple
+import numpy as np
+from algorithms import ALGORITHMS, PRIORITY_ALGORITHMS, PREDICTED_ALGORITHMS
+from burst_prediction import BurstPredictor, PredictedSJFPolicy, PredictedSRTFPolicy
+from cfs import NICE_0_WEIGHT
+from event_core import simulate, process_weight, RESULT_COLUMNS
+from gantt_index import compress_gantt
+from io_engine import simulate_io, IOJob, burst_sequence
+from smp import simulate_smp
+from policies import make_policy
+from stride import STRIDE1
+from sim_logging import get_logger
+from workload_generator import generate_workload, generate_io_workload, random_workload
+
+logger = get_logger(__name__)
+
+# Per-process values that every engine must agree on
+COMPARED_COLUMNS = ("Completion", "Turnaround", "Waiting", "Response")
+
+# Differences listed per failing case (the rest are only counted)
+MAX_REPORTED = 5
+
+# One scheduling run: replaying the same case always gives the same result. `options`
+# are run_algorithm keyword options (aging_rate, alpha, MLFQ levels, ...), None for defaults.
+Case = namedtuple("Case", ["algorithm", "time_quantum", "processes", "options"], defaults=(None,))
+
+# Option values drawn by generate_case; the rates are powers of two so that aging keys
+# and predictions are exact in floating point whichever way an engine sums them
+AGING_RATES = (None, 0.25, 0.5, 1.0)
+ALPHAS = (None, 0.0, 0.5, 0.75, 1.0)
+MLFQ_LEVELS = (2, 3, 4)
+BOOST_PERIODS = (None, 8, 20, 50)
+TARGET_LATENCIES = (3, 6, 12)
+MIN_GRANULARITIES = (1, 2)
+
+
+def reference_engine(case):
+    """The per-algorithm scheduler modules (srtf.py, round_robin.py, ...) via run_algorithm"""
+    from algorithms import run_algorithm
+    result, gantt = run_algorithm(case.algorithm, [dict(p) for p in case.processes], case.time_quantum,
+                                  **(case.options or {}))
+    return result.rows(RESULT_COLUMNS), gantt
+
+
+def event_engine(case):
+    """The event-driven core with the matching policy"""
+    return simulate(case.processes, case_policy(case))
+
+
+def io_engine(case):
+    """The I/O-aware engine, which must match the event core on CPU-only processes"""
+    rows, gantt, _ = simulate_io(case.processes, case_policy(case))
+    return rows, gantt
+
+
+def case_policy(case):
+    """A fresh event-core policy for a case, burst prediction included"""
+    options = dict(case.options or {})
+    alpha = options.pop("alpha", None)
+    if alpha is not None:
+        predictor = BurstPredictor(alpha).seed(case.processes)
+        return PredictedSRTFPolicy(predictor) if case.algorithm == "SRTF" else PredictedSJFPolicy(predictor)
+    return make_policy(case.algorithm, case.time_quantum, **options)
+
+
+def io_steps_engine(case):
+    """CPU/IO burst sequences on one device, simulated one time unit at a time
+
+    An independent check of io_engine's event loop: processes that arrive or finish
+    their I/O at a tick become ready then, and are handed to the policy in time order
+    (ties in arrival order) at the next scheduling decision.
+    """
+    policy = case_policy(case)
+    jobs = [IOJob(p["PID"], p["Arrival"], burst_sequence(p), p.get("Priority", "-"), i)
+            for i, p in enumerate(sorted(case.processes, key=lambda p: p["Arrival"]))]
+    rows = [None] * len(jobs)
+    gantt = []
+    ready = []  # (time, seq, job, after I/O) not yet handed to the policy
+    device = None  # (job, end) in service
+    device_queue = deque()  # (job, time issued)
+    running = None  # (job, start, end)
+    idx = completed = 0
+
+    def hand(now):
+        for time_, _, job, after_io in sorted(ready, key=lambda event: event[:2]):
+            policy.add(job, time_ if after_io else now)
+        ready.clear()
+
+    t = 0
+    while completed < len(jobs):
+        events = len(ready)
+        if device is not None and device[1] == t:
+            job, device = device[0], None
+            job.phase += 1
+            job.burst = job.remaining = job.bursts[job.phase]
+            ready.append((t, job.seq, job, True))
+            if device_queue:
+                waiting, issued = device_queue.popleft()
+                waiting.io_wait += t - issued
+                device = (waiting, t + waiting.bursts[waiting.phase])
+        while idx < len(jobs) and jobs[idx].arrival == t:
+            ready.append((t, jobs[idx].seq, jobs[idx], False))
+            idx += 1
+
+        # The run ends with its slice, or at any new event under a preemptive policy
+        if running is not None and (t == running[2] or (policy.preempt_on_arrival and len(ready) > events)):
+            job, start, _ = running
+            running = None
+            ran = t - start
+            if gantt and gantt[-1][2] == job.pid and gantt[-1][1] == start:
+                gantt[-1] = (gantt[-1][0], t, job.pid)
+            else:
+                gantt.append((start, t, job.pid))
+            job.remaining -= ran
+            policy.charge(job, ran, t)
+            if job.remaining:
+                hand(t)
+                policy.requeue(job, ran, t)
+            elif job.phase + 1 < len(job.bursts):
+                hand(t)
+                policy.block(job, t)
+                job.phase += 1
+                if device is None:
+                    device = (job, t + job.bursts[job.phase])
+                else:
+                    device_queue.append((job, t))
+            else:
+                turnaround = t - job.arrival
+                rows[job.seq] = [job.pid, job.arrival, job.cpu_total, job.priority, t, turnaround,
+                                 turnaround - job.cpu_total - job.io_total - job.io_wait,
+                                 job.first_run - job.arrival]
+                completed += 1
+                policy.complete(job, t)
+
+        if running is None:
+            hand(t)
+            if len(policy):
+                job = policy.pick(t)
+                if job.first_run is None:
+                    job.first_run = t
+                run = job.remaining
+                limit = policy.time_slice(job, t)
+                if limit is not None:
+                    run = min(run, max(1, limit))
+                running = (job, t, t + run)
+        t += 1
+    return rows, gantt
+
+
+def ticks_engine(case):
+    """Every algorithm re-derived one time unit at a time, without the event core or its policies
+
+    The independent reference for the schedulers whose modules are thin wrappers around
+    the event core (MLFQ, CFS, Stride, aging priority and burst prediction). Ready jobs
+    are a plain list, scanned for the best key at every decision; slices end when they
+    run out, at a completion or, for preemptive algorithms, at an arrival. As in
+    io_steps_engine, arrivals are handed to the scheduler at the next decision.
+    """
+    algorithm, quantum, options = case.algorithm, case.time_quantum, case.options or {}
+    if algorithm not in ALGORITHMS:
+        raise ValueError(f"Unknown scheduling algorithm: {algorithm}")
+    jobs = [{"pid": p["PID"], "arrival": p["Arrival"], "burst": p["Burst"], "priority": p.get("Priority", "-"),
+             "seq": i, "left": p["Burst"], "first": None, "level": 0, "used": 0, "vruntime": 0, "pass": 0,
+             "weight": process_weight(p.get("Priority", "-"))}
+            for i, p in enumerate(sorted(case.processes, key=lambda p: p["Arrival"]))]
+    rate = options.get("aging_rate") if algorithm in PRIORITY_ALGORITHMS else None
+    alpha = options.get("alpha") if algorithm in PREDICTED_ALGORITHMS else None
+    preemptive = algorithm in ("SRTF", "Priority(Preemptive)", "MLFQ")
+    quanta = [quantum * 2 ** level for level in range(options.get("levels", 3))]
+    boost_period = options.get("boost_period", 50)
+    next_boost = boost_period
+
+    # Exponentially averaged bursts: per process from its History, shared from completions
+    estimates, shared, predicted = {}, None, {}
+    if alpha is not None:
+        for p in case.processes:
+            for burst in p.get("History") or ():
+                previous = estimates.get(p["PID"])
+                estimates[p["PID"]] = burst if previous is None else alpha * burst + (1 - alpha) * previous
+
+    def key(job):
+        executed = job["burst"] - job["left"]
+        if algorithm == "CFS":
+            return job["vruntime"]
+        if algorithm == "Stride":
+            return job["pass"]
+        if alpha is not None:
+            return max(predicted[job["pid"]] - executed, 0) if algorithm == "SRTF" else predicted[job["pid"]]
+        if algorithm in PRIORITY_ALGORITHMS:
+            return job["priority"] + rate * (job["arrival"] + executed) if rate else job["priority"]
+        return job["left"] if algorithm == "SRTF" else job["burst"]
+
+    ready = []
+    queues = [[] for _ in quanta]  # MLFQ levels
+    min_vruntime = global_pass = 0
+    rows = [None] * len(jobs)
+    gantt = []
+    running = None  # (job, start, slice end or None)
+    idx = completed = 0
+    t = 0
+
+    def boost(now):
+        nonlocal next_boost
+        if boost_period and now >= next_boost:
+            for queue in queues[1:]:
+                for job in queue:
+                    job["level"], job["used"] = 0, 0
+                queues[0].extend(queue)
+                queue.clear()
+            next_boost = (now // boost_period + 1) * boost_period
+
+    def add(job):
+        if algorithm == "MLFQ":
+            queues[0].append(job)
+            return
+        if algorithm == "CFS":
+            job["vruntime"] = max(job["vruntime"], min_vruntime)
+        elif algorithm == "Stride":
+            job["pass"] = max(job["pass"], global_pass)
+        ready.append(job)
+
+    def requeue(job, now):
+        if algorithm != "MLFQ":
+            ready.append(job)
+        elif boost_period and now >= next_boost:
+            boost(now)
+            job["level"], job["used"] = 0, 0
+            queues[0].append(job)
+        elif job["used"] >= quanta[job["level"]]:
+            job["level"] = min(job["level"] + 1, len(quanta) - 1)
+            job["used"] = 0
+            queues[job["level"]].append(job)
+        else:
+            queues[job["level"]].insert(0, job)
+
+    def pick(now):
+        nonlocal min_vruntime, global_pass
+        if algorithm == "MLFQ":
+            boost(now)
+            queue = next(queue for queue in queues if queue)
+            return queue.pop(0)
+        if algorithm in ("FCFS", "Round Robin"):
+            return ready.pop(0)
+        job = min(ready, key=lambda job: (key(job), job["seq"]))
+        ready.remove(job)
+        if algorithm == "CFS":
+            min_vruntime = max(min_vruntime, job["vruntime"])
+        elif algorithm == "Stride":
+            global_pass = max(global_pass, job["pass"])
+        return job
+
+    def slice_length(job):
+        if algorithm in ("Round Robin", "Stride"):
+            return quantum
+        if algorithm == "MLFQ":
+            return quanta[job["level"]] - job["used"]
+        if algorithm == "CFS":
+            total = job["weight"] + sum(other["weight"] for other in ready)
+            share = options.get("target_latency", 6) * job["weight"] / total
+            return max(options.get("min_granularity", 1), int(round(share)))
+        return None
+
+    arrivals = []  # Arrived, not handed to the scheduler yet
+    while completed < len(jobs):
+        arrived = len(arrivals)
+        while idx < len(jobs) and jobs[idx]["arrival"] == t:
+            job = jobs[idx]
+            if alpha is not None:  # Predicted from the bursts completed before it arrived
+                estimate = estimates.get(job["pid"], shared)
+                predicted[job["pid"]] = estimate if estimate is not None else 1
+            arrivals.append(job)
+            idx += 1
+
+        if running is not None:
+            job, start, end = running
+            ran = t - start
+            stop = job["left"] == 0 or t == end or (preemptive and len(arrivals) > arrived) or (
+                rate and algorithm == "Priority(Preemptive)" and ready
+                and key(job) > min(key(other) for other in ready))
+            if stop:
+                running = None
+                if algorithm == "CFS":
+                    job["vruntime"] += ran * NICE_0_WEIGHT / job["weight"]
+                elif algorithm == "Stride":
+                    job["pass"] += STRIDE1 // job["weight"] * ran
+                job["used"] += ran
+                if job["left"] == 0:
+                    turnaround = t - job["arrival"]
+                    rows[job["seq"]] = [job["pid"], job["arrival"], job["burst"], job["priority"], t, turnaround,
+                                        turnaround - job["burst"], job["first"] - job["arrival"]]
+                    completed += 1
+                    if alpha is not None:
+                        estimates[job["pid"]] = job["burst"]
+                        shared = job["burst"] if shared is None else alpha * job["burst"] + (1 - alpha) * shared
+                else:
+                    for arrival in arrivals:  # Arrivals queue up ahead of the preempted job
+                        add(arrival)
+                    arrivals = []
+                    requeue(job, t)
+
+        if running is None:
+            for arrival in arrivals:
+                add(arrival)
+            arrivals = []
+        if running is None and (ready or any(queues)):
+            job = pick(t)
+            if job["first"] is None:
+                job["first"] = t
+            limit = slice_length(job)
+            running = (job, t, None if limit is None else t + max(1, limit))
+
+        if running is not None:
+            job = running[0]
+            job["left"] -= 1
+            if gantt and gantt[-1][2] == job["pid"] and gantt[-1][1] == t:
+                gantt[-1] = (gantt[-1][0], t + 1, job["pid"])
+            else:
+                gantt.append((t, t + 1, job["pid"]))
+        t += 1
+    return rows, gantt
+
+
+def smp_engine(case):
+    """The multiprocessor engine on a single core, which must match the event core"""
+    rows, gantts, _ = simulate_smp(case.processes, lambda: case_policy(case), cores=1)
+    return rows, gantts[0]
+
+
+# Engines that can be compared, by name; each maps a Case to (rows, gantt)
+ENGINES = {"reference": reference_engine, "event": event_engine, "ticks": ticks_engine, "io": io_engine,
+           "io-steps": io_steps_engine, "smp": smp_engine}
+
+# Engines compared by default: the scheduler modules, the tick-based reference and the event core
+DEFAULT_ENGINES = ("reference", "ticks", "event")
+
+# Engines compared on cases with I/O bursts (--io); the others ignore "Bursts"
+IO_ENGINES = ("io", "io-steps")
+
+
+def run_engine(engine, case):
+    """Normalized outcome of one engine: ({pid: compared values}, merged gantt) or ("error", name)"""
+    try:
+        rows, gantt = ENGINES[engine](case)
+    except Exception as e:  # Engines must fail the same way, too
+        return "error", type(e).__name__
+    index = [RESULT_COLUMNS.index(col) for col in COMPARED_COLUMNS]
+    per_process = {row[0]: tuple(row[i] for i in index) for row in rows}
+    return per_process, [tuple(segment) for segment in compress_gantt(gantt).tolist()]
+
+
+def diff_case(case, engines=DEFAULT_ENGINES):
+    """Differences between the first engine and every other one (empty list = all agree)"""
+    baseline_name, *others = engines
+    baseline = run_engine(baseline_name, case)
+    differences = []
+    for name in others:
+        outcome = run_engine(name, case)
+        if outcome == baseline:
+            continue
+        label = f"{baseline_name} vs {name}"
+        if "error" in (baseline[0], outcome[0]):
+            differences.append(f"{label}: {_describe(baseline)} / {_describe(outcome)}")
+            continue
+        (expected, expected_gantt), (actual, actual_gantt) = baseline, outcome
+        for pid in sorted(expected.keys() | actual.keys(), key=str):
+            if expected.get(pid) != actual.get(pid):
+                differences.append(f"{label}: P{pid} {_values(expected.get(pid))} != {_values(actual.get(pid))}")
+        for i, (a, b) in enumerate(zip(expected_gantt, actual_gantt)):
+            if a != b:
+                differences.append(f"{label}: gantt segment {i}: {a} != {b}")
+                break
+        else:
+            if len(expected_gantt) != len(actual_gantt):
+                differences.append(f"{label}: {len(expected_gantt)} != {len(actual_gantt)} gantt segments")
+    return differences
+
+
+def generate_case(seed, index, algorithms=ALGORITHMS, max_processes=12, io=False):
+    """Case `index` of the run seeded with `seed` (regenerated identically on replay)
+
+    With `io`, processes alternate CPU and I/O bursts ("Bursts"). Otherwise the
+    algorithm's options vary too (aging rate, prediction alpha with burst histories,
+    MLFQ levels and boosts, CFS latency); they are drawn from a separate stream, so
+    the workloads of a seed stay the same.
+    """
+    rng = np.random.default_rng([seed, index])
+    n = int(rng.integers(1, max_processes + 1))
+    if io:
+        processes = generate_io_workload(n, cpu_bursts=int(rng.integers(1, 4)), mean_cpu=float(rng.uniform(1, 6)),
+                                         mean_io=float(rng.uniform(1, 8)), load=float(rng.uniform(0.3, 1.5)),
+                                         priority_levels=int(rng.integers(1, 10)), seed=int(rng.integers(2 ** 32)))
+    else:
+        processes = random_workload(n, rng)
+    case = Case(str(rng.choice(algorithms)), int(rng.integers(1, 6)), processes)
+    return case if io else _vary_options(case, np.random.default_rng([seed, index, 1]))
+
+
+def _vary_options(case, rng):
+    """The case with randomly drawn options for its algorithm (None = the defaults)"""
+    def choice(values):
+        return values[int(rng.integers(len(values)))]
+
+    options = {}
+    processes = case.processes
+    if case.algorithm in PRIORITY_ALGORITHMS:
+        options["aging_rate"] = choice(AGING_RATES)
+    elif case.algorithm in PREDICTED_ALGORITHMS:
+        options["alpha"] = choice(ALPHAS)
+        if options["alpha"] is not None:
+            processes = [dict(p, History=rng.integers(1, 16, int(rng.integers(1, 4))).tolist())
+                         if rng.random() < 0.5 else p for p in processes]
+    elif case.algorithm == "MLFQ":
+        options.update(levels=choice(MLFQ_LEVELS), boost_period=choice(BOOST_PERIODS))
+    elif case.algorithm == "CFS":
+        options.update(target_latency=choice(TARGET_LATENCIES), min_granularity=choice(MIN_GRANULARITIES))
+    options = {key: value for key, value in options.items() if value is not None or key == "boost_period"}
+    return case._replace(processes=processes, options=options or None)
+
+
+def shrink(case, engines=DEFAULT_ENGINES):
+    """Smallest case found that still makes the engines disagree
+
+    Greedy delta debugging: drop chunks of processes (halving the chunk size down to
+    single processes), then lower the quantum, bursts, arrivals and priorities one
+    step at a time, keeping every change after which the case still fails.
+    """
+    def fails(candidate):
+        return bool(candidate.processes) and bool(diff_case(candidate, engines))
+
+    # Fall back to the default options when that keeps the failure
+    if case.options and fails(case._replace(options=None)):
+        case = case._replace(options=None)
+
+    # Remove processes
+    chunk = max(1, len(case.processes) // 2)
+    while True:
+        i = 0
+        while i < len(case.processes):
+            candidate = case._replace(processes=case.processes[:i] + case.processes[i + chunk:])
+            if fails(candidate):
+                case = candidate
+            else:
+                i += chunk
+        if chunk == 1:
+            break
+        chunk //= 2
+
+    # Simplify the remaining values
+    changed = True
+    while changed:
+        changed = False
+        for quantum in _smaller(case.time_quantum, 1):
+            if fails(case._replace(time_quantum=quantum)):
+                case, changed = case._replace(time_quantum=quantum), True
+                break
+        for i, process in enumerate(case.processes):
+            if process.get("Bursts"):
+                for j, burst in enumerate(process["Bursts"]):
+                    for value in _smaller(burst, 1):
+                        bursts = process["Bursts"][:j] + [value] + process["Bursts"][j + 1:]
+                        processes = case.processes[:i] + [dict(process, Bursts=bursts)] + case.processes[i + 1:]
+                        if fails(case._replace(processes=processes)):
+                            case, process, changed = case._replace(processes=processes), processes[i], True
+                            break
+            for col, low in (("Burst", 1), ("Arrival", 0), ("Priority", 1)):
+                if not isinstance(process.get(col), int):
+                    continue
+                for value in _smaller(process[col], low):
+                    processes = case.processes[:i] + [dict(process, **{col: value})] + case.processes[i + 1:]
+                    if fails(case._replace(processes=processes)):
+                        case, process, changed = case._replace(processes=processes), processes[i], True
+                        break
+
+    # Number the processes 1..n in arrival order when that keeps the failure
+    order = sorted(range(len(case.processes)), key=lambda i: case.processes[i]["Arrival"])
+    renumbered = [dict(case.processes[i], PID=pid) for pid, i in enumerate(order, 1)]
+    if fails(case._replace(processes=renumbered)):
+        case = case._replace(processes=renumbered)
+    return case
+
+
+def run_differential(cases=500, seed=0, algorithms=ALGORITHMS, max_processes=12, engines=DEFAULT_ENGINES,
+                     minimize=True, max_failures=5, progress=None, io=False):
+    """Diff `cases` random workloads across engines; returns a list of failure dicts
+
+    Each failure holds the case index (replayable with the same seed), the case,
+    its differences and, with `minimize`, the shrunk reproducer. With `io` the cases
+    have I/O bursts (compare IO_ENGINES).
+    """
+    failures = []
+    for index in range(cases):
+        case = generate_case(seed, index, algorithms, max_processes, io)
+        differences = diff_case(case, engines)
+        if differences:
+            logger.info("case %d (%s) differs: %s", index, case.algorithm, differences[0])
+            failure = {"index": index, "case": case, "differences": differences}
+            if minimize:
+                failure["shrunk"] = shrink(case, engines)
+                failure["shrunk_differences"] = diff_case(failure["shrunk"], engines)
+            failures.append(failure)
+            if len(failures) >= max_failures:
+                break
+        if progress:
+            progress(index + 1, cases)
+    return failures
+
+
+def throughput(processes=2000, algorithms=ALGORITHMS, rounds=3, seed=0, engines=("reference", "event"), check=True):
+    """Stress benchmark: best processes/second per (engine, algorithm) on large workloads
+
+    Every round uses a fresh workload; with `check` the engines' outcomes are diffed as
+    well and the mismatching (algorithm, round) pairs are returned with the rates.
+    """
+    rates = {}
+    mismatches = []
+    for round_ in range(rounds):
+        workload = generate_workload(processes, seed=seed + round_)
+        for algorithm in algorithms:
+            case = Case(algorithm, 2, workload)
+            outcomes = []
+            for engine in engines:
+                started = time.perf_counter()
+                outcomes.append(run_engine(engine, case))
+                rate = processes / max(time.perf_counter() - started, 1e-9)
+                rates[engine, algorithm] = max(rates.get((engine, algorithm), 0.0), rate)
+            if check and any(outcome != outcomes[0] for outcome in outcomes[1:]):
+                mismatches.append((algorithm, round_))
+    return rates, mismatches
+
+
+def save_case(case, path):
+    """Write a case as JSON, for replay with --replay"""
+    with open(path, "w") as f:
+        json.dump(case._asdict(), f, indent=1)
+
+
+def load_case(path):
+    with open(path) as f:
+        return Case(**json.load(f))
+
+
+def _smaller(value, low):
+    """Candidate replacements for an integer, smallest first"""
+    return sorted({v for v in (low, value // 2, value - 1) if low <= v < value})
+
+
+def _values(values):
+    return "missing" if values is None else dict(zip(COMPARED_COLUMNS, values))
+
+
+def _describe(outcome):
+    return f"raised {outcome[1]}" if outcome[0] == "error" else "ran"
+
+
+def _print_failure(failure):
+    case = failure.get("shrunk", failure["case"])
+    differences = failure.get("shrunk_differences", failure["differences"])
+    sizes = f"{len(failure['case'].processes)} -> " if "shrunk" in failure else ""
+    options = "".join(f", {key}={value}" for key, value in (case.options or {}).items())
+    print(f"case {failure['index']}: {case.algorithm} (quantum {case.time_quantum}{options}), "
+          f"{sizes}{len(case.processes)} processes")
+    for process in case.processes:
+        print(f"  {process}")
+    for difference in differences[:MAX_REPORTED]:
+        print(f"  {difference}")
+    if len(differences) > MAX_REPORTED:
+        print(f"  ... {len(differences) - MAX_REPORTED} more")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Differential testing of the scheduling engines")
+    parser.add_argument("--cases", type=int, default=500)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--case", type=int, help="replay only this case index of the seeded run")
+    parser.add_argument("--replay", metavar="CASE.json", help="replay a saved case")
+    parser.add_argument("--save", metavar="PREFIX", help="save shrunk failing cases as PREFIX<index>.json")
+    parser.add_argument("-a", "--algorithm", action="append", choices=ALGORITHMS, help="repeat to test several")
+    parser.add_argument("--max-processes", type=int, default=12)
+    parser.add_argument("--engines", nargs="+", choices=sorted(ENGINES),
+                        help="engines to compare (default: reference ticks event, io io-steps with --io, "
+                             "reference event with --throughput)")
+    parser.add_argument("--io", action="store_true", help="cases with CPU/IO burst sequences")
+    parser.add_argument("--no-shrink", action="store_true")
+    parser.add_argument("--throughput", action="store_true", help="stress benchmark on large workloads")
+    parser.add_argument("--processes", type=int, default=2000, help="workload size in throughput mode")
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+    algorithms = tuple(args.algorithm or ALGORITHMS)
+    engines = args.engines or list(IO_ENGINES if args.io else DEFAULT_ENGINES)
+
+    if args.throughput:
+        engines = args.engines or ["reference", "event"]  # The tick-based reference is too slow here
+        rates, mismatches = throughput(args.processes, algorithms, args.rounds, args.seed, engines)
+        print(f"{'algorithm':<26}" + "".join(f"{engine + ' proc/s':>18}" for engine in engines))
+        for algorithm in algorithms:
+            print(f"{algorithm:<26}" + "".join(f"{rates[engine, algorithm]:>18,.0f}" for engine in engines))
+        for algorithm, round_ in mismatches:
+            print(f"FAIL: engines differ on {algorithm} (round {round_}, seed {args.seed + round_})")
+        sys.exit(1 if mismatches else 0)
+
+    if args.replay or args.case is not None:
+        case = load_case(args.replay) if args.replay else generate_case(args.seed, args.case, algorithms,
+                                                                        args.max_processes, args.io)
+        differences = diff_case(case, engines)
+        _print_failure({"index": args.case if args.replay is None else args.replay, "case": case,
+                        "differences": differences})
+        print("FAIL" if differences else "OK: engines agree")
+        sys.exit(1 if differences else 0)
+
+    started = time.perf_counter()
+    failures = run_differential(args.cases, args.seed, algorithms, args.max_processes, engines,
+                                minimize=not args.no_shrink, io=args.io)
+    for failure in failures:
+        _print_failure(failure)
+        if args.save:
+            save_case(failure.get("shrunk", failure["case"]), f"{args.save}{failure['index']}.json")
+    elapsed = time.perf_counter() - started
+    print(f"{'FAIL' if failures else 'OK'}: {len(failures)} failing case(s) "
+          f"({args.cases} cases, seed {args.seed}, {elapsed:.1f} s)")
+    sys.exit(1 if failures else 0)
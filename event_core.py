@@ -0,0 +1,196 @@
+RESULT_COLUMNS = ["PID", "Arrival", "Burst", "Priority", "Completion", "Turnaround", "Waiting", "Response"]
+
+# Scheduling decisions between two calls of a simulate() bound callback
+BOUND_CHECK_INTERVAL = 64
+
+
+class SimulationPruned(Exception):
+    """Raised by simulate() when the `bound` callback rejects a partially simulated run"""
+
+    def __init__(self, lower_bounds):
+        super().__init__("simulation pruned")
+        self.lower_bounds = lower_bounds
+
+
+class Job:
+    """Runtime state of one process inside the event-driven core"""
+    __slots__ = ("pid", "arrival", "burst", "priority", "seq", "deadline", "remaining", "first_run", "key", "level",
+                 "used")
+
+    def __init__(self, pid, arrival, burst, priority, seq, deadline=None):
+        self.pid = pid
+        self.arrival = arrival
+        self.burst = burst
+        self.priority = priority
+        self.seq = seq  # Position in arrival order, used to break ties like the list-based schedulers
+        self.deadline = deadline  # Absolute deadline (real-time policies), None if the process has none
+        self.remaining = burst
+        self.first_run = None
+        self.key = 0  # Policy-specific ordering value (vruntime, pass, ...)
+        self.level = 0  # Policy-specific queue level (MLFQ)
+        self.used = 0  # Time used in the current level / slice
+
+
+class Policy:
+    """Base class for ready-queue policies plugged into simulate()"""
+
+    # Re-evaluate the running job whenever a new job arrives
+    preempt_on_arrival = False
+
+    def add(self, job, now):
+        """A job has arrived and is ready to run"""
+        raise NotImplementedError
+
+    def pick(self, now):
+        """Remove and return the next job to run"""
+        raise NotImplementedError
+
+    def time_slice(self, job, now):
+        """Maximum run length before the policy wants to decide again (None = until completion)"""
+        return None
+
+    def requeue(self, job, ran, now):
+        """Put back a job that ran for `ran` time units and still has work left"""
+        self.add(job, now)
+
+    def putback(self, job, now):
+        """Return a job just taken by pick() to the head of the queue, as if it had not been picked"""
+        self.requeue(job, 0, now)
+
+    def charge(self, job, ran, now):
+        """Account for `ran` time units of CPU used by `job` (called before requeue/complete)"""
+
+    def complete(self, job, now):
+        """A job has finished all of its work"""
+
+    def block(self, job, now):
+        """A job left the CPU to wait for I/O; it comes back later through add()"""
+        self.complete(job, now)
+
+    def __len__(self):
+        raise NotImplementedError
+
+
+def simulate(processes, policy, progress=None, switch_cost=0, bound=None, cost_bound=None, cost_metric="avg_waiting"):
+    """Event-driven simulation of `processes` under `policy`; returns (rows, gantt_chart)
+
+    Time jumps from one scheduling decision to the next (slice expiry, completion or
+    arrival) instead of advancing one tick at a time.
+
+    `switch_cost` time units of CPU overhead are spent every time the CPU moves to a
+    different process. `bound`, when given, is called periodically with lower bounds
+    on the final averages (see lower_bounds below); returning True aborts the run with
+    SimulationPruned. `cost_bound` is the common case: the run is aborted as soon as its
+    lower bound on `cost_metric` exceeds the bound, i.e. it can no longer match it.
+    """
+    jobs = [Job(p["PID"], p["Arrival"], p["Burst"], p.get("Priority", "-"), i, p.get("Deadline"))
+            for i, p in enumerate(sorted(processes, key=lambda p: p["Arrival"]))]
+    n = len(jobs)
+    rows = [None] * n
+    gantt_chart = []
+    total_burst = sum(job.burst for job in jobs)
+
+    now = 0
+    idx = 0  # Next job to arrive
+    completed = 0
+    decisions = 0
+    last_pid = None
+    switches = 0
+    # Waiting and response time accumulated so far; both only grow, so they bound the final totals
+    waited = 0
+    responded = 0
+    unstarted = 0  # Ready jobs that have never run
+
+    def admit(now):
+        nonlocal idx, waited, responded, unstarted
+        while idx < n and jobs[idx].arrival <= now:
+            job = jobs[idx]
+            policy.add(job, now)
+            waited += now - job.arrival
+            responded += now - job.arrival
+            unstarted += 1
+            idx += 1
+
+    if cost_bound is not None:
+        extra_bound = bound
+        bound = lambda lb: lb[cost_metric] > cost_bound or bool(extra_bound and extra_bound(lb))
+
+    def lower_bounds():
+        return {
+            "avg_waiting": waited / n,
+            "avg_response": responded / n,
+            "avg_turnaround": (waited + total_burst) / n,
+            "context_switches": switches,
+        }
+
+    while completed < n:
+        admit(now)  # Admit everything that has arrived by now
+
+        if not len(policy):
+            now = jobs[idx].arrival  # CPU idle: jump to the next arrival
+            continue
+
+        job = policy.pick(now)
+        decisions += 1
+        if last_pid is not None and last_pid != job.pid:
+            switches += 1
+            if switch_cost:
+                # The picked job and everything still queued wait out the switch
+                waited += switch_cost * (len(policy) + 1)
+                responded += switch_cost * unstarted
+                now += switch_cost
+                admit(now)
+        last_pid = job.pid
+        if job.first_run is None:
+            job.first_run = now
+            unstarted -= 1
+
+        run = job.remaining
+        limit = policy.time_slice(job, now)
+        if limit is not None:
+            run = min(run, max(1, limit))
+        if policy.preempt_on_arrival and idx < n and jobs[idx].arrival < now + run:
+            run = jobs[idx].arrival - now
+
+        # Record the run, merging with the previous segment when the same job continues
+        if gantt_chart and gantt_chart[-1][2] == job.pid and gantt_chart[-1][1] == now:
+            gantt_chart[-1] = (gantt_chart[-1][0], now + run, job.pid)
+        else:
+            gantt_chart.append((now, now + run, job.pid))
+
+        now += run
+        job.remaining -= run
+        waited += run * len(policy)
+        responded += run * unstarted
+        policy.charge(job, run, now)
+
+        if job.remaining == 0:
+            turnaround = now - job.arrival
+            rows[job.seq] = [job.pid, job.arrival, job.burst, job.priority, now,
+                             turnaround, turnaround - job.burst, job.first_run - job.arrival]
+            completed += 1
+            policy.complete(job, now)
+            if progress:
+                progress(completed, n)  # Report completed processes
+        else:
+            admit(now)  # Jobs arriving during the slice queue up ahead of the preempted job
+            policy.requeue(job, run, now)
+
+        if bound and decisions % BOUND_CHECK_INTERVAL == 0 and completed < n and bound(lower_bounds()):
+            raise SimulationPruned(lower_bounds())
+
+    return rows, gantt_chart
+
+
+def rows_to_columns(rows):
+    """Turn simulate() rows into a {column: list} mapping usable by metrics.compute_metrics"""
+    return {col: list(values) for col, values in zip(RESULT_COLUMNS, zip(*rows))} if rows else \
+        {col: [] for col in RESULT_COLUMNS}
+
+
+def process_weight(priority):
+    """CFS-style load weight: priority is read as a nice value (smaller = more CPU)"""
+    if priority == "-" or priority is None:
+        return 1024
+    nice = max(-20, min(19, int(priority)))
+    return max(1, int(round(1024 / (1.25 ** nice))))
@@ -1,6 +1,6 @@
-import pandas as pd
+from result_table import ResultTable
 
-def fcfs_scheduling(processes):
+def fcfs_scheduling(processes, progress=None):
     processes.sort(key=lambda x: x['Arrival'])  # Sort by Arrival Time
     completion_time = 0
     result = []
@@ -22,6 +22,9 @@ def fcfs_scheduling(processes):
 
         result.append([pid, arrival, burst, priority, start_time, completion_time, turnaround_time, waiting_time, response_time])
 
-    # Create DataFrame
-    df = pd.DataFrame(result, columns=["PID", "Arrival", "Burst", "Priority", "Start", "Completion", "Turnaround", "Waiting", "Response"])
-    return df
\ No newline at end of file
+        if progress:
+            progress(len(result), len(processes))  # Report completed processes
+
+    # Create the result table
+    table = ResultTable.from_rows(result, ["PID", "Arrival", "Burst", "Priority", "Start", "Completion", "Turnaround", "Waiting", "Response"])
+    return table
\ No newline at end of file
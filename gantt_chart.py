@@ -1,113 +1,117 @@
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-import pandas as pd
+import numpy as np
+from matplotlib.collections import PolyCollection, LineCollection
+from matplotlib.patches import Rectangle
+from chart_canvas import ChartCanvas
+from sim_logging import get_logger, Preview
 
-def plot_gantt_chart(df, frame, is_preemptive=False):  # Flag for preemptive algorithms
-    print("Gantt Chart Data:", df)  # Debugging Line
+logger = get_logger(__name__)
 
-    # Close any existing figures to prevent memory leak
-    plt.close('all')
+# Define a large list of unique colors for processes
+COLORS = [
+    '#FFD700', '#FFA07A', '#98FB98', '#87CEFA', '#DDA0DD', '#FF6347', '#4682B4', '#3CB371', '#DAA520',
+    '#FF4500', '#8A2BE2', '#A52A2A', '#5F9EA0', '#D2691E', '#FF1493', '#1E90FF', '#32CD32', '#B22222',
+    '#7FFF00'
+]
+IDLE_COLOR = "#D3D3D3"  # Light gray for IDLE time
+BAR_HEIGHT = 0.4
 
-    # Handle empty Gantt chart scenario
-    if df.empty:
-        print("No data to plot in Gantt Chart!")
-        return
+# Past these counts bar labels, x-ticks and legend entries would only overlap, so they are thinned out
+MAX_LABELS = 300
+MAX_TICKS = 60
+MAX_LEGEND = 20
 
-    # Determine total execution time dynamically
-    total_time = max(df['Completion']) + 1  # Fix potential error with empty DataFrame
-
-    # Adjust figure size to fit all processes
-    fig, ax = plt.subplots(figsize=(max(10, total_time / 2), 1.5))  # Ensure minimum size
-
-    # Define a large list of unique colors for processes
-    colors = [
-        '#FFD700', '#FFA07A', '#98FB98', '#87CEFA', '#DDA0DD', '#FF6347', '#4682B4', '#3CB371', '#DAA520',
-        '#FF4500', '#8A2BE2', '#A52A2A', '#5F9EA0', '#D2691E', '#FF1493', '#1E90FF', '#32CD32', '#B22222',
-        '#7FFF00'
-    ]
-    idle_color = "#D3D3D3"  # Light gray for IDLE time
-    completion_times = [0]  # Start x-axis at 0
-    legend_labels = {}
-
-    prev_time = 0  # Track previous process execution time
-    process_colors = {}  # Dictionary to store process colors
-    last_end_time = 0  # Track the last process's end time
-
-    # Iterate over the Gantt data to plot each process
-    for i, row in enumerate(df.itertuples()):
-        pid = f"P{row.PID}"  # Create label for PID, e.g., "P1"
-        start_time = row.Start  
-        end_time = row.Completion  
-
-        # Assign a unique color to each process (only once)
-        if pid not in process_colors:
-            process_colors[pid] = colors[i % len(colors)]  # Assign a color from the list (cyclic)
-
-        color = process_colors[pid]  # Color of the current process
-
-        # If there's an idle gap, insert an "IDLE" bar
-        if start_time > prev_time:
-            idle_start = prev_time
-            idle_end = start_time
-            ax.barh(y=0, width=idle_end - idle_start, left=idle_start, color=idle_color, edgecolor="black", height=0.4)
-            ax.text(idle_start + (idle_end - idle_start) / 2, 0, "IDLE", ha='center', va='center', fontsize=9, fontweight="bold")
-            
-            # Ensure idle times are recorded in x-ticks
-            completion_times.append(idle_end)  
-
-        # Draw process execution bar
-        ax.barh(y=0, width=end_time - start_time, left=start_time, color=color, edgecolor="black", height=0.4)
-        ax.text(start_time + (end_time - start_time) / 2, 0, pid, ha='center', va='center', fontsize=9, fontweight="bold")
-
-        # Store x-axis ticks correctly
-        if is_preemptive:  
-            completion_times.append(start_time)  # Show time at **start** of execution (context switch)
-        completion_times.append(end_time)  # Ensure end time is recorded
-
-        # Add dotted line if not preemptive
-        if not is_preemptive:
-            ax.axvline(x=end_time, color='black', linestyle='dotted', linewidth=1)
-
-        # Store legend entry if not already added
-        if pid not in legend_labels:
-            legend_labels[pid] = color
-
-        prev_time = end_time  
-        last_end_time = max(last_end_time, end_time)  
-
-    # Formatting
-    ax.set_yticks([])  # Hide y-axis ticks (only time is relevant)
-    ax.set_xlabel("Time")
-    ax.set_title("Gantt Chart")
-
-    # Ensure idle end times are included in x-axis
-    ax.set_xticks(sorted(set(completion_times)))
-    ax.set_xticklabels(sorted(set(completion_times)))
 
-    # Fix: Ensure last completion time is visible but without unnecessary space
-    ax.set_xlim(left=0, right=last_end_time)  
+def plot_gantt_chart(df, frame, is_preemptive=False):  # Flag for preemptive algorithms
+    """Draw (Start, Completion, PID) segments into the frame's persistent Gantt figure"""
+    logger.debug("Gantt Chart Data:\n%s", Preview(df))
 
-    # Remove grid lines
-    ax.grid(False)
+    chart = ChartCanvas.of(frame, figsize=(10, 1.5), padx=10, pady=10)
+    ax = _gantt_axes(chart)
 
-    # Add Legend
-    legend_patches = [plt.Rectangle((0, 0), 1, 1, color=color) for color in legend_labels.values()]
-    legend_patches.append(plt.Rectangle((0, 0), 1, 1, color=idle_color))  # Add IDLE color to legend
-    legend_labels["IDLE"] = idle_color  # Add IDLE to legend
+    # Handle empty Gantt chart scenario
+    if df is None or not len(df):
+        logger.info("No data to plot in Gantt Chart!")
+        ax.set_visible(False)
+        chart.draw()
+        return
+    ax.set_visible(True)
+
+    segments = df[["Start", "Completion", "PID"]].to_numpy() if hasattr(df, "to_numpy") else np.asarray(df)
+    starts, ends, pids = segments[:, 0], segments[:, 1], segments[:, 2]
+
+    # An "IDLE" bar fills every gap after the previous segment
+    previous = np.concatenate(([0], ends[:-1]))
+    idle = starts > previous
+
+    # Each process keeps the color picked at its first segment (cyclic through COLORS)
+    unique_pids, first_index, inverse = np.unique(pids, return_index=True, return_inverse=True)
+    process_colors = np.array(COLORS)[first_index % len(COLORS)]
+
+    bar_left = np.concatenate((previous[idle], starts))
+    bar_right = np.concatenate((starts[idle], ends))
+    colors = np.concatenate((np.full(int(idle.sum()), IDLE_COLOR), process_colors[inverse]))
+    chart.artists["bars"].set_verts(_bar_verts(bar_left, bar_right))
+    chart.artists["bars"].set_facecolor(colors)
+
+    # Dotted line at every completion if not preemptive
+    chart.artists["completions"].set_segments([] if is_preemptive else [[(end, 0), (end, 1)] for end in ends.tolist()])
+
+    # Bar labels (skipped when there are too many bars to read them)
+    for text in chart.artists["labels"]:
+        text.remove()
+    chart.artists["labels"] = []
+    if len(bar_left) <= MAX_LABELS:
+        names = ["IDLE"] * int(idle.sum()) + [f"P{pid}" for pid in pids.tolist()]
+        for left, right, name in zip(bar_left.tolist(), bar_right.tolist(), names):
+            chart.artists["labels"].append(ax.text(left + (right - left) / 2, 0, name, ha='center', va='center',
+                                                   fontsize=9, fontweight="bold"))
+
+    # X-ticks at completions, idle ends and (preemptive) context switches
+    ticks = [np.zeros(1, dtype=ends.dtype), starts[idle], ends] + ([starts] if is_preemptive else [])
+    ticks = np.unique(np.concatenate(ticks))
+    if len(ticks) > MAX_TICKS:
+        ticks = ticks[np.unique(np.linspace(0, len(ticks) - 1, MAX_TICKS).astype(int))]
+    ticks = ticks.tolist()
+    ax.set_xticks(ticks, labels=[str(tick) for tick in ticks])
 
-    legend = ax.legend(legend_patches, legend_labels.keys(), loc="upper left", fontsize=9, frameon=True, bbox_to_anchor=(1, 1))
+    # Fix: Ensure last completion time is visible but without unnecessary space
+    ax.set_xlim(left=0, right=float(ends.max()))
+
+    # Legend: processes in order of first appearance, then IDLE
+    order = np.argsort(first_index, kind="stable")[:MAX_LEGEND]
+    handles = [Rectangle((0, 0), 1, 1, color=color) for color in process_colors[order].tolist()]
+    labels = [f"P{pid}" for pid in unique_pids[order].tolist()]
+    if len(unique_pids) > MAX_LEGEND:
+        labels[-1] = f"... ({len(unique_pids)} processes)"
+    handles.append(Rectangle((0, 0), 1, 1, color=IDLE_COLOR))
+    labels.append("IDLE")
+    legend = ax.legend(handles, labels, loc="upper left", fontsize=9, frameon=True, bbox_to_anchor=(1, 1))
     legend.get_frame().set_alpha(0.8)  # Make legend background slightly transparent
 
-    # Clear Previous Chart and Display New One
-    for widget in frame.winfo_children():
-        widget.destroy()
-    canvas = FigureCanvasTkAgg(fig, master=frame)
-    canvas.draw()
-    canvas.get_tk_widget().pack(fill="both", expand=True, padx=10, pady=10)  
-
-    # Make sure to close this figure if the canvas is destroyed
-    def on_destroy(event):
-        plt.close(fig)
-    
-    canvas.get_tk_widget().bind("<Destroy>", on_destroy)
-    
\ No newline at end of file
+    chart.draw()
+
+
+def _gantt_axes(chart):
+    """Axes and persistent artists, created the first time the frame shows a Gantt chart"""
+    if "bars" not in chart.artists:
+        ax = chart.figure.add_subplot()
+        chart.artists["bars"] = ax.add_collection(PolyCollection([], edgecolor="black"))
+        chart.artists["completions"] = ax.add_collection(LineCollection(
+            [], colors="black", linestyles="dotted", linewidths=1, transform=ax.get_xaxis_transform()))
+        chart.artists["labels"] = []
+        ax.set_ylim(-0.5, 0.5)
+        ax.set_yticks([])  # Hide y-axis ticks (only time is relevant)
+        ax.set_xlabel("Time")
+        ax.set_title("Gantt Chart")
+        ax.grid(False)
+    return chart.figure.axes[0]
+
+
+def _bar_verts(left, right):
+    """(n, 4, 2) rectangle corners for bars centred on y = 0"""
+    verts = np.empty((len(left), 4, 2))
+    verts[:, [0, 1], 0] = left[:, None]
+    verts[:, [2, 3], 0] = right[:, None]
+    verts[:, [0, 3], 1] = -BAR_HEIGHT / 2
+    verts[:, [1, 2], 1] = BAR_HEIGHT / 2
+    return verts
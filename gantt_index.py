@@ -0,0 +1,121 @@
+import numpy as np
+from result_store import GANTT_COLUMNS
+
+
+def compress_gantt(gantt):
+    """(n, 3) segment array in time order, empty runs dropped and back-to-back runs of one PID merged
+
+    Round Robin, for example, records one segment per quantum even when the same
+    process keeps the CPU; after compression every segment is one contiguous run.
+    """
+    segments = _as_segments(gantt)
+    segments = segments[np.argsort(segments[:, 0], kind="stable")]
+    segments = segments[segments[:, 1] > segments[:, 0]]
+    if len(segments) < 2:
+        return segments
+
+    # A segment continues the previous one when the same PID resumes exactly where it stopped
+    continues = (segments[1:, 2] == segments[:-1, 2]) & (segments[1:, 0] == segments[:-1, 1])
+    firsts = np.flatnonzero(np.concatenate(([True], ~continues)))
+    lasts = np.concatenate((firsts[1:], [len(segments)])) - 1
+    merged = segments[firsts]
+    merged[:, 1] = segments[lasts, 1]
+    return merged
+
+
+class GanttIndex:
+    """Interval index over a compressed Gantt chart
+
+    Segments are stored as sorted Start / Completion / PID arrays plus a PID-sorted
+    permutation, so "who ran at time t" and "all slices of PID p" are binary searches
+    (O(log n), plus the k slices returned).
+    """
+
+    def __init__(self, gantt):
+        segments = compress_gantt(gantt)
+        self.starts = np.ascontiguousarray(segments[:, 0])
+        self.ends = np.ascontiguousarray(segments[:, 1])
+        self.pids = np.ascontiguousarray(segments[:, 2])
+        # Segment numbers grouped by PID; the stable sort keeps each group in time order
+        self._by_pid = np.argsort(self.pids, kind="stable")
+        self._sorted_pids = self.pids[self._by_pid]
+
+    def __len__(self):
+        return len(self.starts)
+
+    @property
+    def segments(self):
+        return np.column_stack((self.starts, self.ends, self.pids))
+
+    def index_at(self, t):
+        """Number of the segment running at time t, or -1 when the CPU is idle"""
+        i = int(np.searchsorted(self.starts, t, side="right")) - 1
+        return i if i >= 0 and t < self.ends[i] else -1
+
+    def running_at(self, t):
+        """PID on the CPU at time t (None when idle)"""
+        i = self.index_at(t)
+        return None if i < 0 else self.pids[i].item()
+
+    def slices_of(self, pid):
+        """(k, 2) Start, Completion array of every run of `pid`, in time order"""
+        low = np.searchsorted(self._sorted_pids, pid, side="left")
+        high = np.searchsorted(self._sorted_pids, pid, side="right")
+        runs = self._by_pid[low:high]
+        return np.column_stack((self.starts[runs], self.ends[runs]))
+
+    def between(self, start, end):
+        """Segments overlapping [start, end), unclipped"""
+        # Runs never overlap, so the completions are sorted as well
+        low = np.searchsorted(self.ends, start, side="right")
+        high = np.searchsorted(self.starts, end, side="left")
+        return self.segments[low:high]
+
+    def busy_time(self, pid=None):
+        """CPU time of `pid` (all processes by default)"""
+        if pid is None:
+            return (self.ends - self.starts).sum().item()
+        runs = self.slices_of(pid)
+        return (runs[:, 1] - runs[:, 0]).sum().item()
+
+    def to_list(self):
+        return list(zip(self.starts.tolist(), self.ends.tolist(), self.pids.tolist()))
+
+    def to_dataframe(self):
+        import pandas as pd
+        return pd.DataFrame(self.segments, columns=list(GANTT_COLUMNS))
+
+    def encode(self):
+        """Run-length encoding: idle gap and run length per segment, PIDs as codes into a table
+
+        Every array uses the smallest unsigned type that holds it, which for typical
+        traces is 1-2 bytes per value instead of 24 bytes per (Start, Completion, PID).
+        """
+        previous = np.concatenate((np.zeros(1, dtype=self.ends.dtype), self.ends[:-1]))
+        table, codes = np.unique(self.pids, return_inverse=True)
+        return {"pids": table, "codes": _compact(codes), "gaps": _compact(self.starts - previous),
+                "lengths": _compact(self.ends - self.starts)}
+
+    @classmethod
+    def decode(cls, encoded):
+        lengths = encoded["lengths"].astype(np.int64)
+        ends = np.cumsum(encoded["gaps"].astype(np.int64) + lengths)
+        return cls(np.column_stack((ends - lengths, ends, encoded["pids"][encoded["codes"]])))
+
+
+def _as_segments(gantt):
+    """(n, 3) array from a Gantt DataFrame, array or list of (Start, Completion, PID)"""
+    if gantt is None or not len(gantt):
+        return np.empty((0, 3), dtype=np.int64)
+    if hasattr(gantt, "to_numpy"):
+        return gantt[list(GANTT_COLUMNS)].to_numpy()
+    return np.array([tuple(segment)[:3] for segment in gantt]) if not isinstance(gantt, np.ndarray) else gantt.copy()
+
+
+def _compact(values):
+    """Values in the smallest unsigned integer type that holds them"""
+    top = int(values.max()) if len(values) else 0
+    for dtype in (np.uint8, np.uint16, np.uint32):
+        if top <= np.iinfo(dtype).max:
+            return values.astype(dtype)
+    return values.astype(np.uint64)
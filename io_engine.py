@@ -0,0 +1,172 @@
+import heapq
+from collections import deque
+from event_core import Job, RESULT_COLUMNS
+from metrics import compute_metrics
+
+# simulate_io() rows: the usual result columns (Burst = total CPU time) plus the total
+# I/O service time and the time spent queued for a free device
+IO_RESULT_COLUMNS = RESULT_COLUMNS + ["IO", "IOWait"]
+
+
+class IOJob(Job):
+    """A job whose work alternates CPU and I/O bursts: bursts[0], bursts[2], ... run on the CPU"""
+    __slots__ = ("bursts", "phase", "cpu_total", "io_total", "io_wait")
+
+    def __init__(self, pid, arrival, bursts, priority, seq, deadline=None):
+        super().__init__(pid, arrival, bursts[0], priority, seq, deadline)  # `burst` is the current CPU burst
+        self.bursts = bursts
+        self.phase = 0  # Index of the current burst
+        self.cpu_total = sum(bursts[0::2])
+        self.io_total = sum(bursts[1::2])
+        self.io_wait = 0
+
+
+def burst_sequence(process):
+    """CPU, I/O, CPU, ... durations of a process ("Bursts", or just its single "Burst")"""
+    bursts = process.get("Bursts")
+    if not bursts:
+        return (process["Burst"],)
+    if len(bursts) % 2 == 0:
+        raise ValueError(f"P{process['PID']}: a burst sequence must start and end with a CPU burst")
+    return tuple(bursts)
+
+
+def simulate_io(processes, policy, devices=1, switch_cost=0, progress=None):
+    """Event-driven simulation of processes that block for I/O; returns (rows, gantt_chart, usage)
+
+    Processes may carry "Bursts": alternating CPU and I/O durations. When a CPU burst
+    ends the job leaves the ready queue (policy.block) and issues its I/O to one of
+    `devices` identical devices, queueing FIFO when all are busy; when the I/O completes
+    it is added back to the policy like a new arrival. Works with every policy, and
+    processes without "Bursts" behave exactly as in event_core.simulate.
+
+    Rows follow IO_RESULT_COLUMNS. Waiting is time spent in the ready queue only, so
+    Turnaround = Burst + Waiting + IO + IOWait. `usage` holds the CPU and device busy
+    time and the device count (see io_metrics).
+    """
+    jobs = [IOJob(p["PID"], p["Arrival"], burst_sequence(p), p.get("Priority", "-"), i, p.get("Deadline"))
+            for i, p in enumerate(sorted(processes, key=lambda p: p["Arrival"]))]
+    n = len(jobs)
+    rows = [None] * n
+    gantt_chart = []
+
+    in_service = []  # Heap of (completion time, seq, job) for I/O being served
+    device_queue = deque()  # (job, time issued) waiting for a free device
+    free = devices
+    cpu_busy = 0
+    device_busy = 0
+
+    now = 0
+    idx = 0  # Next job to arrive
+    completed = 0
+    last_pid = None
+
+    def start_io(job, now):
+        nonlocal free, device_busy
+        free -= 1
+        duration = job.bursts[job.phase]
+        device_busy += duration
+        heapq.heappush(in_service, (now + duration, job.seq, job))
+
+    def admit(now):
+        nonlocal idx, free
+        # Arrivals and finished I/O merged in time order (ties by arrival order, like simultaneous
+        # arrivals in event_core); each finished I/O frees its device for the next request
+        while True:
+            arriving = idx < n and jobs[idx].arrival <= now
+            returning = bool(in_service) and in_service[0][0] <= now
+            if arriving and (not returning or (jobs[idx].arrival, jobs[idx].seq) < in_service[0][:2]):
+                policy.add(jobs[idx], now)
+                idx += 1
+            elif returning:
+                done, _, job = heapq.heappop(in_service)
+                free += 1
+                if device_queue:
+                    waiting, issued = device_queue.popleft()
+                    waiting.io_wait += done - issued
+                    start_io(waiting, done)
+                job.phase += 1
+                job.burst = job.remaining = job.bursts[job.phase]
+                policy.add(job, done)
+            else:
+                break
+
+    def next_event():
+        # Earliest arrival or I/O completion; one exists whenever work is left and nothing is ready
+        arrival = jobs[idx].arrival if idx < n else None
+        io_done = in_service[0][0] if in_service else None
+        if arrival is None or (io_done is not None and io_done < arrival):
+            return io_done
+        return arrival
+
+    while completed < n:
+        admit(now)
+
+        if not len(policy):
+            now = next_event()  # CPU idle: jump to the next arrival or I/O completion
+            continue
+
+        job = policy.pick(now)
+        if last_pid is not None and last_pid != job.pid and switch_cost:
+            now += switch_cost
+            admit(now)
+        last_pid = job.pid
+        if job.first_run is None:
+            job.first_run = now
+
+        run = job.remaining
+        limit = policy.time_slice(job, now)
+        if limit is not None:
+            run = min(run, max(1, limit))
+        if policy.preempt_on_arrival:
+            event = next_event()
+            if event is not None and event < now + run:
+                run = event - now
+
+        if gantt_chart and gantt_chart[-1][2] == job.pid and gantt_chart[-1][1] == now:
+            gantt_chart[-1] = (gantt_chart[-1][0], now + run, job.pid)
+        else:
+            gantt_chart.append((now, now + run, job.pid))
+
+        now += run
+        cpu_busy += run
+        job.remaining -= run
+        policy.charge(job, run, now)
+
+        if job.remaining:
+            admit(now)  # Jobs arriving during the slice queue up ahead of the preempted job
+            policy.requeue(job, run, now)
+        elif job.phase + 1 < len(job.bursts):
+            # CPU burst done: block for the next I/O burst (devices freed by now are released first)
+            admit(now)
+            policy.block(job, now)
+            job.phase += 1
+            if free:
+                start_io(job, now)
+            else:
+                device_queue.append((job, now))
+        else:
+            turnaround = now - job.arrival
+            rows[job.seq] = [job.pid, job.arrival, job.cpu_total, job.priority, now, turnaround,
+                             turnaround - job.cpu_total - job.io_total - job.io_wait,
+                             job.first_run - job.arrival, job.io_total, job.io_wait]
+            completed += 1
+            policy.complete(job, now)
+            if progress:
+                progress(completed, n)
+
+    return rows, gantt_chart, {"cpu_busy": cpu_busy, "device_busy": device_busy, "devices": devices}
+
+
+def io_metrics(rows, gantt, usage):
+    """compute_metrics() for simulate_io() output, plus device utilization and I/O wait"""
+    columns = {col: list(values) for col, values in zip(IO_RESULT_COLUMNS, zip(*rows))} if rows else \
+        {col: [] for col in IO_RESULT_COLUMNS}
+    metrics = compute_metrics(columns, gantt)
+    if rows:
+        span = max(columns["Completion"]) - min(columns["Arrival"])
+        metrics["device_utilization"] = usage["device_busy"] / (usage["devices"] * span) if span else 0.0
+        metrics["avg_io_wait"] = sum(columns["IOWait"]) / len(rows)
+    else:
+        metrics["device_utilization"] = metrics["avg_io_wait"] = 0.0
+    return metrics
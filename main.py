@@ -1,18 +1,44 @@
+import argparse
+import logging
+import sys
 import tkinter as tk
-import pandas as pd
-from tkinter import ttk
-from fcfs import fcfs_scheduling
-from sjf import sjf_scheduling
-from srtf import srtf_scheduling
-from round_robin import round_robin_scheduling
-from non_preemptive_priority import priority_scheduling
-from preemptive_priority import preemptive_priority_scheduling
-from gantt_chart import plot_gantt_chart
+from tkinter import ttk, filedialog
+from algorithms import (simulate, ALGORITHMS, PRIORITY_ALGORITHMS, PREEMPTIVE_ALGORITHMS,
+                        QUANTUM_ALGORITHMS, WEIGHTED_ALGORITHMS, PREDICTED_ALGORITHMS, REALTIME_ALGORITHMS)
+from simulation_worker import SimulationWorker
 from process_manager import ProcessManager
-from stats_chart import plot_stats_chart  
+from virtual_table import VirtualTable
+from sim_logging import get_logger, log_event, Preview, LOG_LEVELS, add_logging_arguments, configure_from_args, set_level, get_level
 import copy
-from scheduler_animation import SchedulerAnimationWindow
-from optimizer import AlgorithmOptimizerWindow
+
+# Charts, the optimizer, the animation and file formats pull in pandas / matplotlib,
+# so they are imported on first use to keep the main window's startup fast
+
+
+logger = get_logger(__name__)
+
+RESULT_COLUMNS = ("PID", "Arrival", "Burst", "Priority", "Completion", "Turnaround", "Waiting", "Response")
+
+# Binary result files (see result_store.py)
+RESULT_FILE_EXTENSION = ".schedres"
+RESULT_FILE_TYPES = [("Scheduler results", "*" + RESULT_FILE_EXTENSION), ("All files", "*.*")]
+SESSION_FILE_EXTENSION = ".schedsession"
+SESSION_FILE_TYPES = [("Scheduler sessions", "*" + SESSION_FILE_EXTENSION), ("All files", "*.*")]
+
+
+def simulate_with_report(processes, algorithm, time_quantum=None, progress=None, report=False, **options):
+    """simulate() for the worker thread; returns (result, gantt_df, misprediction report or None)
+
+    With `report` (burst prediction only), the report reuses the predicted run just made,
+    so only the exact-burst schedule it is compared with is simulated on top.
+    """
+    if not report:
+        return (*simulate(processes, algorithm, time_quantum, progress, **options), None)
+    from burst_prediction import misprediction_report
+    predictions = {}
+    result, gantt_df = simulate(processes, algorithm, time_quantum, progress, predictions=predictions, **options)
+    return result, gantt_df, misprediction_report(processes, options["alpha"], algorithm == "SRTF", result,
+                                                  predictions)
 
 
 class CPUSchedulerApp:
@@ -75,35 +101,26 @@ class CPUSchedulerApp:
 
         self.add_button = tk.Button(input_frame, text="Add Process", command=self.add_process,
                                     bg="#28a745", fg="white", relief=tk.RAISED)
-        self.add_button.grid(row=4, column=0, columnspan=2, pady=8, sticky="ew", padx=110)
+        # Past bursts for SJF / SRTF burst prediction (Initially Disabled)
+        tk.Label(input_frame, text="Burst History:").grid(row=4, column=0, sticky="w", pady=6)
+        self.history_entry = tk.Entry(input_frame, width=18, state=tk.DISABLED)
+        self.history_entry.grid(row=4, column=1, pady=5, padx=6)
+
+        # Absolute deadline for EDF / Rate Monotonic (Initially Disabled)
+        tk.Label(input_frame, text="Deadline:").grid(row=5, column=0, sticky="w", pady=6)
+        self.deadline_entry = tk.Entry(input_frame, width=18, state=tk.DISABLED)
+        self.deadline_entry.grid(row=5, column=1, pady=5, padx=6)
+
+        self.add_button.grid(row=6, column=0, columnspan=2, pady=8, sticky="ew", padx=110)
 
         # ---------------- Left Panel: Process List Section ----------------
         list_frame = tk.Frame(frame_left, padx=0, pady=5)
         list_frame.grid(row=1, column=0, sticky="ew", pady=10, padx=10)
 
-        list_scrollbar = tk.Scrollbar(list_frame, orient="vertical")
-        list_scrollbar.grid(row=0, column=1, sticky="ns")
-
-        # Add Priority Column
-        self.process_tree = ttk.Treeview(
-            list_frame, columns=("PID", "Arrival", "Burst", "Priority"),
-            show="headings", height=10, yscrollcommand=list_scrollbar.set
-        )
-
-        # Configure Column Headers
-        self.process_tree.heading("PID", text="PID", anchor="center")
-        self.process_tree.heading("Arrival", text="Arrival", anchor="center")
-        self.process_tree.heading("Burst", text="Burst", anchor="center")
-        self.process_tree.heading("Priority", text="Priority", anchor="center")
-
-        # Configure Column Widths
-        self.process_tree.column("PID", width=80, anchor="center")
-        self.process_tree.column("Arrival", width=80, anchor="center")
-        self.process_tree.column("Burst", width=80, anchor="center")
-        self.process_tree.column("Priority", width=80, anchor="center")  
-
-        self.process_tree.grid(row=0, column=0, sticky="nsew")
-        list_scrollbar.config(command=self.process_tree.yview)
+        # Process table (virtualized: only the visible rows become Treeview items)
+        self.process_table = VirtualTable(list_frame, columns=("PID", "Arrival", "Burst", "Priority"),
+                                          height=10, column_width=80)
+        self.process_table.grid(row=0, column=0, sticky="nsew")
 
 
         # Delete Button
@@ -119,9 +136,32 @@ class CPUSchedulerApp:
         tk.Label(algo_frame, text="Algorithm:").grid(row=0, column=0, pady=5, sticky="w")
 
         self.algo_dropdown = ttk.Combobox(algo_frame, textvariable=self.algo_var, 
-                                        values=("FCFS", "SJF", "SRTF","Round Robin", "Priority(Non-Preemptive)","Priority(Preemptive)"))
+                                        values=ALGORITHMS + REALTIME_ALGORITHMS)
         self.algo_dropdown.grid(row=0, column=1, padx=10, pady=5)
 
+        # MLFQ settings (Initially Disabled)
+        tk.Label(algo_frame, text="MLFQ Levels:").grid(row=1, column=0, pady=5, sticky="w")
+        self.mlfq_levels_entry = tk.Entry(algo_frame, width=18)
+        self.mlfq_levels_entry.insert(0, "3")
+        self.mlfq_levels_entry.config(state=tk.DISABLED)
+        self.mlfq_levels_entry.grid(row=1, column=1, padx=10, pady=5)
+
+        tk.Label(algo_frame, text="Boost Period:").grid(row=2, column=0, pady=5, sticky="w")
+        self.mlfq_boost_entry = tk.Entry(algo_frame, width=18)
+        self.mlfq_boost_entry.insert(0, "50")
+        self.mlfq_boost_entry.config(state=tk.DISABLED)
+        self.mlfq_boost_entry.grid(row=2, column=1, padx=10, pady=5)
+
+        # Aging rate for the priority algorithms (empty = static priorities)
+        tk.Label(algo_frame, text="Aging Rate:").grid(row=3, column=0, pady=5, sticky="w")
+        self.aging_entry = tk.Entry(algo_frame, width=18, state=tk.DISABLED)
+        self.aging_entry.grid(row=3, column=1, padx=10, pady=5)
+
+        # Exponential averaging weight for SJF / SRTF burst prediction (empty = exact bursts)
+        tk.Label(algo_frame, text="Prediction Alpha:").grid(row=4, column=0, pady=5, sticky="w")
+        self.alpha_entry = tk.Entry(algo_frame, width=18, state=tk.DISABLED)
+        self.alpha_entry.grid(row=4, column=1, padx=10, pady=5)
+
         # Bind Algorithm Selection to Function
         self.algo_var.trace_add("write", self.on_algorithm_change)
 
@@ -138,6 +178,23 @@ class CPUSchedulerApp:
                                     bg="#007bff", fg="white", relief=tk.RAISED)
         self.run_button.grid(row=1, column=0, columnspan=2, pady=10, sticky="ew", padx=100)
 
+        # Simulation progress and cancellation (simulations run on a worker thread)
+        self.progress_var = tk.DoubleVar(value=0)
+        self.progress_bar = ttk.Progressbar(button_frame, variable=self.progress_var, maximum=100)
+        self.progress_bar.grid(row=5, column=0, columnspan=2, pady=(6, 0), sticky="ew")
+
+        self.cancel_button = tk.Button(button_frame, text="Cancel Simulation", command=self.cancel_simulation,
+                                       bg="#6c757d", fg="white", relief=tk.RAISED, state=tk.DISABLED)
+        self.cancel_button.grid(row=6, column=0, columnspan=2, pady=6, sticky="ew", padx=100)
+
+        # Log level (DEBUG output is formatted only while enabled)
+        tk.Label(button_frame, text="Log Level:").grid(row=7, column=0, pady=5, sticky="w")
+        self.log_level_var = tk.StringVar(value=get_level())
+        self.log_level_dropdown = ttk.Combobox(button_frame, textvariable=self.log_level_var,
+                                               values=LOG_LEVELS, state="readonly", width=17)
+        self.log_level_dropdown.grid(row=7, column=1, padx=10, pady=5)
+        self.log_level_dropdown.bind("<<ComboboxSelected>>", lambda e: set_level(self.log_level_var.get()))
+
         self.reset_button = tk.Button(button_frame, text="Reset", command=self.reset_all,
                                       bg="#dc3545", fg="white", relief=tk.RAISED)
         self.reset_button.grid(row=2, column=0, columnspan=2, pady=6, sticky="ew", padx=100)
@@ -150,29 +207,35 @@ class CPUSchedulerApp:
                            bg="#ff9800", fg="white", relief=tk.RAISED)
         self.optimize_button.grid(row=4, column=0, columnspan=2, pady=6, sticky="ew", padx=100)
 
-        # ---------------- Scheduling Table (TreeView) ----------------
-        self.schedule_tree_frame = tk.Frame(frame_right)  # Create a frame for the Treeview and Scrollbar
-
-        # Create a scrollbar for the scheduling table
-        self.tree_scroll_y = tk.Scrollbar(self.schedule_tree_frame, orient="vertical")
-
-        # Create the Treeview (Scheduling Table)
-        self.schedule_tree = ttk.Treeview(self.schedule_tree_frame, columns=(
-            "PID", "Arrival", "Burst", "Priority", "Completion", "Turnaround", "Waiting", "Response"),
-            show="headings", height=6, yscrollcommand=self.tree_scroll_y.set)  
-
-        # Define column headings
-        columns = ["PID", "Arrival", "Burst", "Priority", "Completion", "Turnaround", "Waiting", "Response"]
-        for col in columns:
-            self.schedule_tree.heading(col, text=col, anchor="center")
-            self.schedule_tree.column(col, width=135, anchor="center") 
-
-        # Grid placement
-        self.schedule_tree.grid(row=0, column=0, sticky="nsew")
-
-        # Configure vertical scrollbar
-        self.tree_scroll_y.config(command=self.schedule_tree.yview)
-        self.tree_scroll_y.grid(row=0, column=1, sticky="ns")
+        # Saved results (binary result format, memory-mapped when opened)
+        self.open_results_button = tk.Button(button_frame, text="Open Results", command=self.open_results,
+                                             bg="#28a745", fg="white", relief=tk.RAISED)
+        self.open_results_button.grid(row=8, column=0, pady=6, sticky="ew", padx=(0, 4))
+        self.save_results_button = tk.Button(button_frame, text="Save Results", command=self.save_results,
+                                             bg="#28a745", fg="white", relief=tk.RAISED, state=tk.DISABLED)
+        self.save_results_button.grid(row=8, column=1, pady=6, sticky="ew", padx=(4, 0))
+
+        # Sessions: processes, settings, last result and optimizer output in one snapshot
+        self.load_session_button = tk.Button(button_frame, text="Load Session", command=self.load_session,
+                                             bg="#6f42c1", fg="white", relief=tk.RAISED)
+        self.load_session_button.grid(row=9, column=0, pady=6, sticky="ew", padx=(0, 4))
+        self.save_session_button = tk.Button(button_frame, text="Save Session", command=self.save_session,
+                                             bg="#6f42c1", fg="white", relief=tk.RAISED)
+        self.save_session_button.grid(row=9, column=1, pady=6, sticky="ew", padx=(4, 0))
+
+        # ---------------- Scheduling Table (Virtualized TreeView) ----------------
+        self.schedule_tree_frame = tk.Frame(frame_right)  # Create a frame for the filter and table
+
+        # Filter entry, e.g. "Waiting > 10" (evaluated on the result arrays)
+        tk.Label(self.schedule_tree_frame, text="Filter:").grid(row=0, column=0, sticky="w")
+        self.filter_entry = tk.Entry(self.schedule_tree_frame, width=30)
+        self.filter_entry.grid(row=0, column=1, sticky="w", padx=6, pady=(0, 4))
+        self.filter_entry.bind("<Return>", self.apply_result_filter)
+
+        # Create the scheduling table; clicking a heading sorts by that column
+        self.schedule_table = VirtualTable(self.schedule_tree_frame, columns=RESULT_COLUMNS, height=6)
+        self.schedule_table.grid(row=1, column=0, columnspan=2, sticky="nsew")
+        self.schedule_tree_frame.grid_columnconfigure(1, weight=1)
 
         # Pack the scheduling table frame
         self.schedule_tree_frame.grid(row=0, column=0, sticky="nsew", padx=10, pady=10)
@@ -192,7 +255,19 @@ class CPUSchedulerApp:
 
 
         # Process Manager Instance
-        self.process_manager = ProcessManager(self.process_tree)
+        self.process_manager = ProcessManager(self.process_table)
+
+        # Background simulation currently in flight (if any)
+        self.worker = None
+        self.worker_algorithm = None
+        self.worker_alpha = None
+
+        # Last displayed (result, gantt_df, algorithm), for Save Results
+        self.last_results = None
+
+        # Optimizer window, and optimizer output restored from a session (cleared when processes change)
+        self.optimizer = None
+        self.optimizer_results = None
     # ---------------- Event Handlers ----------------
 
     def open_optimizer(self):
@@ -200,28 +275,34 @@ class CPUSchedulerApp:
         processes = copy.deepcopy(self.process_manager.get_processes())
         
         if not processes:
-            print("No processes to optimize! Please add processes first.")
+            logger.warning("No processes to optimize! Please add processes first.")
             return
         
-        # Open optimizer window
-        AlgorithmOptimizerWindow(self.root, processes)
+        # Open optimizer window (reusing a restored analysis of the same processes)
+        from optimizer import AlgorithmOptimizerWindow
+        self.optimizer = AlgorithmOptimizerWindow(self.root, processes, self.optimizer_results)
 
     def open_animation(self):
         """Open animation window to demonstrate scheduling"""
         processes = copy.deepcopy(self.process_manager.get_processes())
         
         if not processes:
-            print("No processes to demonstrate!")
+            logger.warning("No processes to demonstrate!")
             return
         
+        from scheduler_animation import SchedulerAnimationWindow, ANIMATED_ALGORITHMS
         selected_algorithm = self.algo_var.get()
         
+        if selected_algorithm not in ANIMATED_ALGORITHMS:
+            logger.warning("Live demonstration is not available for %s.", selected_algorithm)
+            return
+
         # For Round Robin, get the time quantum
         time_quantum = None
         if selected_algorithm == "Round Robin":
             time_quantum = self.get_time_quantum()
             if time_quantum <= 0:
-                print("Invalid time quantum! Must be greater than zero.")
+                logger.warning("Invalid time quantum! Must be greater than zero.")
                 return
         
         # Open animation window
@@ -230,18 +311,37 @@ class CPUSchedulerApp:
     def on_algorithm_change(self, *args):
         """Enable/Disable Time Quantum and Priority Input based on Algorithm Selection"""
 
-        # Handle Time Quantum Entry for Round Robin
-        if self.algo_var.get() == "Round Robin":
+        # Handle Time Quantum Entry for Round Robin (and the MLFQ / Stride base quantum)
+        if self.algo_var.get() in QUANTUM_ALGORITHMS:
             self.time_quantum_entry.config(state=tk.NORMAL)
         else:
             self.time_quantum_entry.config(state=tk.DISABLED)
 
-        # Handle Priority Input for Priority Scheduling
-        if self.algo_var.get() in ["Priority(Non-Preemptive)", "Priority(Preemptive)"]:
+        # Handle Priority Input for Priority Scheduling (optional nice value for CFS / Stride)
+        if self.algo_var.get() in PRIORITY_ALGORITHMS + WEIGHTED_ALGORITHMS:
             self.priority_entry.config(state=tk.NORMAL)  # Enable Priority field
         else:
             self.priority_entry.config(state=tk.DISABLED)  # Disable Priority field
 
+        # Handle Aging Rate for Priority Scheduling
+        if self.algo_var.get() in PRIORITY_ALGORITHMS:
+            self.aging_entry.config(state=tk.NORMAL)
+        else:
+            self.aging_entry.config(state=tk.DISABLED)
+
+        # Handle burst prediction settings for SJF / SRTF
+        prediction_state = tk.NORMAL if self.algo_var.get() in PREDICTED_ALGORITHMS else tk.DISABLED
+        self.history_entry.config(state=prediction_state)
+        self.alpha_entry.config(state=prediction_state)
+
+        # Handle deadlines for the real-time algorithms
+        self.deadline_entry.config(state=tk.NORMAL if self.algo_var.get() in REALTIME_ALGORITHMS else tk.DISABLED)
+
+        # Handle MLFQ settings
+        mlfq_state = tk.NORMAL if self.algo_var.get() == "MLFQ" else tk.DISABLED
+        self.mlfq_levels_entry.config(state=mlfq_state)
+        self.mlfq_boost_entry.config(state=mlfq_state)
+
 
     def get_time_quantum(self):
         """Retrieve time quantum value safely from the input box"""
@@ -257,175 +357,384 @@ class CPUSchedulerApp:
         burst_time = self.burst_entry.get()
 
         # Get priority input if applicable
-        if self.algo_var.get() in ["Priority(Non-Preemptive)", "Priority(Preemptive)"]:
+        if self.algo_var.get() in PRIORITY_ALGORITHMS + WEIGHTED_ALGORITHMS:
             priority = self.priority_entry.get()
         else:
             priority = "-"  # Default value for non-priority algorithms
 
         # Validate the input fields
         if not pid or not arrival_time or not burst_time:
-            print("Please enter all required fields!")
+            logger.warning("Please enter all required fields!")
             return
 
         try:
             pid = int(pid)
             arrival_time = int(arrival_time)
             burst_time = int(burst_time)
-            if self.algo_var.get() in ["Priority(Non-Preemptive)", "Priority(Preemptive)"]:
+            if self.algo_var.get() in WEIGHTED_ALGORITHMS and not priority:
+                priority = "-"  # Optional for CFS / Stride: default weight
+            elif self.algo_var.get() in PRIORITY_ALGORITHMS + WEIGHTED_ALGORITHMS:
                 priority = int(priority)
                 if priority < 0:  # Prevent negative priority
-                    print("Error: Priority cannot be negative!")
+                    logger.warning("Priority cannot be negative!")
                     return
             else:
                 priority = "-"  # Keep as '-' if not Priority Scheduling
         except ValueError:
-            print("Please enter valid integers!")
+            logger.warning("Please enter valid integers!")
             return
 
+        # Optional comma-separated history of past bursts (SJF / SRTF prediction)
+        history = None
+        if self.algo_var.get() in PREDICTED_ALGORITHMS and self.history_entry.get().strip():
+            try:
+                history = [int(b) for b in self.history_entry.get().replace(",", " ").split()]
+            except ValueError:
+                logger.warning("Burst history must be a list of integers, e.g. 4, 6, 5")
+                return
+            if min(history) <= 0:
+                logger.warning("Past bursts must be greater than zero!")
+                return
+
+        # Optional absolute deadline (EDF / Rate Monotonic)
+        deadline = None
+        if self.algo_var.get() in REALTIME_ALGORITHMS and self.deadline_entry.get().strip():
+            try:
+                deadline = int(self.deadline_entry.get())
+            except ValueError:
+                logger.warning("Deadline must be an integer time!")
+                return
+            if deadline <= arrival_time:
+                logger.warning("Deadline must be after the arrival time!")
+                return
+
         # Add process to ProcessManager (removing duplicate insertion)
-        success = self.process_manager.add_process(pid, arrival_time, burst_time, priority)
+        success = self.process_manager.add_process(pid, arrival_time, burst_time, priority, history, deadline)
 
         # No need to insert again into TreeView; it's handled in ProcessManager
 
         # Clear input fields after adding a process
         if success:
+            self.optimizer_results = None
             self.pid_entry.delete(0, tk.END)
             self.arrival_entry.delete(0, tk.END)
             self.burst_entry.delete(0, tk.END)
-            if self.algo_var.get() in ["Priority(Non-Preemptive)", "Priority(Preemptive)"]:
+            if self.algo_var.get() in PRIORITY_ALGORITHMS + WEIGHTED_ALGORITHMS:
                 self.priority_entry.delete(0, tk.END)
+            if self.algo_var.get() in PREDICTED_ALGORITHMS:
+                self.history_entry.delete(0, tk.END)
+            if self.algo_var.get() in REALTIME_ALGORITHMS:
+                self.deadline_entry.delete(0, tk.END)
 
 
     def delete_selected_process(self):
-        selected_item = self.process_tree.selection()
-        if not selected_item:
-            print("No process selected!")
+        selected_rows = self.process_table.selected_rows()
+        if not selected_rows:
+            logger.warning("No process selected!")
             return  
 
-        for item in selected_item:
-            values = self.process_tree.item(item, "values")
-            if values:
-                pid = values[0]  
-                try:
-                    self.process_manager.remove_process(int(pid))  
-                    self.process_tree.delete(item)  
-                    print(f"Deleted process {pid}")  
-                except ValueError:
-                    print(f"Invalid PID {pid}, cannot delete")
+        pids = [self.process_table.row(index)[0] for index in selected_rows]
+        try:
+            self.process_manager.remove_processes([int(pid) for pid in pids])
+            self.optimizer_results = None
+            log_event(logger, logging.INFO, "processes deleted", count=len(pids))
+        except ValueError:
+            logger.warning("Invalid PID in %s, cannot delete", pids)
+
+    def apply_result_filter(self, event=None):
+        """Filter the scheduling table with the expression in the filter box"""
+        if not self.schedule_table.apply_filter_text(self.filter_entry.get()):
+            logger.warning("Invalid filter! Use e.g. 'Waiting > 10'.")
 
 
     def run_simulation(self):
-        """Run the selected scheduling algorithm and update the UI"""
+        """Validate the inputs and start the selected algorithm on a worker thread"""
 
         # Create a deep copy to prevent in-place modifications
         processes = copy.deepcopy(self.process_manager.get_processes())  
-        print("Processes before scheduling:", processes)
+        logger.debug("Processes before scheduling:\n%s", Preview(processes))
 
         if not processes:
-            print("No processes to schedule!")
+            logger.warning("No processes to schedule!")
             return
 
         selected_algorithm = self.algo_var.get()
 
-        # Store Original Order (Before Scheduling)
-        original_order = {p["PID"]: i for i, p in enumerate(processes)}
-
         # Prevent Priority Scheduling if any process has missing priority
-        if selected_algorithm in ["Priority(Non-Preemptive)", "Priority(Preemptive)"]:
+        if selected_algorithm in PRIORITY_ALGORITHMS:
             if any(p["Priority"] == "-" for p in processes):
-                print(f"Error: Some processes are missing priority values! Cannot run {selected_algorithm} Scheduling.")
+                logger.error("Some processes are missing priority values! Cannot run %s Scheduling.", selected_algorithm)
                 return
 
-        # Initialize `gantt_data` to prevent errors
-        gantt_data = []
-
-        # Run the selected scheduling algorithm
-        if selected_algorithm == "FCFS":
-            result = fcfs_scheduling(processes)
-            gantt_data = result[["Start", "Completion", "PID"]].values.tolist()
-
-        elif selected_algorithm == "SJF":
-            result = sjf_scheduling(processes)
-            gantt_data = result[["Start", "Completion", "PID"]].values.tolist()
-
-        elif selected_algorithm == "Round Robin":
+        time_quantum = None
+        if selected_algorithm == "Round Robin":
             time_quantum = self.get_time_quantum()
             if time_quantum <= 0:
-                print("Invalid time quantum! Must be greater than zero.")
+                logger.warning("Invalid time quantum! Must be greater than zero.")
+                return
+        elif selected_algorithm in QUANTUM_ALGORITHMS and self.time_quantum_entry.get().strip():
+            # Optional base quantum for MLFQ / Stride (policy default when empty)
+            time_quantum = self.get_time_quantum()
+            if time_quantum <= 0:
+                logger.warning("Invalid time quantum! Must be greater than zero.")
                 return
 
-            result, gantt_data = round_robin_scheduling(processes, time_quantum)
+        options = {}
+        if selected_algorithm == "MLFQ":
+            try:
+                options["levels"] = int(self.mlfq_levels_entry.get())
+                boost = self.mlfq_boost_entry.get().strip()
+                options["boost_period"] = int(boost) if boost else None
+            except ValueError:
+                logger.warning("Please enter valid integers for the MLFQ settings!")
+                return
+            if options["levels"] <= 0 or (options["boost_period"] is not None and options["boost_period"] <= 0):
+                logger.warning("MLFQ levels and boost period must be greater than zero.")
+                return
 
-        elif selected_algorithm == "SRTF":
-            result, gantt_data = srtf_scheduling(processes)
+        if selected_algorithm in PRIORITY_ALGORITHMS and self.aging_entry.get().strip():
+            try:
+                options["aging_rate"] = float(self.aging_entry.get())
+            except ValueError:
+                logger.warning("Please enter a valid number for the aging rate!")
+                return
+            if options["aging_rate"] < 0:
+                logger.warning("Aging rate cannot be negative!")
+                return
 
-        elif selected_algorithm == "Priority(Non-Preemptive)":
-            result = priority_scheduling(processes)
+        if selected_algorithm in PREDICTED_ALGORITHMS and self.alpha_entry.get().strip():
+            try:
+                options["alpha"] = float(self.alpha_entry.get())
+            except ValueError:
+                logger.warning("Please enter a valid number for the prediction alpha!")
+                return
+            if not 0 <= options["alpha"] <= 1:
+                logger.warning("Prediction alpha must be between 0 and 1!")
+                return
 
-            # Ensure 'Start' column exists before using Gantt Chart
-            if "Start" in result.columns:
-                gantt_data = result[["Start", "Completion", "PID"]].values.tolist()
-                
-        elif selected_algorithm == "Priority(Preemptive)":
-            result, gantt_data = preemptive_priority_scheduling(processes)
+        # Only one simulation at a time; a new run replaces the one in flight
+        if self.worker is not None:
+            self.worker.cancel()
+
+        # With burst prediction, also measure the schedule quality lost to misprediction
+        report = options.get("alpha") is not None
+        self.worker = SimulationWorker(simulate_with_report, processes, selected_algorithm, time_quantum,
+                                       report=report, **options)
+        self.worker_algorithm = selected_algorithm
+        self.worker_alpha = options.get("alpha")
+        self.worker.start()
+
+        self.progress_var.set(0)
+        self.cancel_button.config(state=tk.NORMAL)
+        self.root.after(50, self._poll_simulation, self.worker)
+
+    def cancel_simulation(self):
+        """Cancel the simulation running in the background"""
+        if self.worker is not None:
+            self.worker.cancel()
+            logger.info("Cancelling simulation...")
+
+    def _poll_simulation(self, worker):
+        """Poll the worker queue from the Tk event loop and swap in finished results"""
+        for kind, payload in worker.poll():
+            # Ignore messages from a worker that has been replaced or reset
+            if worker is not self.worker:
+                return
 
-        else:
-            print("Invalid algorithm selected!")
-            return
+            if kind == "progress":
+                done, total = payload
+                self.progress_var.set(done * 100 / total if total else 100)
+            elif kind == "done":
+                self._finish_simulation()
+                result, gantt_df, report = payload
+                note = None
+                if report is not None:
+                    if logger.isEnabledFor(logging.INFO):
+                        log_event(logger, logging.INFO, "burst prediction", algorithm=self.worker_algorithm,
+                                  alpha=self.worker_alpha, **{key: round(value, 2) for key, value in report.items()})
+                    note = (f"Prediction loss {report['waiting_loss']:+.2f} avg waiting "
+                            f"({report['waiting_loss_pct']:+.1f}% vs exact bursts)")
+                self.show_results(result, gantt_df, self.worker_algorithm, note=note)
+                return
+            elif kind == "cancelled":
+                self._finish_simulation()
+                self.progress_var.set(0)
+                logger.info("Simulation cancelled.")
+                return
+            elif kind == "error":
+                self._finish_simulation()
+                self.progress_var.set(0)
+                logger.error("Simulation failed: %s", payload)
+                return
+
+        if worker is self.worker:
+            self.root.after(50, self._poll_simulation, worker)
 
-        # Ensure 'Priority' column only when needed
-        if "Priority" not in result.columns and selected_algorithm not in ["Priority(Non-Preemptive)", "Priority(Preemptive)"]:
-            result["Priority"] = "-"
+    def _finish_simulation(self):
+        self.worker = None
+        self.cancel_button.config(state=tk.DISABLED)
 
-        # Sort the result back to original process order
-        result["Original_Order"] = result["PID"].map(original_order)  # Map PIDs to their original index
-        result = result.sort_values(by="Original_Order").drop(columns=["Original_Order"])  # Sort & remove temp column
+    def show_results(self, result, gantt_df, selected_algorithm, note=None):
+        """Display a finished simulation in the table and charts (`note`: extra line on the stats chart)
 
-        # Debugging Output
-        print("Scheduled Processes:\n", result)
+        `result` is a result DataFrame or a ResultFile; `gantt_df` (Start, Completion, PID)
+        segments as a DataFrame or array.
+        """
+        from aging import starvation_report
+        from gantt_chart import plot_gantt_chart
+        from stats_chart import plot_stats_chart
+        from chart_canvas import clear_chart
 
-        # Ensure Gantt Data is a DataFrame
-        gantt_df = pd.DataFrame(gantt_data, columns=["Start", "Completion", "PID"]) if gantt_data else None
-        print("Gantt Chart Data:\n", gantt_df)  # Debugging Line
+        # Debugging Output (formatted only when DEBUG is enabled and sampled)
+        logger.debug("Scheduled Processes:\n%s", Preview(result))
+        logger.debug("Gantt Chart Data:\n%s", Preview(gantt_df))
+        if logger.isEnabledFor(logging.INFO):  # The report scans every waiting time
+            log_event(logger, logging.INFO, "simulation finished", algorithm=selected_algorithm,
+                      processes=len(result), **starvation_report(result))
 
         # Ensure Completion & Waiting Time are present in result
         if "Completion" not in result.columns or "Waiting" not in result.columns:
-            print("Error: Missing Completion/Waiting time in results!")
+            logger.error("Missing Completion/Waiting time in results!")
             return
 
-        # Ensure TreeView is updated correctly
-        for item in self.schedule_tree.get_children():
-            self.schedule_tree.delete(item)
-
-        # Insert results into the scheduling table (Original Order)
-        for row in result.itertuples():
-            self.schedule_tree.insert("", "end", values=(
-                row.PID, row.Arrival, row.Burst, row.Priority, row.Completion, row.Turnaround, row.Waiting, row.Response
-            ))
+        self.progress_var.set(100)
+        self.last_results = (result, gantt_df, selected_algorithm)
+        self.save_results_button.config(state=tk.NORMAL)
 
-        # Clear previous Gantt Chart & Stats Chart
-        for widget in self.canvas_frame.winfo_children():
-            widget.destroy()
-        for widget in self.stats_frame.winfo_children():
-            widget.destroy()
+        # Hand the result columns to the virtual table (Original Order)
+        self.schedule_table.set_data({col: result[col] for col in RESULT_COLUMNS if col in result.columns})
+        self.apply_result_filter()
 
-        # Pass DataFrame to `plot_gantt_chart()` only if data exists
-        is_preemptive = (selected_algorithm in ["Round Robin", "SRTF", "Priority(Preemptive)"])
+        # Charts reuse their figures; the Gantt chart is blanked when there is no data
+        is_preemptive = (selected_algorithm in PREEMPTIVE_ALGORITHMS)
         if gantt_df is not None:
             plot_gantt_chart(gantt_df, self.canvas_frame, is_preemptive=is_preemptive)
+        else:
+            clear_chart(self.canvas_frame)
 
         # Plot Stats Chart
-        plot_stats_chart(result, self.stats_frame)
+        plot_stats_chart(result, self.stats_frame, gantt_df, note=note)
 
 
+    def save_results(self):
+        """Save the displayed results to a binary result file"""
+        from result_store import write_results
+        if self.last_results is None:
+            return
+        path = filedialog.asksaveasfilename(defaultextension=RESULT_FILE_EXTENSION,
+                                            filetypes=RESULT_FILE_TYPES)
+        if not path:
+            return
+        result, gantt_df, algorithm = self.last_results
+        try:
+            write_results(path, result, gantt_df, metadata={"algorithm": algorithm})
+        except (OSError, ValueError) as e:
+            logger.error("Could not save results: %s", e)
+            return
+        logger.info("Saved %d results to %s", len(result), path)
+
+    def open_results(self):
+        """Display results saved by Save Results or cli.py"""
+        from result_store import ResultFile
+        path = filedialog.askopenfilename(filetypes=RESULT_FILE_TYPES)
+        if not path:
+            return
+        try:
+            with ResultFile(path) as results:
+                result, gantt_df = results.to_dataframe(), results.gantt_dataframe()
+                algorithm = results.metadata.get("algorithm", "")
+        except (OSError, ValueError) as e:
+            logger.error("Could not open results: %s", e)
+            return
+        self.show_results(result, gantt_df, algorithm)
+
+    def session_entries(self):
+        """Algorithm setting entries saved with a session"""
+        return {"time_quantum": self.time_quantum_entry, "mlfq_levels": self.mlfq_levels_entry,
+                "boost_period": self.mlfq_boost_entry, "aging_rate": self.aging_entry,
+                "alpha": self.alpha_entry}
+
+    def save_session(self):
+        """Save processes, algorithm settings, the displayed result and optimizer output"""
+        from session import save_session
+        path = filedialog.asksaveasfilename(defaultextension=SESSION_FILE_EXTENSION,
+                                            filetypes=SESSION_FILE_TYPES)
+        if not path:
+            return
+        processes = self.process_manager.get_processes()
+        settings = {name: entry.get() for name, entry in self.session_entries().items()}
+        settings["algorithm"] = self.algo_var.get()
+        result, gantt_df, algorithm = self.last_results or (None, None, None)
+
+        # Optimizer output is only kept while it still describes the current processes
+        optimizer = self.optimizer_results
+        if self.optimizer is not None and self.optimizer.results and self.optimizer.processes == processes:
+            optimizer = self.optimizer.results
+        try:
+            save_session(path, processes, settings, result, gantt_df, algorithm, optimizer)
+        except (OSError, ValueError) as e:
+            logger.error("Could not save session: %s", e)
+            return
+        log_event(logger, logging.INFO, "session saved", path=path, processes=len(processes),
+                  results=result is not None, optimizer=optimizer is not None)
+
+    def load_session(self):
+        """Restore a session saved by Save Session"""
+        from session import load_session
+        path = filedialog.askopenfilename(filetypes=SESSION_FILE_TYPES)
+        if not path:
+            return
+        try:
+            session = load_session(path)
+            processes = session.processes()
+            settings, optimizer, algorithm = session.settings, session.optimizer, session.algorithm
+            # The session itself stands in for the result table: its columns stay memory-mapped
+            # (the table only reads the visible rows) and no DataFrame is built
+            result = session if session.has_results else None
+            gantt_df = session.gantt if session.has_results else None
+            for col in session.columns:
+                session[col]  # Map every column now, so a damaged file fails here
+        except (OSError, ValueError, KeyError) as e:
+            logger.error("Could not load session: %s", e)
+            return
+
+        self.reset_all()
+        self.process_manager.set_processes(processes)
+        if settings.get("algorithm") in ALGORITHMS + REALTIME_ALGORITHMS:
+            self.algo_var.set(settings["algorithm"])
+        for name, entry in self.session_entries().items():
+            if name in settings:
+                entry.config(state=tk.NORMAL)
+                entry.delete(0, tk.END)
+                entry.insert(0, settings[name])
+        self.on_algorithm_change()
+        self.optimizer_results = optimizer
+        if result is not None:
+            self.show_results(result, gantt_df, algorithm)
+        log_event(logger, logging.INFO, "session loaded", path=path, processes=len(processes),
+                  results=result is not None, optimizer=optimizer is not None)
+
     def reset_all(self):
-        self.process_manager.processes.clear()
-        self.process_tree.delete(*self.process_tree.get_children())
-        self.schedule_tree.delete(*self.schedule_tree.get_children())
-        for widget in self.canvas_frame.winfo_children() + self.stats_frame.winfo_children():
-            widget.destroy()
+        if self.worker is not None:
+            self.worker.cancel()
+            self._finish_simulation()
+        self.progress_var.set(0)
+        self.process_manager.clear()
+        self.schedule_table.clear()
+        self.last_results = None
+        self.save_results_button.config(state=tk.DISABLED)
+        self.optimizer = None
+        self.optimizer_results = None
+        if "chart_canvas" in sys.modules:  # Nothing to clear before the first chart was drawn
+            from chart_canvas import clear_chart
+            clear_chart(self.canvas_frame)
+            clear_chart(self.stats_frame)
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="CPU Scheduler Simulator")
+    add_logging_arguments(parser)
+    configure_from_args(parser.parse_args())
+
     root = tk.Tk()
     app = CPUSchedulerApp(root)
     root.mainloop()
@@ -0,0 +1,272 @@
+import math
+import numpy as np
+
+# Per-process time columns summarised by the metrics engine
+TIME_COLUMNS = ("Turnaround", "Waiting", "Response")
+PERCENTILES = (50, 95, 99)
+
+# Above this many processes percentiles come from the mergeable sketch instead of a full partition
+SKETCH_THRESHOLD = 1_000_000
+
+# Human-readable names for every metric the optimizer can rank on
+METRIC_LABELS = {
+    "avg_turnaround": "Average Turnaround Time",
+    "avg_waiting": "Average Waiting Time",
+    "avg_response": "Average Response Time",
+    "p50_turnaround": "Median Turnaround Time",
+    "p95_turnaround": "P95 Turnaround Time",
+    "p99_turnaround": "P99 Turnaround Time",
+    "max_turnaround": "Maximum Turnaround Time",
+    "p50_waiting": "Median Waiting Time",
+    "p95_waiting": "P95 Waiting Time",
+    "p99_waiting": "P99 Waiting Time",
+    "max_waiting": "Maximum Waiting Time",
+    "p50_response": "Median Response Time",
+    "p95_response": "P95 Response Time",
+    "p99_response": "P99 Response Time",
+    "max_response": "Maximum Response Time",
+    "fairness": "Jain's Fairness Index",
+    "utilization": "CPU Utilization",
+    "idle_time": "CPU Idle Time",
+    "throughput": "Throughput",
+    "makespan": "Makespan",
+    "context_switches": "Context Switches",
+}
+
+# Metrics where a larger value is better; everything else is minimised
+HIGHER_IS_BETTER = {"fairness", "utilization", "throughput"}
+
+
+class QuantileSketch:
+    """Mergeable quantile sketch with bounded relative error (DDSketch-style log buckets).
+
+    Values are counted in buckets whose bounds grow geometrically by `gamma`, so any
+    quantile is answered within `relative_accuracy` of the true value. Sketches built
+    on separate chunks or workers can be merged by adding bucket counts.
+    """
+
+    def __init__(self, relative_accuracy=0.01):
+        self.relative_accuracy = relative_accuracy
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self.log_gamma = math.log(self.gamma)
+        self.buckets = {}
+        self.zero_count = 0  # Values <= 0 (e.g. zero waiting time)
+        self.count = 0
+
+    def add(self, values):
+        """Add a scalar or an array of values"""
+        values = np.asarray(values, dtype=float).ravel()
+        if not len(values):
+            return
+        positive = values[values > 0]
+        self.zero_count += len(values) - len(positive)
+        self.count += len(values)
+        if len(positive):
+            indexes, counts = np.unique(np.ceil(np.log(positive) / self.log_gamma).astype(np.int64),
+                                        return_counts=True)
+            for index, count in zip(indexes.tolist(), counts.tolist()):
+                self.buckets[index] = self.buckets.get(index, 0) + count
+
+    def merge(self, other):
+        """Fold another sketch (with the same accuracy) into this one"""
+        self.zero_count += other.zero_count
+        self.count += other.count
+        for index, count in other.buckets.items():
+            self.buckets[index] = self.buckets.get(index, 0) + count
+        return self
+
+    def quantile(self, q):
+        """Approximate value at quantile q (0..1)"""
+        if not self.count:
+            return 0.0
+        rank = q * (self.count - 1)
+        if rank < self.zero_count:
+            return 0.0
+        seen = self.zero_count
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if seen > rank:
+                return 2 * self.gamma ** index / (self.gamma + 1)
+        return 2 * self.gamma ** max(self.buckets) / (self.gamma + 1)
+
+
+class MetricsAccumulator:
+    """Streaming, mergeable version of compute_metrics for chunked or parallel traces"""
+
+    def __init__(self, relative_accuracy=0.01):
+        self.count = 0
+        self.sums = {col: 0.0 for col in TIME_COLUMNS}
+        self.maxima = {col: 0.0 for col in TIME_COLUMNS}
+        self.sketches = {col: QuantileSketch(relative_accuracy) for col in TIME_COLUMNS}
+        self.busy_time = 0.0
+        self.first_arrival = math.inf
+        self.last_completion = -math.inf
+        self.share_sum = 0.0  # Jain's index terms over burst / turnaround
+        self.share_sq_sum = 0.0
+        self.context_switches = 0
+
+    def add(self, result):
+        """Fold a chunk of per-process results (DataFrame or mapping of columns) into the totals"""
+        columns = _columns(result)
+        if not len(columns["Turnaround"]):
+            return self
+        self.count += len(columns["Turnaround"])
+        for col in TIME_COLUMNS:
+            values = columns[col]
+            self.sums[col] += float(values.sum())
+            self.maxima[col] = max(self.maxima[col], float(values.max()))
+            self.sketches[col].add(values)
+        share = _service_share(columns)
+        self.share_sum += float(share.sum())
+        self.share_sq_sum += float(np.square(share).sum())
+        self.busy_time += float(columns["Burst"].sum())
+        self.first_arrival = min(self.first_arrival, float(columns["Arrival"].min()))
+        self.last_completion = max(self.last_completion, float(columns["Completion"].max()))
+        return self
+
+    def merge(self, other):
+        self.count += other.count
+        for col in TIME_COLUMNS:
+            self.sums[col] += other.sums[col]
+            self.maxima[col] = max(self.maxima[col], other.maxima[col])
+            self.sketches[col].merge(other.sketches[col])
+        self.share_sum += other.share_sum
+        self.share_sq_sum += other.share_sq_sum
+        self.busy_time += other.busy_time
+        self.first_arrival = min(self.first_arrival, other.first_arrival)
+        self.last_completion = max(self.last_completion, other.last_completion)
+        self.context_switches += other.context_switches
+        return self
+
+    def result(self):
+        """Return the same metric dictionary as compute_metrics"""
+        if not self.count:
+            return empty_metrics()
+        metrics = {}
+        for col in TIME_COLUMNS:
+            name = col.lower()
+            metrics[f"avg_{name}"] = self.sums[col] / self.count
+            for p in PERCENTILES:
+                metrics[f"p{p}_{name}"] = self.sketches[col].quantile(p / 100)
+            metrics[f"max_{name}"] = self.maxima[col]
+        metrics["fairness"] = _jain(self.share_sum, self.share_sq_sum, self.count)
+        metrics.update(_cpu_metrics(self.count, self.busy_time, self.first_arrival, self.last_completion))
+        metrics["context_switches"] = self.context_switches
+        return metrics
+
+
+def compute_metrics(result, gantt=None):
+    """Compute averages, percentiles, maxima, fairness, utilization, idle time and throughput
+
+    `result` is a result DataFrame (or any mapping of column -> sequence). `gantt` is the
+    optional list of (start, end, pid) segments used to count context switches; without it,
+    Start/Completion columns are used when present.
+    """
+    columns = _columns(result)
+    n = len(columns["Turnaround"])
+    if not n:
+        return empty_metrics()
+
+    if n > SKETCH_THRESHOLD:
+        metrics = MetricsAccumulator().add(columns).result()
+    else:
+        metrics = {}
+        for col in TIME_COLUMNS:
+            values = columns[col]
+            name = col.lower()
+            metrics[f"avg_{name}"] = float(values.mean())
+            for p, value in zip(PERCENTILES, np.percentile(values, PERCENTILES)):
+                metrics[f"p{p}_{name}"] = float(value)
+            metrics[f"max_{name}"] = float(values.max())
+
+        share = _service_share(columns)
+        metrics["fairness"] = _jain(float(share.sum()), float(np.square(share).sum()), n)
+        metrics.update(_cpu_metrics(n, float(columns["Burst"].sum()),
+                                    float(columns["Arrival"].min()), float(columns["Completion"].max())))
+
+    metrics["context_switches"] = count_context_switches(gantt if gantt is not None else _start_segments(result))
+    return metrics
+
+
+def empty_metrics():
+    return {key: 0.0 for key in METRIC_LABELS}
+
+
+def count_context_switches(gantt):
+    """Number of times the CPU moves from one process to a different one"""
+    if gantt is None or not len(gantt):
+        return 0
+    if hasattr(gantt, "to_numpy"):
+        segments = gantt[["Start", "Completion", "PID"]].to_numpy(dtype=float)
+    elif isinstance(gantt, np.ndarray):
+        segments = gantt
+    else:
+        segments = np.asarray([tuple(segment)[:3] for segment in gantt], dtype=float)
+    pids = segments[np.argsort(segments[:, 0], kind="stable"), 2]
+    return int(np.count_nonzero(pids[1:] != pids[:-1]))
+
+
+def format_metric(metric, value):
+    """Format a metric value for display"""
+    if metric in ("utilization", "device_utilization", "miss_ratio"):
+        return f"{value * 100:.1f}%"
+    if metric in ("fairness", "throughput"):
+        return f"{value:.3f}"
+    if metric in ("context_switches", "deadline_misses"):
+        return f"{int(value)}"
+    return f"{value:.2f}"
+
+
+def best_algorithm(results, metric):
+    """Name of the best entry in {name: metrics} for the given metric"""
+    return rank_algorithms(results, metric)[0]
+
+
+def rank_algorithms(results, metric):
+    """Names in {name: metrics} ordered best first for the given metric"""
+    reverse = metric in HIGHER_IS_BETTER
+    return sorted(results, key=lambda name: results[name][metric], reverse=reverse)
+
+
+def _columns(result):
+    """Float arrays for the columns the metrics need"""
+    columns = {}
+    for col in TIME_COLUMNS + ("Arrival", "Burst", "Completion"):
+        if col == "Response" and col not in _column_names(result):
+            columns[col] = columns["Waiting"]  # Non-preemptive tables without Response
+            continue
+        columns[col] = np.asarray(result[col], dtype=float)
+    return columns
+
+
+def _column_names(result):
+    return result.columns if hasattr(result, "columns") else result.keys()
+
+
+def _start_segments(result):
+    if "Start" not in _column_names(result):
+        return None
+    return np.column_stack([np.asarray(result["Start"], dtype=float),
+                            np.asarray(result["Completion"], dtype=float),
+                            np.asarray(result["PID"], dtype=float)])
+
+
+def _service_share(columns):
+    """Fraction of its time in the system each process spent running (1 = never waited)"""
+    turnaround = columns["Turnaround"]
+    return np.divide(columns["Burst"], turnaround, out=np.ones_like(turnaround), where=turnaround > 0)
+
+
+def _jain(total, total_sq, n):
+    """Jain's fairness index: 1 when every process gets the same share, 1/n at worst"""
+    return total * total / (n * total_sq) if total_sq > 0 else 1.0
+
+
+def _cpu_metrics(n, busy_time, first_arrival, last_completion):
+    makespan = max(last_completion - min(first_arrival, last_completion), 0.0)
+    return {
+        "utilization": busy_time / makespan if makespan else 0.0,
+        "idle_time": max(makespan - busy_time, 0.0),
+        "throughput": n / makespan if makespan else 0.0,
+        "makespan": makespan,
+    }
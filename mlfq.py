@@ -0,0 +1,92 @@
+from collections import deque
+from event_core import Policy, simulate, RESULT_COLUMNS
+from result_table import ResultTable
+
+
+class MLFQPolicy(Policy):
+    """Multilevel feedback queue: new jobs start at the top level, jobs that use up
+    their allotment move down a level, and every `boost_period` time units all
+    jobs are moved back to the top level to prevent starvation. Jobs returning from
+    I/O or migrated between cores keep their level."""
+
+    preempt_on_arrival = True  # A job arriving in a higher level takes the CPU
+
+    def __init__(self, quanta, boost_period=None):
+        self.quanta = list(quanta)
+        self.queues = [deque() for _ in self.quanta]
+        self.boost_period = boost_period
+        self.next_boost = boost_period
+        self.count = 0
+
+    def __len__(self):
+        return self.count
+
+    def add(self, job, now):
+        # A job that has run before (back from I/O, or moved from another core) keeps its
+        # level and the allotment used there, unless a boost fell due while it was away
+        if job.first_run is None or (self.boost_period and now >= job.key):
+            job.level = 0
+            job.used = 0
+        self.queues[job.level].append(job)
+        self.count += 1
+
+    def block(self, job, now):
+        job.key = self.next_boost  # Boosts fall on multiples of boost_period on every core
+
+    def pick(self, now):
+        self._maybe_boost(now)
+        for queue in self.queues:
+            if queue:
+                self.count -= 1
+                return queue.popleft()
+
+    def time_slice(self, job, now):
+        return self.quanta[job.level] - job.used
+
+    def charge(self, job, ran, now):
+        job.used += ran
+
+    def requeue(self, job, ran, now):
+        if self.boost_period and now >= self.next_boost:
+            # A boost happened while the job was running
+            self._maybe_boost(now)
+            job.level, job.used = 0, 0
+            self.queues[0].append(job)
+        elif job.used >= self.quanta[job.level]:
+            # Allotment used up: demote (the lowest level is round robin)
+            job.level = min(job.level + 1, len(self.quanta) - 1)
+            job.used = 0
+            self.queues[job.level].append(job)
+        else:
+            # Preempted by an arrival: resume first in its level with the rest of its slice
+            self.queues[job.level].appendleft(job)
+        self.count += 1
+
+    def _maybe_boost(self, now):
+        if not self.boost_period or now < self.next_boost:
+            return
+        top = self.queues[0]
+        for queue in self.queues[1:]:
+            while queue:
+                job = queue.popleft()
+                job.level, job.used = 0, 0
+                top.append(job)
+        self.next_boost = (now // self.boost_period + 1) * self.boost_period
+
+
+def mlfq_scheduling(processes, levels=3, base_quantum=2, quanta=None, boost_period=50, progress=None):
+    """Multilevel Feedback Queue (MLFQ) Scheduling Algorithm
+
+    By default level i gets a quantum of base_quantum * 2**i; pass `quanta` to set
+    each level explicitly. `boost_period=None` disables the priority boost.
+    """
+    if not processes:
+        return ResultTable.from_rows([], RESULT_COLUMNS), []
+
+    if quanta is None:
+        quanta = [base_quantum * 2 ** level for level in range(levels)]
+
+    rows, gantt_chart = simulate(processes, MLFQPolicy(quanta, boost_period), progress=progress)
+
+    table = ResultTable.from_rows(rows, RESULT_COLUMNS)
+    return table, gantt_chart
@@ -0,0 +1,163 @@
+import math
+import multiprocessing
+import os
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from statistics import NormalDist
+import numpy as np
+from algorithms import ALGORITHMS, PRIORITY_ALGORITHMS, TUNED_QUANTUM_ALGORITHMS
+from event_core import simulate, rows_to_columns
+from metrics import compute_metrics, HIGHER_IS_BETTER
+from policies import make_policy
+from shared_workload import SharedArray, SharedArrayHandle, publish_workload, attach_workload
+from sim_logging import get_logger
+
+logger = get_logger(__name__)
+
+NOISE_DISTRIBUTIONS = ("lognormal", "normal", "uniform")
+DEFAULT_METRICS = ("avg_waiting", "avg_turnaround", "avg_response")
+
+# Replicates per task handed to a worker; each task has its own seed so results do not
+# depend on the number of workers
+CHUNK_SIZE = 50
+
+MonteCarloResult = namedtuple("MonteCarloResult", [
+    "algorithms", "metrics", "samples", "summary", "win_rate", "mean_rank", "rank_metric", "baseline_best",
+])
+
+
+def perturb(arrivals, bursts, rng, replicates, burst_noise=0.2, arrival_noise=0.0, distribution="lognormal"):
+    """Noisy copies of the arrival and burst vectors, shape (replicates, n) each
+
+    Bursts are scaled by a multiplicative factor with spread `burst_noise` (lognormal
+    factors keep the mean burst unchanged). Arrivals are shifted by additive noise with
+    spread `arrival_noise` time units. Values are rounded to whole time units.
+    """
+    if distribution not in NOISE_DISTRIBUTIONS:
+        raise ValueError(f"Unknown noise distribution: {distribution}")
+    arrivals = np.asarray(arrivals, dtype=float)
+    bursts = np.asarray(bursts, dtype=float)
+    shape = (replicates, len(bursts))
+
+    if distribution == "lognormal":
+        factor = rng.lognormal(-burst_noise ** 2 / 2, burst_noise, shape) if burst_noise else np.ones(shape)
+        shift = rng.normal(0, arrival_noise, shape) if arrival_noise else np.zeros(shape)
+    elif distribution == "normal":
+        factor = 1 + rng.normal(0, burst_noise, shape)
+        shift = rng.normal(0, arrival_noise, shape)
+    else:
+        factor = rng.uniform(1 - burst_noise, 1 + burst_noise, shape)
+        shift = rng.uniform(-arrival_noise, arrival_noise, shape)
+
+    noisy_bursts = np.maximum(1, np.rint(bursts * factor)).astype(np.int64)
+    noisy_arrivals = np.maximum(0, np.rint(arrivals + shift)).astype(np.int64)
+    return noisy_arrivals, noisy_bursts
+
+
+def monte_carlo_analysis(processes, algorithms=None, replicates=1000, burst_noise=0.2, arrival_noise=0.0,
+                         distribution="lognormal", metrics=DEFAULT_METRICS, rank_metric="avg_waiting",
+                         time_quantum=2, confidence=0.95, workers=None, seed=0, progress=None):
+    """Run every algorithm on `replicates` perturbed copies of `processes`
+
+    Returns a MonteCarloResult with the raw samples (replicates x algorithms x metrics),
+    a {algorithm: {metric: (mean, low, high)}} confidence-interval summary and, for
+    `rank_metric`, how often each algorithm ranked first (win_rate) and its mean rank.
+    """
+    if algorithms is None:
+        has_priority = all(p.get("Priority", "-") != "-" for p in processes)
+        algorithms = [a for a in ALGORITHMS if has_priority or a not in PRIORITY_ALGORITHMS]
+    metrics = list(metrics)
+    if rank_metric not in metrics:
+        metrics.append(rank_metric)
+
+    # One seed per chunk, derived from a single SeedSequence: reproducible for any worker count
+    counts = [min(CHUNK_SIZE, replicates - start) for start in range(0, replicates, CHUNK_SIZE)]
+    seeds = np.random.SeedSequence(seed).spawn(len(counts))
+    noise = (burst_noise, arrival_noise, distribution)
+    starts = np.cumsum([0] + counts[:-1]).tolist()
+
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(counts) <= 1:
+        chunks = []
+        for i, (seed_seq, count) in enumerate(zip(seeds, counts)):
+            chunks.append(_run_chunk((processes, algorithms, time_quantum, metrics, noise, seed_seq, count, None, 0)))
+            if progress:
+                progress(i + 1, len(counts))
+        samples = np.concatenate(chunks) if chunks else np.empty((0, len(algorithms), len(metrics)))
+    else:
+        # The workload and the samples live in shared memory, so each task only pickles small handles
+        with publish_workload(processes) as workload, \
+                SharedArray.create((replicates, len(algorithms), len(metrics))) as shared_samples:
+            tasks = [(workload.handle, algorithms, time_quantum, metrics, noise, seed_seq, count, shared_samples.handle, start)
+                     for seed_seq, count, start in zip(seeds, counts, starts)]
+            # Spawned (not forked) workers: this runs on a GUI worker thread, and forking a threaded process can deadlock
+            with ProcessPoolExecutor(max_workers=min(workers, len(tasks)),
+                                     mp_context=multiprocessing.get_context("spawn")) as executor:
+                futures = [executor.submit(_run_chunk, task) for task in tasks]
+                try:
+                    for done, future in enumerate(as_completed(futures), 1):
+                        future.result()
+                        if progress:
+                            progress(done, len(tasks))
+                except BaseException:
+                    executor.shutdown(wait=False, cancel_futures=True)
+                    raise
+            samples = shared_samples.array.copy()
+
+    z = NormalDist().inv_cdf(0.5 + confidence / 2)
+    summary = {}
+    for j, algorithm in enumerate(algorithms):
+        summary[algorithm] = {}
+        for k, metric in enumerate(metrics):
+            values = samples[:, j, k]
+            mean = float(values.mean())
+            half = z * float(values.std(ddof=1)) / math.sqrt(len(values)) if len(values) > 1 else 0.0
+            summary[algorithm][metric] = (mean, mean - half, mean + half)
+
+    # Rank of each algorithm within every replicate (0 = best); ties share the better rank
+    scores = samples[:, :, metrics.index(rank_metric)]
+    if rank_metric in HIGHER_IS_BETTER:
+        scores = -scores
+    ranks = (scores[:, :, None] > scores[:, None, :]).sum(axis=2)
+    win_rate = {algorithm: float(np.mean(ranks[:, j] == 0)) for j, algorithm in enumerate(algorithms)}
+    mean_rank = {algorithm: float(ranks[:, j].mean()) + 1 for j, algorithm in enumerate(algorithms)}
+
+    baseline = {algorithm: _evaluate(processes, algorithm, time_quantum)[rank_metric] for algorithm in algorithms}
+    baseline_best = (max if rank_metric in HIGHER_IS_BETTER else min)(baseline, key=baseline.get)
+
+    logger.debug("monte carlo finished: %d replicates, baseline best %s wins %.0f%%",
+                 replicates, baseline_best, win_rate[baseline_best] * 100)
+    return MonteCarloResult(algorithms, metrics, samples, summary, win_rate, mean_rank, rank_metric, baseline_best)
+
+
+def _run_chunk(task):
+    """Simulate one chunk of replicates (runs in a worker process)
+
+    `source` is the process list or the handle of a published workload. With a
+    `samples` handle the chunk is written into rows start:start+count of that shared
+    array instead of being returned.
+    """
+    source, algorithms, time_quantum, metrics, noise, seed_seq, count, samples, start = task
+    processes = attach_workload(source) if isinstance(source, SharedArrayHandle) else source
+    burst_noise, arrival_noise, distribution = noise
+    rng = np.random.default_rng(seed_seq)
+    arrivals, bursts = perturb([p["Arrival"] for p in processes], [p["Burst"] for p in processes],
+                               rng, count, burst_noise, arrival_noise, distribution)
+
+    out = np.empty((count, len(algorithms), len(metrics)))
+    for r in range(count):
+        replicate = [dict(p, Arrival=a, Burst=b)
+                     for p, a, b in zip(processes, arrivals[r].tolist(), bursts[r].tolist())]
+        for j, algorithm in enumerate(algorithms):
+            result = _evaluate(replicate, algorithm, time_quantum)
+            out[r, j] = [result[metric] for metric in metrics]
+    if samples is None:
+        return out
+    with SharedArray.attach(samples) as shared:
+        shared.array[start:start + count] = out
+
+
+def _evaluate(processes, algorithm, time_quantum):
+    quantum = time_quantum if algorithm in TUNED_QUANTUM_ALGORITHMS else None
+    rows, gantt = simulate(processes, make_policy(algorithm, quantum))
+    return compute_metrics(rows_to_columns(rows), gantt)
@@ -1,7 +1,19 @@
-import pandas as pd
+from aging import aging_priority_scheduling
+from result_table import ResultTable
 
-def priority_scheduling(processes):
-    """Priority Scheduling (Non-Preemptive)"""
+def priority_scheduling(processes, progress=None, aging_rate=None):
+    """Priority Scheduling (Non-Preemptive)
+
+    With `aging_rate`, a waiting process's priority number drops by aging_rate per
+    time unit waited, so low-priority processes cannot starve.
+    """
+
+    if aging_rate:
+        rows, _ = aging_priority_scheduling(processes, aging_rate, preemptive=False, progress=progress)
+        completed = [[pid, arrival, burst, priority, completion - burst, completion, turnaround, waiting, response]
+                     for pid, arrival, burst, priority, completion, turnaround, waiting, response in rows]
+        completed.sort(key=lambda row: row[4])  # Execution order, like the static version
+        return ResultTable.from_rows(completed, ["PID", "Arrival", "Burst", "Priority", "Start", "Completion", "Turnaround", "Waiting", "Response"])
 
     # Convert list of dictionaries to list of tuples (PID, Arrival, Burst, Priority)
     processes = [(p["PID"], p["Arrival"], p["Burst"], p["Priority"]) for p in processes]
@@ -36,5 +48,8 @@ def priority_scheduling(processes):
 
         time = completion_time  # Move time forward
 
-    df = pd.DataFrame(completed, columns=["PID", "Arrival", "Burst", "Priority", "Start", "Completion", "Turnaround", "Waiting", "Response"])
-    return df
+        if progress:
+            progress(len(completed), len(processes))  # Report completed processes
+
+    table = ResultTable.from_rows(completed, ["PID", "Arrival", "Burst", "Priority", "Start", "Completion", "Turnaround", "Waiting", "Response"])
+    return table
@@ -1,22 +1,46 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-import pandas as pd
 import numpy as np
 import copy
+import logging
 from fcfs import fcfs_scheduling
 from sjf import sjf_scheduling
 from srtf import srtf_scheduling
-from round_robin import round_robin_scheduling
 from non_preemptive_priority import priority_scheduling
 from preemptive_priority import preemptive_priority_scheduling
+from mlfq import mlfq_scheduling
+from cfs import cfs_scheduling
+from stride import stride_scheduling
+from aging import DEFAULT_AGING_RATE
+from metrics import compute_metrics, best_algorithm, format_metric, METRIC_LABELS
+from pareto import pareto_search, configuration_grid, DEFAULT_SWITCH_COSTS
+from recommender import default_recommender, CALIBRATION_METRICS
+from monte_carlo import monte_carlo_analysis, NOISE_DISTRIBUTIONS
+from simulation_worker import SimulationWorker
+from chart_canvas import ChartCanvas
+from event_core import simulate, rows_to_columns, SimulationPruned
+from policies import RoundRobinPolicy
+from realtime import realtime_scheduling, deadline_metrics, DEADLINE_METRIC_LABELS
+from sim_logging import get_logger, log_event
+
+logger = get_logger(__name__)
+
+# Above this many processes the optimizer predicts a ranking and only simulates the top candidates
+QUICK_ANALYSIS_THRESHOLD = 20000
+QUICK_ANALYSIS_TOP_K = 3
+
+# Result names used by the optimizer for the scheduler names in algorithms.ALGORITHMS
+DISPLAY_NAMES = {"Priority(Non-Preemptive)": "Priority (NP)", "Priority(Preemptive)": "Priority (P)"}
 
 class AlgorithmOptimizerWindow:
-    def __init__(self, parent, processes):
+    def __init__(self, parent, processes, results=None):
+        """`results` ({algorithm: metrics} from an earlier analysis, e.g. a saved session) skips re-analysis"""
         self.parent = parent
         # Create a deep copy of processes to avoid modifying original data
         self.processes = copy.deepcopy(processes)
+        # Absolute deadlines, when given, add deadline-miss metrics and the real-time algorithms
+        self.deadlines = {p["PID"]: p["Deadline"] for p in self.processes if p.get("Deadline") is not None}
+        self.metric_labels = {**METRIC_LABELS, **DEADLINE_METRIC_LABELS} if self.deadlines else METRIC_LABELS
         
         # Create new window
         self.window = tk.Toplevel(parent)
@@ -65,6 +89,14 @@ class AlgorithmOptimizerWindow:
         # Tab 3: Graph Analysis
         graph_tab = tk.Frame(self.notebook)
         self.notebook.add(graph_tab, text="Graph Analysis")
+
+        # Tab 4: Pareto Front (trade-offs across algorithms, quanta and switch costs)
+        pareto_tab = tk.Frame(self.notebook)
+        self.notebook.add(pareto_tab, text="Pareto Front")
+
+        # Tab 5: Sensitivity (how robust the ranking is when bursts are only estimates)
+        sensitivity_tab = tk.Frame(self.notebook)
+        self.notebook.add(sensitivity_tab, text="Sensitivity")
         
         # Setup Overview Tab
         overview_frame = tk.Frame(overview_tab, padx=10, pady=10)
@@ -126,7 +158,8 @@ class AlgorithmOptimizerWindow:
         )
         metric_selection_frame.pack(fill="x", pady=15)
         
-        self.selected_metric = tk.StringVar(value="avg_turnaround")
+        # With deadlines, rank on how many of them are missed
+        self.selected_metric = tk.StringVar(value="miss_ratio" if self.deadlines else "avg_turnaround")
         
         metrics_options = [
             ("Average Turnaround Time", "avg_turnaround"),
@@ -141,10 +174,24 @@ class AlgorithmOptimizerWindow:
                 value=value,
                 variable=self.selected_metric,
                 font=("Arial", 11),
-                command=self.update_recommendation,
+                command=self.on_metric_change,
                 padx=20
             )
             rb.grid(row=0, column=i, padx=10, sticky="w")
+
+        # Any other metric from the metrics engine (percentiles, fairness, utilization, ...)
+        tk.Label(metric_selection_frame, text="Other metric:", font=("Arial", 11)).grid(
+            row=1, column=0, padx=10, pady=(10, 0), sticky="e")
+        self.metric_label_var = tk.StringVar(value=self.metric_labels[self.selected_metric.get()])
+        metric_dropdown = ttk.Combobox(
+            metric_selection_frame,
+            textvariable=self.metric_label_var,
+            values=list(self.metric_labels.values()),
+            state="readonly",
+            width=30
+        )
+        metric_dropdown.grid(row=1, column=1, columnspan=2, padx=10, pady=(10, 0), sticky="w")
+        metric_dropdown.bind("<<ComboboxSelected>>", self.on_metric_selected)
         
         # Setup Details Tab
         details_frame = tk.Frame(details_tab, padx=10, pady=10)
@@ -156,7 +203,7 @@ class AlgorithmOptimizerWindow:
         
         self.results_tree = ttk.Treeview(
             table_frame, 
-            columns=("Algorithm", "Avg Turnaround", "Avg Waiting", "Avg Response"),
+            columns=("Algorithm", "Avg Turnaround", "Avg Waiting", "Avg Response", "P95 Waiting", "Max Waiting", "Utilization"),
             show="headings",
             height=8
         )
@@ -166,12 +213,18 @@ class AlgorithmOptimizerWindow:
         self.results_tree.heading("Avg Turnaround", text="Avg Turnaround Time")
         self.results_tree.heading("Avg Waiting", text="Avg Waiting Time")
         self.results_tree.heading("Avg Response", text="Avg Response Time")
+        self.results_tree.heading("P95 Waiting", text="P95 Waiting Time")
+        self.results_tree.heading("Max Waiting", text="Max Waiting Time")
+        self.results_tree.heading("Utilization", text="CPU Utilization")
         
         # Configure column widths
         self.results_tree.column("Algorithm", width=150, anchor="center")
         self.results_tree.column("Avg Turnaround", width=150, anchor="center")
         self.results_tree.column("Avg Waiting", width=150, anchor="center")
         self.results_tree.column("Avg Response", width=150, anchor="center")
+        self.results_tree.column("P95 Waiting", width=120, anchor="center")
+        self.results_tree.column("Max Waiting", width=120, anchor="center")
+        self.results_tree.column("Utilization", width=120, anchor="center")
         
         # Add scrollbars to results tree
         y_scrollbar = ttk.Scrollbar(table_frame, orient="vertical", command=self.results_tree.yview)
@@ -202,6 +255,66 @@ class AlgorithmOptimizerWindow:
         self.chart_container = tk.Frame(self.graph_frame)
         self.chart_container.pack(fill="both", expand=True, pady=10)
         
+        # Setup Pareto Tab
+        pareto_frame = tk.Frame(pareto_tab, padx=10, pady=10)
+        pareto_frame.pack(fill="both", expand=True)
+
+        pareto_controls = tk.Frame(pareto_frame)
+        pareto_controls.pack(fill="x", pady=5)
+        tk.Label(pareto_controls, text="Context switch costs:", font=("Arial", 11)).pack(side="left")
+        self.switch_costs_entry = tk.Entry(pareto_controls, width=15)
+        self.switch_costs_entry.insert(0, ", ".join(str(c) for c in DEFAULT_SWITCH_COSTS))
+        self.switch_costs_entry.pack(side="left", padx=5)
+        tk.Button(pareto_controls, text="Find Pareto Front", command=self.find_pareto_front,
+                  bg="#3498db", fg="white").pack(side="left", padx=10)
+
+        self.pareto_summary = tk.Label(pareto_frame, text="Configurations on the front are not beaten on waiting, "
+                                       "response, turnaround and context switches all at once.",
+                                       font=("Arial", 10), justify="left", anchor="w")
+        self.pareto_summary.pack(fill="x", pady=5)
+
+        pareto_columns = ("Configuration", "Avg Waiting", "Avg Response", "Avg Turnaround", "Context Switches")
+        self.pareto_tree = ttk.Treeview(pareto_frame, columns=pareto_columns, show="headings", height=12)
+        for col in pareto_columns:
+            self.pareto_tree.heading(col, text=col)
+            self.pareto_tree.column(col, width=260 if col == "Configuration" else 130, anchor="center")
+        self.pareto_tree.pack(fill="both", expand=True, pady=5)
+
+        # Setup Sensitivity Tab (Monte Carlo replicates with noisy bursts/arrivals)
+        sensitivity_frame = tk.Frame(sensitivity_tab, padx=10, pady=10)
+        sensitivity_frame.pack(fill="both", expand=True)
+
+        sensitivity_controls = tk.Frame(sensitivity_frame)
+        sensitivity_controls.pack(fill="x", pady=5)
+        self.sensitivity_entries = {}
+        for i, (label, default) in enumerate([("Replicates:", "1000"), ("Burst noise:", "0.2"), ("Arrival noise:", "0")]):
+            tk.Label(sensitivity_controls, text=label, font=("Arial", 11)).grid(row=0, column=2 * i, padx=5, sticky="e")
+            entry = tk.Entry(sensitivity_controls, width=8)
+            entry.insert(0, default)
+            entry.grid(row=0, column=2 * i + 1, padx=5, sticky="w")
+            self.sensitivity_entries[label.rstrip(":")] = entry
+        tk.Label(sensitivity_controls, text="Distribution:", font=("Arial", 11)).grid(row=0, column=6, padx=5, sticky="e")
+        self.noise_distribution = ttk.Combobox(sensitivity_controls, values=NOISE_DISTRIBUTIONS, state="readonly", width=10)
+        self.noise_distribution.set(NOISE_DISTRIBUTIONS[0])
+        self.noise_distribution.grid(row=0, column=7, padx=5)
+        self.sensitivity_button = tk.Button(sensitivity_controls, text="Run Sensitivity Analysis",
+                                            command=self.run_sensitivity_analysis, bg="#3498db", fg="white")
+        self.sensitivity_button.grid(row=0, column=8, padx=10)
+
+        self.sensitivity_summary = tk.Label(sensitivity_frame, text="Bursts and arrivals are perturbed with random noise "
+                                            "and every algorithm is re-run on each replicate.",
+                                            font=("Arial", 10), justify="left", anchor="w", wraplength=900)
+        self.sensitivity_summary.pack(fill="x", pady=5)
+
+        sensitivity_columns = ("Algorithm", "Mean", "Confidence Interval", "Win Rate", "Mean Rank")
+        self.sensitivity_tree = ttk.Treeview(sensitivity_frame, columns=sensitivity_columns, show="headings", height=12)
+        for col in sensitivity_columns:
+            self.sensitivity_tree.heading(col, text=col)
+            self.sensitivity_tree.column(col, width=170, anchor="center")
+        self.sensitivity_tree.pack(fill="both", expand=True, pady=5)
+        self.sensitivity_worker = None
+        self.window.protocol("WM_DELETE_WINDOW", self.close)
+
         # Button frame at bottom
         button_frame = tk.Frame(self.window, bg="#f5f5f5", padx=15, pady=10)
         button_frame.pack(fill="x", side="bottom")
@@ -210,7 +323,7 @@ class AlgorithmOptimizerWindow:
         close_button = tk.Button(
             button_frame,
             text="Close",
-            command=self.window.destroy,
+            command=self.close,
             bg="#e74c3c",
             fg="white",
             relief=tk.RAISED,
@@ -234,7 +347,13 @@ class AlgorithmOptimizerWindow:
         self.results = {}
         
         # Analyze algorithms if processes exist
-        if self.processes:
+        if results:
+            self.results = dict(results)
+            self.show_analysis()
+            self.status_var.set("Restored analysis from the saved session")
+        elif len(self.processes) > QUICK_ANALYSIS_THRESHOLD:
+            self.quick_analysis()
+        elif self.processes:
             self.analyze_algorithms()
         else:
             self.status_var.set("No processes to analyze")
@@ -264,8 +383,8 @@ class AlgorithmOptimizerWindow:
             
             # SRTF
             self.status_var.set("Analyzing SRTF algorithm...")
-            srtf_result, _ = srtf_scheduling(copy.deepcopy(self.processes))
-            srtf_metrics = self.calculate_metrics(srtf_result)
+            srtf_result, srtf_gantt = srtf_scheduling(copy.deepcopy(self.processes))
+            srtf_metrics = self.calculate_metrics(srtf_result, srtf_gantt)
             self.results["SRTF"] = srtf_metrics
             
             # Try different time quantums for Round Robin (dynamic range)
@@ -276,23 +395,48 @@ class AlgorithmOptimizerWindow:
             max_burst = max(int(p.get("Burst", 1)) for p in self.processes)
             # Try time quantums from 1 up to max burst time (capped at 20 to avoid excessive calculations)
             tq_range = range(1, min(max_burst + 1, 21))
+            # Start near the 80th-percentile burst (the usual rule of thumb) so the bound tightens early
+            guess = int(np.percentile([int(p.get("Burst", 1)) for p in self.processes], 80))
             
-            for tq in tq_range:
+            pruned_quanta = 0
+            for tq in sorted(tq_range, key=lambda q: (abs(q - guess), q)):
                 self.status_var.set(f"Analyzing Round Robin (q={tq}) algorithm...")
-                rr_result, _ = round_robin_scheduling(copy.deepcopy(self.processes), tq)
-                metrics = self.calculate_metrics(rr_result)
+                # Stop a run as soon as its waiting time so far can no longer beat the best quantum
+                try:
+                    rr_rows, rr_gantt = simulate(self.processes, RoundRobinPolicy(tq),
+                                                 cost_bound=best_rr_score)
+                except SimulationPruned:
+                    pruned_quanta += 1
+                    continue
+                metrics = self.calculate_metrics(rows_to_columns(rr_rows), rr_gantt)
                 
                 # Track the best RR configuration - using waiting time as the standard metric
-                if metrics["avg_waiting"] < best_rr_score:
+                if (metrics["avg_waiting"], tq) < (best_rr_score, best_rr_tq):
                     best_rr_metrics = metrics
                     best_rr_tq = tq
                     best_rr_score = metrics["avg_waiting"]
+            log_event(logger, logging.DEBUG, "round robin sweep finished", quanta=len(tq_range),
+                      pruned=pruned_quanta, best_quantum=best_rr_tq)
             
             # Add only the best RR configuration to results
             if best_rr_metrics:
                 rr_algo_name = f"RR (TQ={best_rr_tq})"
                 self.results[rr_algo_name] = best_rr_metrics
             
+            # MLFQ (base quantum taken from the best Round Robin quantum)
+            self.status_var.set("Analyzing MLFQ algorithm...")
+            mlfq_result, mlfq_gantt = mlfq_scheduling(copy.deepcopy(self.processes), base_quantum=best_rr_tq)
+            self.results["MLFQ"] = self.calculate_metrics(mlfq_result, mlfq_gantt)
+
+            # CFS and Stride (priorities, when present, act as nice values / ticket shares)
+            self.status_var.set("Analyzing CFS algorithm...")
+            cfs_result, cfs_gantt = cfs_scheduling(copy.deepcopy(self.processes))
+            self.results["CFS"] = self.calculate_metrics(cfs_result, cfs_gantt)
+
+            self.status_var.set("Analyzing Stride algorithm...")
+            stride_result, stride_gantt = stride_scheduling(copy.deepcopy(self.processes))
+            self.results["Stride"] = self.calculate_metrics(stride_result, stride_gantt)
+
             # Priority algorithms (only if all processes have priority values)
             if has_priority:
                 # Priority (Non-Preemptive)
@@ -303,15 +447,62 @@ class AlgorithmOptimizerWindow:
                 
                 # Priority (Preemptive)
                 self.status_var.set("Analyzing Priority (Preemptive) algorithm...")
-                pp_result, _ = preemptive_priority_scheduling(copy.deepcopy(self.processes))
-                pp_metrics = self.calculate_metrics(pp_result)
+                pp_result, pp_gantt = preemptive_priority_scheduling(copy.deepcopy(self.processes))
+                pp_metrics = self.calculate_metrics(pp_result, pp_gantt)
                 self.results["Priority (P)"] = pp_metrics
+
+                # Aging variants bound the waiting time of low-priority processes
+                self.status_var.set("Analyzing Priority with aging...")
+                pnp_aging_result = priority_scheduling(copy.deepcopy(self.processes), aging_rate=DEFAULT_AGING_RATE)
+                self.results["Priority (NP, Aging)"] = self.calculate_metrics(pnp_aging_result)
+                pp_aging_result, pp_aging_gantt = preemptive_priority_scheduling(copy.deepcopy(self.processes), aging_rate=DEFAULT_AGING_RATE)
+                self.results["Priority (P, Aging)"] = self.calculate_metrics(pp_aging_result, pp_aging_gantt)
+
+            # Real-time algorithms (only if some process has a deadline)
+            if self.deadlines:
+                for algorithm, name in (("EDF", "EDF"), ("Rate Monotonic", "RM")):
+                    self.status_var.set(f"Analyzing {algorithm} algorithm...")
+                    rt_result, rt_gantt = realtime_scheduling(copy.deepcopy(self.processes), algorithm)
+                    self.results[name] = self.calculate_metrics(rt_result, rt_gantt)
                 
         except Exception as e:
+            logger.exception("Algorithm analysis failed")
             self.status_var.set(f"Error in algorithm analysis: {e}")
             messagebox.showerror("Analysis Error", f"An error occurred during analysis: {e}")
             return
             
+        self.show_analysis()
+        self.status_var.set("Analysis complete")
+
+    def quick_analysis(self):
+        """Predict the ranking from workload features and simulate only the top candidates"""
+        metric = self.selected_metric.get()
+        if metric not in CALIBRATION_METRICS:
+            metric = "avg_waiting"
+        self.status_var.set("Calibrating recommender and predicting the best algorithms...")
+        try:
+            recommendation = default_recommender().recommend(self.processes, metric, top_k=QUICK_ANALYSIS_TOP_K)
+        except Exception as e:
+            logger.exception("Quick analysis failed")
+            self.status_var.set(f"Error in algorithm analysis: {e}")
+            messagebox.showerror("Analysis Error", f"An error occurred during analysis: {e}")
+            return
+
+        self.results = {}
+        for algorithm, metrics in recommendation.confirmed.items():
+            if algorithm == "Round Robin":
+                name = f"RR (TQ={recommendation.time_quantum})"
+            else:
+                name = DISPLAY_NAMES.get(algorithm, algorithm)
+            self.results[name] = metrics
+        self.show_analysis()
+        self.status_var.set(
+            f"Quick analysis of {len(self.processes)} processes: simulated the top {len(self.results)} "
+            f"of {len(recommendation.ranking)} predicted algorithms"
+        )
+
+    def show_analysis(self):
+        """Fill the results table, recommendation and graph from self.results"""
         # Clear existing results in tree
         for item in self.results_tree.get_children():
             self.results_tree.delete(item)
@@ -323,7 +514,10 @@ class AlgorithmOptimizerWindow:
                     algo,
                     f"{metrics['avg_turnaround']:.2f}",
                     f"{metrics['avg_waiting']:.2f}",
-                    f"{metrics['avg_response']:.2f}"
+                    f"{metrics['avg_response']:.2f}",
+                    f"{metrics['p95_waiting']:.2f}",
+                    f"{metrics['max_waiting']:.2f}",
+                    format_metric("utilization", metrics["utilization"])
                 )
             )
         
@@ -331,26 +525,153 @@ class AlgorithmOptimizerWindow:
         self.update_recommendation()
         # Update graph
         self.update_graph()
-        self.status_var.set("Analysis complete")
+
+    def find_pareto_front(self):
+        """Search algorithms x quanta x switch costs and list the non-dominated configurations"""
+        try:
+            switch_costs = [int(c) for c in self.switch_costs_entry.get().replace(",", " ").split()]
+            if not switch_costs or min(switch_costs) < 0:
+                raise ValueError
+        except ValueError:
+            messagebox.showerror("Input Error", "Context switch costs must be non-negative integers, e.g. 0, 1, 2")
+            return
+
+        grid = configuration_grid(self.processes, switch_costs=switch_costs)
+
+        def progress(done, total):
+            self.status_var.set(f"Searching Pareto front... {done}/{total} configurations")
+            self.window.update_idletasks()
+
+        try:
+            search = pareto_search(copy.deepcopy(self.processes), grid, progress=progress)
+        except Exception as e:
+            logger.exception("Pareto search failed")
+            messagebox.showerror("Analysis Error", f"An error occurred during the Pareto search: {e}")
+            return
+
+        for item in self.pareto_tree.get_children():
+            self.pareto_tree.delete(item)
+        front = sorted(search.front, key=lambda config: search.evaluated[config]["avg_waiting"])
+        for config in front:
+            metrics = search.evaluated[config]
+            self.pareto_tree.insert("", "end", values=(
+                config.label,
+                f"{metrics['avg_waiting']:.2f}",
+                f"{metrics['avg_response']:.2f}",
+                f"{metrics['avg_turnaround']:.2f}",
+                format_metric("context_switches", metrics["context_switches"])
+            ))
+
+        self.pareto_summary.config(
+            text=f"{len(front)} of {len(grid)} configurations are Pareto-optimal "
+                 f"({len(search.pruned)} dominated configurations were stopped early)."
+        )
+        self.status_var.set("Pareto search complete")
+
+    def close(self):
+        """Stop any background analysis and close the window"""
+        if self.sensitivity_worker is not None:
+            self.sensitivity_worker.cancel()
+            self.sensitivity_worker = None  # Stops the pending _poll_sensitivity, which would touch destroyed widgets
+        self.window.destroy()
+
+    def run_sensitivity_analysis(self):
+        """Start a Monte Carlo run in the background for the selected metric"""
+        try:
+            replicates = int(self.sensitivity_entries["Replicates"].get())
+            burst_noise = float(self.sensitivity_entries["Burst noise"].get())
+            arrival_noise = float(self.sensitivity_entries["Arrival noise"].get())
+            if replicates < 2 or burst_noise < 0 or arrival_noise < 0:
+                raise ValueError
+        except ValueError:
+            messagebox.showerror("Input Error", "Replicates must be an integer of at least 2 and noise levels non-negative numbers")
+            return
+        if self.sensitivity_worker is not None:
+            return
+
+        if self.selected_metric.get() in DEADLINE_METRIC_LABELS:
+            messagebox.showerror("Input Error", "Sensitivity analysis does not support deadline metrics")
+            return
+        self.sensitivity_metric = self.selected_metric.get()
+        self.sensitivity_worker = SimulationWorker(
+            monte_carlo_analysis, copy.deepcopy(self.processes), replicates=replicates, burst_noise=burst_noise,
+            arrival_noise=arrival_noise, distribution=self.noise_distribution.get(), rank_metric=self.sensitivity_metric
+        )
+        self.sensitivity_button.config(state=tk.DISABLED)
+        self.status_var.set("Running sensitivity analysis...")
+        self.sensitivity_worker.start()
+        self.window.after(100, self._poll_sensitivity)
+
+    def _poll_sensitivity(self):
+        """Poll the Monte Carlo worker from the Tk event loop"""
+        if self.sensitivity_worker is None:
+            return
+        for kind, payload in self.sensitivity_worker.poll():
+            if kind == "progress":
+                done, total = payload
+                self.status_var.set(f"Running sensitivity analysis... {done}/{total} batches")
+                continue
+            self.sensitivity_worker = None
+            self.sensitivity_button.config(state=tk.NORMAL)
+            if kind == "done":
+                self.show_sensitivity(payload)
+            else:
+                self.status_var.set(f"Sensitivity analysis failed: {payload}")
+            return
+        self.window.after(100, self._poll_sensitivity)
+
+    def show_sensitivity(self, analysis):
+        """Show confidence intervals and ranking robustness for the ranked metric"""
+        metric = analysis.rank_metric
+        for item in self.sensitivity_tree.get_children():
+            self.sensitivity_tree.delete(item)
+        for algorithm in sorted(analysis.algorithms, key=analysis.mean_rank.get):
+            mean, low, high = analysis.summary[algorithm][metric]
+            self.sensitivity_tree.insert("", "end", values=(
+                DISPLAY_NAMES.get(algorithm, algorithm),
+                format_metric(metric, mean),
+                f"[{format_metric(metric, low)}, {format_metric(metric, high)}]",
+                f"{analysis.win_rate[algorithm] * 100:.1f}%",
+                f"{analysis.mean_rank[algorithm]:.2f}"
+            ))
+
+        best = analysis.baseline_best
+        self.sensitivity_summary.config(
+            text=f"Ranked on {self.metric_labels[metric]} over {len(analysis.samples)} replicates. "
+                 f"{DISPLAY_NAMES.get(best, best)}, the best algorithm without noise, is still best in "
+                 f"{analysis.win_rate[best] * 100:.1f}% of replicates."
+        )
+        self.status_var.set("Sensitivity analysis complete")
+
+    def on_metric_selected(self, event=None):
+        """Rank on the metric chosen in the 'Other metric' dropdown"""
+        label = self.metric_label_var.get()
+        self.selected_metric.set(next(key for key, text in self.metric_labels.items() if text == label))
+        self.on_metric_change()
+
+    def on_metric_change(self):
+        """Update the recommendation and graph for the newly selected metric"""
+        self.metric_label_var.set(self.metric_labels[self.selected_metric.get()])
+        self.update_recommendation()
+        self.update_graph()
 
     def update_recommendation(self):
         """Update the recommendation based on selected metric"""
         if not self.results:
             return
         
-        # Get the selected metric to use for recommendation
+        # Get the selected metric to use for recommendation (quick analysis has no deadline metrics)
         selected_metric = self.selected_metric.get()
+        if any(selected_metric not in metrics for metrics in self.results.values()):
+            selected_metric = "avg_waiting"
+            self.selected_metric.set(selected_metric)
+            self.metric_label_var.set(self.metric_labels[selected_metric])
         
-        # Find algorithm with the best individual metric
-        best_algo_name = min(self.results.items(), key=lambda x: x[1][selected_metric])[0]
+        # Find algorithm with the best individual metric (lowest, or highest for fairness/utilization/throughput)
+        best_algo_name = best_algorithm(self.results, selected_metric)
         
         # Map the metric to a user-friendly name
-        metric_names = {
-            "avg_turnaround": "Average Turnaround Time",
-            "avg_waiting": "Average Waiting Time",
-            "avg_response": "Average Response Time"
-        }
-        metric_name = metric_names[selected_metric]
+        metric_name = self.metric_labels[selected_metric]
         
         best_algo_metrics = self.results[best_algo_name]
         
@@ -366,8 +687,17 @@ class AlgorithmOptimizerWindow:
             f"This algorithm achieves the following metrics:\n"
             f"• Average Waiting Time: {best_algo_metrics['avg_waiting']:.2f}\n"
             f"• Average Turnaround Time: {best_algo_metrics['avg_turnaround']:.2f}\n"
-            f"• Average Response Time: {best_algo_metrics['avg_response']:.2f}\n\n"
+            f"• Average Response Time: {best_algo_metrics['avg_response']:.2f}\n"
+            f"• P95 / P99 Waiting Time: {best_algo_metrics['p95_waiting']:.2f} / {best_algo_metrics['p99_waiting']:.2f}\n"
+            f"• Maximum Waiting Time: {best_algo_metrics['max_waiting']:.2f}\n"
+            f"• CPU Utilization: {format_metric('utilization', best_algo_metrics['utilization'])}, "
+            f"Throughput: {format_metric('throughput', best_algo_metrics['throughput'])}, "
+            f"Fairness: {format_metric('fairness', best_algo_metrics['fairness'])}\n\n"
         )
+        if selected_metric not in ("avg_waiting", "avg_turnaround", "avg_response"):
+            details_text = details_text.rstrip("\n") + (
+                f"\n• {metric_name}: {format_metric(selected_metric, best_algo_metrics[selected_metric])}\n\n"
+            )
         
         self.recommendation_details.config(text=details_text)
         
@@ -423,6 +753,52 @@ class AlgorithmOptimizerWindow:
                 "Advantages: Responsive to high-priority processes.\n"
                 "Disadvantages: More context switches, potential starvation of lower-priority processes."
             ),
+            "MLFQ": (
+                "Multilevel Feedback Queue (MLFQ) keeps several round robin queues with growing time quanta. "
+                "New processes start in the top queue; a process that uses up its quantum moves down a level, "
+                "and all processes are periodically boosted back to the top queue.\n\n"
+                "Advantages: Favors short and interactive processes without knowing burst times in advance.\n"
+                "Disadvantages: Many tuning parameters (levels, quanta, boost period)."
+            ),
+            "CFS": (
+                "CFS-style fair scheduling always runs the process with the smallest virtual runtime. "
+                "Virtual runtime grows more slowly for high-priority processes, so each process receives "
+                "a CPU share proportional to its weight.\n\n"
+                "Advantages: Fair sharing with bounded latency, no starvation.\n"
+                "Disadvantages: Does not favor short jobs, more context switches than FCFS."
+            ),
+            "Stride": (
+                "Stride scheduling gives each process tickets and a stride inversely proportional to them. "
+                "The process with the smallest pass value runs for one quantum and its pass advances by its stride.\n\n"
+                "Advantages: Deterministic proportional-share scheduling (the exact version of lottery scheduling).\n"
+                "Disadvantages: Ignores burst lengths, so average waiting time is usually higher than SJF."
+            ),
+            "Priority (NP, Aging)": (
+                "Non-preemptive Priority scheduling with aging: the longer a process waits, the better its effective priority "
+                f"(the priority number drops by {DEFAULT_AGING_RATE} per time unit waited).\n\n"
+                "Advantages: Keeps the benefits of priorities while bounding how long low-priority processes wait.\n"
+                "Disadvantages: High-priority processes may wait a little longer than with static priorities."
+            ),
+            "Priority (P, Aging)": (
+                "Preemptive Priority scheduling with aging: waiting processes gain priority over time and preempt the "
+                "running process once their effective priority becomes better.\n\n"
+                "Advantages: Responsive to high-priority processes without starving low-priority ones.\n"
+                "Disadvantages: Additional context switches when priorities cross."
+            ),
+            "EDF": (
+                "Earliest Deadline First (EDF) always runs the ready process with the earliest absolute deadline, "
+                "preempting the running process when one with an earlier deadline arrives. "
+                "Processes without a deadline only run when no process with a deadline is ready.\n\n"
+                "Advantages: Optimal on one CPU: if any schedule meets every deadline, EDF does (up to 100% utilization).\n"
+                "Disadvantages: Under overload, misses cascade unpredictably; ignores burst lengths."
+            ),
+            "RM": (
+                "Rate Monotonic (RM) is fixed-priority real-time scheduling: the shorter a process's period (here its "
+                "relative deadline, Deadline - Arrival), the higher its priority, with preemption on arrival. "
+                "With deadlines shorter than periods this is Deadline Monotonic.\n\n"
+                "Advantages: Simple, predictable priorities; the optimal fixed-priority order.\n"
+                "Disadvantages: Can miss deadlines below 100% utilization (guaranteed only under the Liu & Layland bound)."
+            ),
             "RR (TQ=)": (
                 "This is Round Robin that has been selected as the most suitable configuration "
                 "for the given set of processes. The time quantum represents the maximum time "
@@ -450,25 +826,53 @@ class AlgorithmOptimizerWindow:
             explanation += f"\n\nPerformance Metrics:\n"
             explanation += f"• Average Waiting Time: {metrics['avg_waiting']:.2f}\n"
             explanation += f"• Average Turnaround Time: {metrics['avg_turnaround']:.2f}\n"
-            explanation += f"• Average Response Time: {metrics['avg_response']:.2f}"
+            explanation += f"• Average Response Time: {metrics['avg_response']:.2f}\n"
+            explanation += f"• P95 / P99 Waiting Time: {metrics['p95_waiting']:.2f} / {metrics['p99_waiting']:.2f}\n"
+            explanation += f"• Maximum Waiting Time: {metrics['max_waiting']:.2f}\n"
+            explanation += f"• CPU Utilization: {format_metric('utilization', metrics['utilization'])}\n"
+            explanation += f"• Throughput: {format_metric('throughput', metrics['throughput'])} processes per time unit\n"
+            explanation += f"• Jain's Fairness Index: {format_metric('fairness', metrics['fairness'])}\n"
+            explanation += f"• Context Switches: {format_metric('context_switches', metrics['context_switches'])}"
+            for metric, label in DEADLINE_METRIC_LABELS.items():
+                if metric in metrics:
+                    explanation += f"\n• {label}: {format_metric(metric, metrics[metric])}"
         
         self.explanation_text.insert("1.0", explanation)
         self.explanation_text.config(state="disabled")
 
     def update_graph(self):
-        """Update the bar graph comparing all algorithms"""
-        # Clear existing chart
-        for widget in self.chart_container.winfo_children():
-            widget.destroy()
-            
+        """Update the bar graph comparing all algorithms
+
+        The figure is kept between updates. Bars are only rebuilt when the results
+        change; switching metrics just moves the highlight line and relabels its legend
+        entry, which are blitted over the cached background.
+        """
         if not self.results:
             return
-            
-        # Create figure and axis
-        fig, ax = plt.subplots(figsize=(8, 5))
-            
-        # Prepare data for plotting
+        chart = ChartCanvas.of(self.chart_container, figsize=(8, 5))
         algorithms = list(self.results.keys())
+        rebuilt = chart.artists.get("results") is not self.results
+        if rebuilt:
+            self.draw_comparison(chart, algorithms)
+
+        # Get selected metric to highlight best algorithm
+        selected_metric = self.selected_metric.get()
+        best_algo = best_algorithm(self.results, selected_metric)
+        best_idx = algorithms.index(best_algo)
+        chart.artists["highlight"].set_xdata([best_idx, best_idx])
+        chart.artists["highlight_label"].set_text(f'Best for {self.metric_labels[selected_metric]}: {best_algo}')
+
+        if rebuilt:
+            chart.draw()
+        else:
+            chart.blit()
+
+    def draw_comparison(self, chart, algorithms):
+        """Rebuild the comparison bars for a new set of results"""
+        ax = chart.figure.axes[0] if chart.figure.axes else chart.figure.add_subplot()
+        ax.clear()
+
+        # Prepare data for plotting
         turnaround_times = [self.results[algo]["avg_turnaround"] for algo in algorithms]
         waiting_times = [self.results[algo]["avg_waiting"] for algo in algorithms]
         response_times = [self.results[algo]["avg_response"] for algo in algorithms]
@@ -481,41 +885,27 @@ class AlgorithmOptimizerWindow:
         ax.bar(x, waiting_times, bar_width, label='Avg Waiting', color='#e74c3c')
         ax.bar(x + bar_width, response_times, bar_width, label='Avg Response', color='#2ecc71')
         
-        # Get selected metric to highlight best algorithm
-        selected_metric = self.selected_metric.get()
-        
-        # Map the metric names
-        metric_map = {
-            "avg_turnaround": "Turnaround Time",
-            "avg_waiting": "Waiting Time",
-            "avg_response": "Response Time"
-        }
-        
-        best_algo = min(self.results.items(), key=lambda x: x[1][selected_metric])[0]
-        highlight_label = f'Best for {metric_map[selected_metric]}: {best_algo}'
-            
-        best_idx = algorithms.index(best_algo)
-        ax.axvline(x=best_idx, color='#f39c12', linestyle='--', alpha=0.7, label=highlight_label)
+        # Best-algorithm highlight and the legend naming it change with the metric, so they are animated
+        highlight = ax.axvline(x=0, color='#f39c12', linestyle='--', alpha=0.7, label='Best', animated=True)
         
         ax.set_xlabel('Algorithm')
         ax.set_ylabel('Time (units)')
         ax.set_title('CPU Scheduling Algorithm Comparison')
         ax.set_xticks(x)
         ax.set_xticklabels(algorithms, rotation=45, ha='right')
-        ax.legend(loc='upper right')
+        handles, labels = ax.get_legend_handles_labels()
+        legend = ax.legend(handles, labels, loc='upper right')
+        legend.set_animated(True)
         ax.grid(True, linestyle='--', alpha=0.7)
         
-        plt.tight_layout()
-        
-        # Embed the plot in tkinter window
-        canvas = FigureCanvasTkAgg(fig, master=self.chart_container)
-        canvas.draw()
-        canvas.get_tk_widget().pack(fill="both", expand=True)
+        chart.figure.tight_layout()
+        chart.artists.update(results=self.results, highlight=highlight,
+                             highlight_label=legend.get_texts()[handles.index(highlight)])
+        chart.animated = [highlight, legend]
 
-    def calculate_metrics(self, result_df):
-        """Calculate average metrics from a result dataframe"""
-        return {
-            "avg_turnaround": result_df["Turnaround"].mean(),
-            "avg_waiting": result_df["Waiting"].mean(),
-            "avg_response": result_df["Response"].mean() if "Response" in result_df.columns else result_df["Waiting"].mean()
-        }
\ No newline at end of file
+    def calculate_metrics(self, result, gantt=None):
+        """Calculate averages, tail percentiles and system metrics (and deadline misses) from a result table"""
+        metrics = compute_metrics(result, gantt)
+        if self.deadlines:
+            metrics.update(deadline_metrics(result, self.deadlines))
+        return metrics
\ No newline at end of file
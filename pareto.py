@@ -0,0 +1,115 @@
+import logging
+import math
+from collections import namedtuple
+from algorithms import ALGORITHMS, PRIORITY_ALGORITHMS, QUANTUM_ALGORITHMS
+from event_core import simulate, rows_to_columns, SimulationPruned
+from metrics import compute_metrics, HIGHER_IS_BETTER
+from policies import make_policy
+from sim_logging import get_logger, log_event
+
+logger = get_logger(__name__)
+
+# Objectives traded off by default (all minimised)
+OBJECTIVES = ("avg_waiting", "avg_response", "avg_turnaround", "context_switches")
+
+# Context switch overheads (time units) tried by default
+DEFAULT_SWITCH_COSTS = (0, 1, 2)
+
+
+class Configuration(namedtuple("Configuration", ["algorithm", "time_quantum", "switch_cost"])):
+    """One point of the search grid: an algorithm, its quantum (if any) and a switch cost"""
+
+    @property
+    def label(self):
+        name = self.algorithm if self.time_quantum is None else f"{self.algorithm} (TQ={self.time_quantum})"
+        return f"{name}, switch={self.switch_cost}"
+
+
+ParetoResult = namedtuple("ParetoResult", ["front", "evaluated", "pruned"])
+
+
+def configuration_grid(processes, algorithms=None, quanta=None, switch_costs=DEFAULT_SWITCH_COSTS):
+    """All (algorithm, quantum, switch cost) combinations worth simulating for `processes`"""
+    if algorithms is None:
+        has_priority = all(p.get("Priority", "-") != "-" for p in processes)
+        algorithms = [a for a in ALGORITHMS if has_priority or a not in PRIORITY_ALGORITHMS]
+    if quanta is None:
+        # Same range as the optimizer's Round Robin sweep
+        max_burst = max((int(p["Burst"]) for p in processes), default=1)
+        quanta = range(1, min(max_burst + 1, 21))
+
+    grid = []
+    for switch_cost in switch_costs:
+        for algorithm in algorithms:
+            if algorithm in QUANTUM_ALGORITHMS:
+                grid.extend(Configuration(algorithm, tq, switch_cost) for tq in quanta)
+            else:
+                grid.append(Configuration(algorithm, None, switch_cost))
+    return grid
+
+
+def dominates(a, b, objectives=OBJECTIVES):
+    """True when metrics `a` are no worse than `b` on every objective and better on one"""
+    va, vb = _vector(a, objectives), _vector(b, objectives)
+    return all(x <= y for x, y in zip(va, vb)) and any(x < y for x, y in zip(va, vb))
+
+
+def pareto_front(results, objectives=OBJECTIVES):
+    """Keys of the non-dominated entries in {key: metrics}"""
+    return [key for key, metrics in results.items()
+            if not any(dominates(other, metrics, objectives) for other in results.values() if other is not metrics)]
+
+
+def pareto_search(processes, configurations=None, objectives=OBJECTIVES, prune=True, progress=None):
+    """Simulate every configuration and return the Pareto front over `objectives`
+
+    With `prune`, a run is abandoned as soon as the lower bounds reported by the
+    event core (waiting, response and turnaround accumulated so far, switches so far)
+    are already dominated by a point on the current front: the finished run could
+    only be worse, so it can never join the front.
+    """
+    if configurations is None:
+        configurations = configuration_grid(processes)
+
+    front = []  # (vector, configuration)
+    evaluated = {}
+    pruned = []
+
+    def dominated(vector):
+        return any(all(x <= y for x, y in zip(point, vector)) and any(x < y for x, y in zip(point, vector))
+                   for point, _ in front)
+
+    def bound(lower_bounds):
+        return dominated(_optimistic(lower_bounds, objectives))
+
+    for done, config in enumerate(configurations, 1):
+        policy = make_policy(config.algorithm, config.time_quantum)
+        try:
+            rows, gantt = simulate(processes, policy, switch_cost=config.switch_cost,
+                                   bound=bound if prune and front else None)
+        except SimulationPruned:
+            pruned.append(config)
+        else:
+            metrics = compute_metrics(rows_to_columns(rows), gantt)
+            evaluated[config] = metrics
+            vector = _vector(metrics, objectives)
+            if not dominated(vector):
+                front = [(point, other) for point, other in front
+                         if not (all(x <= y for x, y in zip(vector, point)) and any(x < y for x, y in zip(vector, point)))]
+                front.append((vector, config))
+        if progress:
+            progress(done, len(configurations))
+
+    log_event(logger, logging.DEBUG, "pareto search finished", configurations=len(configurations),
+              front=len(front), pruned=len(pruned))
+    return ParetoResult([config for _, config in front], evaluated, pruned)
+
+
+def _vector(metrics, objectives):
+    """Objective values oriented so that smaller is always better"""
+    return tuple(-metrics[obj] if obj in HIGHER_IS_BETTER else metrics[obj] for obj in objectives)
+
+
+def _optimistic(lower_bounds, objectives):
+    """Best value each objective can still reach given the event core's partial bounds"""
+    return tuple(lower_bounds.get(obj, -math.inf if obj in HIGHER_IS_BETTER else 0.0) for obj in objectives)
@@ -0,0 +1,127 @@
+import heapq
+from collections import deque
+from event_core import Policy
+from mlfq import MLFQPolicy
+from cfs import CFSPolicy
+from stride import StridePolicy
+from aging import AgingPriorityPolicy
+from realtime import EDFPolicy, RateMonotonicPolicy
+
+
+class FCFSPolicy(Policy):
+    """First-Come First-Served: run jobs to completion in arrival order"""
+
+    def __init__(self):
+        self.queue = deque()
+
+    def __len__(self):
+        return len(self.queue)
+
+    def add(self, job, now):
+        self.queue.append(job)
+
+    def pick(self, now):
+        return self.queue.popleft()
+
+    def putback(self, job, now):
+        self.queue.appendleft(job)
+
+
+class KeyedPolicy(Policy):
+    """Heap of ready jobs ordered by (key(job), arrival order)"""
+
+    def __init__(self):
+        self.heap = []
+
+    def __len__(self):
+        return len(self.heap)
+
+    def key(self, job):
+        raise NotImplementedError
+
+    def add(self, job, now):
+        heapq.heappush(self.heap, (self.key(job), job.seq, job))
+
+    def pick(self, now):
+        return heapq.heappop(self.heap)[2]
+
+
+class SJFPolicy(KeyedPolicy):
+    """Shortest Job First (non-preemptive)"""
+
+    def key(self, job):
+        return job.burst
+
+
+class SRTFPolicy(KeyedPolicy):
+    """Shortest Remaining Time First: re-evaluated whenever a job arrives"""
+
+    preempt_on_arrival = True
+
+    def key(self, job):
+        return job.remaining
+
+
+class PriorityPolicy(KeyedPolicy):
+    """Static priority scheduling (smaller number = higher priority)"""
+
+    def __init__(self, preemptive=False):
+        super().__init__()
+        self.preempt_on_arrival = preemptive
+
+    def key(self, job):
+        return job.priority
+
+
+class RoundRobinPolicy(Policy):
+    """Round Robin with a fixed time quantum"""
+
+    def __init__(self, time_quantum):
+        self.time_quantum = time_quantum
+        self.queue = deque()
+
+    def __len__(self):
+        return len(self.queue)
+
+    def add(self, job, now):
+        self.queue.append(job)
+
+    def pick(self, now):
+        return self.queue.popleft()
+
+    def putback(self, job, now):
+        self.queue.appendleft(job)
+
+    def time_slice(self, job, now):
+        return self.time_quantum
+
+
+def make_policy(algorithm, time_quantum=None, aging_rate=None, **options):
+    """Build the event-core policy for an algorithm name from algorithms.ALGORITHMS or REALTIME_ALGORITHMS"""
+    if algorithm == "FCFS":
+        return FCFSPolicy()
+    if algorithm == "SJF":
+        return SJFPolicy()
+    if algorithm == "SRTF":
+        return SRTFPolicy()
+    if algorithm == "Round Robin":
+        return RoundRobinPolicy(time_quantum)
+    if algorithm in ("Priority(Non-Preemptive)", "Priority(Preemptive)"):
+        preemptive = algorithm == "Priority(Preemptive)"
+        if aging_rate:
+            return AgingPriorityPolicy(aging_rate, preemptive)
+        return PriorityPolicy(preemptive)
+    if algorithm == "MLFQ":
+        levels = options.get("levels", 3)
+        base_quantum = time_quantum or options.get("base_quantum", 2)
+        quanta = options.get("quanta") or [base_quantum * 2 ** level for level in range(levels)]
+        return MLFQPolicy(quanta, options.get("boost_period", 50))
+    if algorithm == "CFS":
+        return CFSPolicy(options.get("target_latency", 6), options.get("min_granularity", 1))
+    if algorithm == "Stride":
+        return StridePolicy(time_quantum or options.get("quantum", 1))
+    if algorithm == "EDF":
+        return EDFPolicy()
+    if algorithm == "Rate Monotonic":
+        return RateMonotonicPolicy()
+    raise ValueError(f"Unknown scheduling algorithm: {algorithm}")
@@ -1,10 +1,19 @@
-import pandas as pd
 import numpy as np
+from aging import aging_priority_scheduling
+from result_table import ResultTable
 
-def preemptive_priority_scheduling(processes):
-    """ Preemptive Priority Scheduling Algorithm """
+def preemptive_priority_scheduling(processes, progress=None, aging_rate=None):
+    """ Preemptive Priority Scheduling Algorithm
+
+    With `aging_rate`, a waiting process's priority number drops by aging_rate per
+    time unit waited, so low-priority processes cannot starve.
+    """
     if not processes:
-        return pd.DataFrame(columns=["PID", "Arrival", "Burst", "Priority", "Completion", "Turnaround", "Waiting", "Response"]), []
+        return ResultTable.from_rows([], ["PID", "Arrival", "Burst", "Priority", "Completion", "Turnaround", "Waiting", "Response"]), []
+
+    if aging_rate:
+        rows, gantt_chart = aging_priority_scheduling(processes, aging_rate, preemptive=True, progress=progress)
+        return ResultTable.from_rows(rows, ["PID", "Arrival", "Burst", "Priority", "Completion", "Turnaround", "Waiting", "Response"]), gantt_chart
     
     # Convert list of dictionaries to list of tuples (PID, Arrival, Burst, Priority)
     processes = [(p["PID"], p["Arrival"], p["Burst"], p["Priority"]) for p in processes]
@@ -77,8 +86,11 @@ def preemptive_priority_scheduling(processes):
             
             turnaround_time[selected_pid] = completion_time[selected_pid] - arrival_time
             waiting_time[selected_pid] = turnaround_time[selected_pid] - burst_time
+
+            if progress:
+                progress(completed, n)  # Report completed processes
     
-    # Prepare the result in a DataFrame
+    # Prepare the result rows
     result = []
     for p in processes:
         pid, arrival, burst, priority = p
@@ -93,7 +105,7 @@ def preemptive_priority_scheduling(processes):
             first_response[pid] - arrival
         ])
     
-    # Create the DataFrame
-    df = pd.DataFrame(result, columns=["PID", "Arrival", "Burst", "Priority", "Completion", "Turnaround", "Waiting", "Response"])
+    # Create the result table
+    table = ResultTable.from_rows(result, ["PID", "Arrival", "Burst", "Priority", "Completion", "Turnaround", "Waiting", "Response"])
     
-    return df, gantt_chart
\ No newline at end of file
+    return table, gantt_chart
\ No newline at end of file
@@ -1,26 +1,61 @@
-from tkinter import ttk
+from sim_logging import get_logger
+
+logger = get_logger(__name__)
+
 
 class ProcessManager:
-    def __init__(self, treeview):
+    def __init__(self, table):
         self.processes = []
-        self.treeview = treeview
+        self.pids = set()  # Fast duplicate check for large process lists
+        self.table = table
 
-    def add_process(self, pid, arrival, burst, priority="-"):
-        """Add a process to the internal list and display it in the TreeView."""
+    def add_process(self, pid, arrival, burst, priority="-", history=None, deadline=None):
+        """Add a process to the internal list and display it in the table.
+
+        `history` is an optional list of past bursts used for burst prediction and
+        `deadline` an optional absolute deadline for the real-time algorithms.
+        """
         # Check for duplicate PIDs
-        if any(process["PID"] == pid for process in self.processes):
-            print(f"Error: Process with PID {pid} already exists!")
+        if pid in self.pids:
+            logger.warning("Process with PID %s already exists!", pid)
             return False
         process = {"PID": pid, "Arrival": arrival, "Burst": burst, "Priority": priority}
+        if history:
+            process["History"] = list(history)
+        if deadline is not None:
+            process["Deadline"] = deadline
         self.processes.append(process)
+        self.pids.add(pid)
 
-        # Insert into TreeView
-        self.treeview.insert("", "end", values=(pid, arrival, burst, priority))
+        # Append to the virtual table (only visible rows get Treeview items)
+        self.table.append_row((pid, arrival, burst, priority))
         return True
 
+    def set_processes(self, processes):
+        """Replace the process list (e.g. from a saved session) and refresh the table once."""
+        self.processes = list(processes)
+        self.pids = {p["PID"] for p in self.processes}
+        self.refresh_table()
+
     def get_processes(self):
         return self.processes
 
     def remove_process(self, pid):
         """Remove process from internal list."""
-        self.processes = [p for p in self.processes if p["PID"] != pid]
+        self.remove_processes([pid])
+
+    def remove_processes(self, pids):
+        """Remove several processes and refresh the table once."""
+        pids = set(pids)
+        self.processes = [p for p in self.processes if p["PID"] not in pids]
+        self.pids -= pids
+        self.refresh_table()
+
+    def clear(self):
+        self.processes.clear()
+        self.pids.clear()
+        self.table.clear()
+
+    def refresh_table(self):
+        """Rebuild the table columns from the process list."""
+        self.table.set_data({col: [p[col] for p in self.processes] for col in ("PID", "Arrival", "Burst", "Priority")})
@@ -0,0 +1,176 @@
+import heapq
+import math
+from collections import namedtuple
+from functools import reduce
+import numpy as np
+from event_core import Policy, simulate, RESULT_COLUMNS
+from result_table import ResultTable
+
+# Deadline metrics added by deadline_metrics(), with their display names
+DEADLINE_METRIC_LABELS = {
+    "miss_ratio": "Deadline Miss Ratio",
+    "deadline_misses": "Deadline Misses",
+    "max_lateness": "Maximum Lateness",
+    "avg_tardiness": "Average Tardiness",
+}
+
+# Outcome of a schedulability test; `bound` is the utilization bound it compares against
+# and `response_times` the worst-case response time per task (fixed-priority analysis only)
+Schedulability = namedtuple("Schedulability", ["schedulable", "utilization", "test", "bound", "response_times"])
+
+
+class EDFPolicy(Policy):
+    """Earliest Deadline First: the ready job with the earliest absolute deadline runs
+
+    Preemptive: a job arriving with an earlier deadline takes the CPU. Jobs without a
+    deadline run after every job that has one, in arrival order.
+    """
+
+    preempt_on_arrival = True
+
+    def __init__(self):
+        self.heap = []
+
+    def __len__(self):
+        return len(self.heap)
+
+    def priority(self, job):
+        return math.inf if job.deadline is None else job.deadline
+
+    def add(self, job, now):
+        heapq.heappush(self.heap, (self.priority(job), job.seq, job))
+
+    def pick(self, now):
+        return heapq.heappop(self.heap)[2]
+
+
+class RateMonotonicPolicy(EDFPolicy):
+    """Rate Monotonic: fixed priorities, the shorter the period the higher the priority
+
+    The period is read as the job's relative deadline (Deadline - Arrival), which is the
+    period for the implicit-deadline jobs periodic_jobs() releases by default; with
+    shorter deadlines this is Deadline Monotonic, the optimal fixed-priority order.
+    """
+
+    def priority(self, job):
+        return math.inf if job.deadline is None else job.deadline - job.arrival
+
+
+def periodic_jobs(tasks, horizon, first_pid=1):
+    """Process list of the jobs released by periodic tasks in [0, horizon)
+
+    Each task is a dict with "Period" and "Burst" (worst-case execution time) and
+    optionally "Phase" (first release, default 0), a relative "Deadline" (default: the
+    period), "Priority" and a "Task" name. Jobs get an absolute "Deadline" and the name
+    of their task.
+    """
+    releases = []
+    for index, task in enumerate(tasks):
+        period = task["Period"]
+        relative_deadline = task.get("Deadline") or period
+        for release in range(task.get("Phase", 0), horizon, period):
+            releases.append((release, index, relative_deadline))
+    releases.sort()
+
+    return [{"PID": pid, "Arrival": release, "Burst": tasks[index]["Burst"],
+             "Priority": tasks[index].get("Priority", "-"), "Deadline": release + relative_deadline,
+             "Task": tasks[index].get("Task", f"T{index + 1}")}
+            for pid, (release, index, relative_deadline) in enumerate(releases, first_pid)]
+
+
+def hyperperiod(tasks):
+    """Least common multiple of the task periods (the schedule repeats after it)"""
+    return reduce(math.lcm, (task["Period"] for task in tasks), 1)
+
+
+def task_utilization(tasks):
+    return sum(task["Burst"] / task["Period"] for task in tasks)
+
+
+def edf_schedulable(tasks):
+    """Exact EDF test for synchronous periodic tasks on one CPU
+
+    With implicit deadlines EDF meets every deadline iff U <= 1. With shorter deadlines
+    the processor demand criterion is checked at every absolute deadline up to the
+    first point where the demand can no longer exceed the supply.
+    """
+    u = task_utilization(tasks)
+    deadlines = [task.get("Deadline") or task["Period"] for task in tasks]
+    if all(d >= task["Period"] for d, task in zip(deadlines, tasks)) or u > 1:
+        return Schedulability(u <= 1, u, "utilization", 1.0, None)
+
+    # Demand can only exceed supply before L (or the hyperperiod, if that is shorter)
+    limit = hyperperiod(tasks) + max(deadlines)
+    if u < 1:
+        limit = min(limit, max(max(deadlines), sum((task["Period"] - d) * task["Burst"] / task["Period"]
+                                                   for d, task in zip(deadlines, tasks)) / (1 - u)))
+    checkpoints = sorted({d + k * task["Period"] for d, task in zip(deadlines, tasks)
+                          for k in range(int((limit - d) // task["Period"]) + 1) if d + k * task["Period"] <= limit})
+    for t in checkpoints:
+        demand = sum((math.floor((t - d) / task["Period"]) + 1) * task["Burst"]
+                     for d, task in zip(deadlines, tasks) if t >= d)
+        if demand > t:
+            return Schedulability(False, u, "processor demand", 1.0, None)
+    return Schedulability(True, u, "processor demand", 1.0, None)
+
+
+def rm_schedulable(tasks):
+    """Exact fixed-priority test (response-time analysis) for Rate/Deadline Monotonic
+
+    Tasks are ordered by relative deadline; the worst-case response time of each task
+    is the fixed point of R = C + sum(ceil(R / T_j) * C_j) over higher-priority tasks.
+    The Liu & Layland bound n(2^(1/n) - 1) is reported as `bound`: utilizations below
+    it are always schedulable.
+    """
+    n = len(tasks)
+    u = task_utilization(tasks)
+    bound = n * (2 ** (1 / n) - 1) if n else 1.0
+    order = sorted(range(n), key=lambda i: (tasks[i].get("Deadline") or tasks[i]["Period"], i))
+    response_times = [None] * n
+    for rank, i in enumerate(order):
+        burst, deadline = tasks[i]["Burst"], tasks[i].get("Deadline") or tasks[i]["Period"]
+        higher = [tasks[j] for j in order[:rank]]
+        response = burst + sum(task["Burst"] for task in higher)
+        while response <= deadline:
+            updated = burst + sum(math.ceil(response / task["Period"]) * task["Burst"] for task in higher)
+            if updated == response:
+                break
+            response = updated
+        response_times[i] = response
+    schedulable = all(response <= (task.get("Deadline") or task["Period"])
+                      for response, task in zip(response_times, tasks))
+    return Schedulability(schedulable, u, "response-time analysis", bound, response_times)
+
+
+def deadline_metrics(result, deadlines):
+    """Deadline misses of a result table, for the processes in {PID: absolute deadline}
+
+    Lateness is Completion - Deadline (negative when early); tardiness is the positive
+    part. Without deadlines every metric is 0.
+    """
+    pids = np.asarray(result["PID"]).tolist()
+    completions = np.asarray(result["Completion"], dtype=float)
+    index = [i for i, pid in enumerate(pids) if deadlines.get(pid) is not None]
+    if not index:
+        return {metric: 0.0 for metric in DEADLINE_METRIC_LABELS}
+    lateness = completions[index] - np.array([deadlines[pids[i]] for i in index], dtype=float)
+    misses = int(np.count_nonzero(lateness > 0))
+    return {
+        "miss_ratio": misses / len(index),
+        "deadline_misses": misses,
+        "max_lateness": float(lateness.max()),
+        "avg_tardiness": float(np.maximum(lateness, 0).mean()),
+    }
+
+
+def realtime_scheduling(processes, algorithm="EDF", progress=None):
+    """EDF or Rate Monotonic scheduling on the event core; returns (result, gantt_chart)
+
+    The result has a Deadline column ("-" for processes without one).
+    """
+    policy = RateMonotonicPolicy() if algorithm == "Rate Monotonic" else EDFPolicy()
+    rows, gantt_chart = simulate(processes, policy, progress=progress)
+    result = ResultTable.from_rows(rows, RESULT_COLUMNS)
+    deadlines = {p["PID"]: p.get("Deadline") for p in processes}
+    result["Deadline"] = [deadlines[pid] if deadlines[pid] is not None else "-" for pid in result["PID"].tolist()]
+    return result, gantt_chart
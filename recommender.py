@@ -0,0 +1,193 @@
+import functools
+from collections import namedtuple
+import numpy as np
+from algorithms import ALGORITHMS, PRIORITY_ALGORITHMS, TUNED_QUANTUM_ALGORITHMS
+from batch import WorkloadBatch, stack_workloads, batch_round_robin, batch_metrics
+from event_core import simulate, rows_to_columns
+from metrics import compute_metrics, rank_algorithms
+from policies import make_policy
+from workload_generator import random_workload
+from sim_logging import get_logger
+
+logger = get_logger(__name__)
+
+# Workload features, all computed in one vectorized pass over the trace
+FEATURES = ("burst_cv", "arrival_burstiness", "priority_spread", "load_factor")
+
+# Metrics the calibration data can predict rankings for
+CALIBRATION_METRICS = ("avg_waiting", "avg_turnaround", "avg_response")
+
+# Quanta tried per calibration workload, same cap as the optimizer's sweep
+MAX_QUANTUM = 20
+
+Recommendation = namedtuple("Recommendation", ["algorithm", "time_quantum", "metrics", "ranking", "confirmed"])
+
+
+def workload_features(processes):
+    """Shape of a workload: burst CV, inter-arrival CV, priority CV and offered load"""
+    arrivals = np.fromiter((p["Arrival"] for p in processes), dtype=float, count=len(processes))
+    bursts = np.fromiter((p["Burst"] for p in processes), dtype=float, count=len(processes))
+    priorities = np.fromiter((np.nan if p.get("Priority", "-") == "-" else p["Priority"] for p in processes),
+                             dtype=float, count=len(processes))
+    if not len(processes):
+        return dict.fromkeys(FEATURES, 0.0)
+
+    gaps = np.diff(np.sort(arrivals))
+    span = float(arrivals.max() - arrivals.min()) + float(bursts.mean())
+    known = priorities[~np.isnan(priorities)]
+    return {
+        "burst_cv": _cv(bursts),
+        "arrival_burstiness": _cv(gaps),
+        "priority_spread": _cv(known) if len(known) else 0.0,
+        "load_factor": float(bursts.sum()) / span,
+    }
+
+
+def best_quanta(workloads):
+    """Round Robin quantum with the lowest average waiting time for each workload (smallest on ties)
+
+    Every (workload, quantum) pair of the sweep is one row of a single batched run.
+    """
+    sweeps = [np.arange(1, min(max(int(p["Burst"]) for p in processes), MAX_QUANTUM) + 1) for processes in workloads]
+    counts = [len(quanta) for quanta in sweeps]
+    batch = WorkloadBatch(*(np.repeat(array, counts, axis=0) for array in stack_workloads(workloads)))
+    waiting = batch_metrics(batch, *batch_round_robin(batch, np.concatenate(sweeps)))["avg_waiting"]
+    ends = np.cumsum(counts)
+    return [int(quanta[np.argmin(waiting[end - len(quanta):end])]) for quanta, end in zip(sweeps, ends)]
+
+
+def benchmark_workload(processes, algorithms=ALGORITHMS, best_quantum=None):
+    """Simulate every algorithm on `processes`; returns ({algorithm: metrics}, best RR quantum)
+
+    `best_quantum` skips the quantum sweep when it is already known (see best_quanta).
+    """
+    if best_quantum is None:
+        best_quantum = best_quanta([processes])[0]
+
+    results = {}
+    for algorithm in algorithms:
+        results[algorithm] = _run(processes, algorithm, _quantum_for(algorithm, best_quantum))
+    return results, best_quantum
+
+
+class Recommender:
+    """k-nearest-neighbour predictor of algorithm rankings from workload features
+
+    Each calibration observation stores the workload features, every algorithm's
+    metrics relative to the best algorithm on that workload, and the best Round
+    Robin quantum relative to the mean burst. A prediction averages the k closest
+    observations (in log-scaled, standardised feature space).
+    """
+
+    def __init__(self, k=5):
+        self.k = k
+        self.features = []
+        self.scores = []  # (len(ALGORITHMS), len(CALIBRATION_METRICS)) relative scores
+        self.quantum_ratios = []
+
+    def __len__(self):
+        return len(self.features)
+
+    def observe(self, processes, results, best_quantum):
+        """Add one benchmark run ({algorithm: metrics}) to the calibration data"""
+        features = workload_features(processes)
+        table = np.full((len(ALGORITHMS), len(CALIBRATION_METRICS)), np.nan)
+        for i, algorithm in enumerate(ALGORITHMS):
+            if algorithm in results:
+                table[i] = [results[algorithm][metric] for metric in CALIBRATION_METRICS]
+        # Scores relative to the best algorithm (+1 keeps all-zero workloads finite)
+        table = (table + 1) / (np.nanmin(table, axis=0) + 1)
+        mean_burst = float(np.mean([p["Burst"] for p in processes]))
+
+        self.features.append([features[name] for name in FEATURES])
+        self.scores.append(table)
+        self.quantum_ratios.append(best_quantum / mean_burst)
+        return self
+
+    def calibrate(self, workloads=60, size=150, seed=0):
+        """Benchmark synthetic workloads spread over the feature space"""
+        rng = np.random.default_rng(seed)
+        generated = [random_workload(size, rng) for _ in range(workloads)]
+        for processes, best_quantum in zip(generated, best_quanta(generated)):
+            results, best_quantum = benchmark_workload(processes, best_quantum=best_quantum)
+            self.observe(processes, results, best_quantum)
+        logger.debug("recommender calibrated on %d workloads", len(self))
+        return self
+
+    def predict(self, processes, metric="avg_waiting"):
+        """Predicted [(algorithm, relative score)] best first, and the predicted RR quantum"""
+        if not len(self):
+            raise ValueError("Recommender has no calibration data")
+        if metric not in CALIBRATION_METRICS:
+            raise ValueError(f"Recommender can only rank on {', '.join(CALIBRATION_METRICS)}")
+
+        features = workload_features(processes)
+        known = np.log1p(np.asarray(self.features))
+        mean, std = known.mean(axis=0), known.std(axis=0) + 1e-9
+        query = (np.log1p([features[name] for name in FEATURES]) - mean) / std
+        distance = np.linalg.norm((known - mean) / std - query, axis=1)
+        nearest = np.argsort(distance)[:self.k]
+        weights = 1 / (distance[nearest] + 1e-6)
+
+        column = CALIBRATION_METRICS.index(metric)
+        scores = np.asarray(self.scores)[nearest, :, column]
+        predicted = np.nansum(scores * weights[:, None], axis=0) / np.sum(~np.isnan(scores) * weights[:, None], axis=0)
+
+        has_priority = all(p.get("Priority", "-") != "-" for p in processes)
+        ranking = sorted(((algorithm, float(score)) for algorithm, score in zip(ALGORITHMS, predicted)
+                          if has_priority or algorithm not in PRIORITY_ALGORITHMS), key=lambda item: item[1])
+
+        ratio = float(np.exp(np.average(np.log(np.asarray(self.quantum_ratios)[nearest]), weights=weights)))
+        max_burst = max(int(p["Burst"]) for p in processes)
+        mean_burst = float(np.mean([p["Burst"] for p in processes]))
+        quantum = int(min(max(round(ratio * mean_burst), 1), max_burst, MAX_QUANTUM))
+        return ranking, quantum
+
+    def recommend(self, processes, metric="avg_waiting", top_k=3):
+        """Predict a ranking, then simulate only the top-k candidates to confirm the winner
+
+        `time_quantum` in the result is the predicted quantum used for every quantum-based candidate.
+        """
+        ranking, quantum = self.predict(processes, metric)
+        confirmed = {}
+        for algorithm, _ in ranking[:top_k]:
+            confirmed[algorithm] = _run(processes, algorithm, _quantum_for(algorithm, quantum))
+        best = rank_algorithms(confirmed, metric)[0]
+        return Recommendation(best, quantum, confirmed[best], ranking, confirmed)
+
+    def save(self, path):
+        np.savez_compressed(path, k=self.k, features=np.asarray(self.features),
+                            scores=np.asarray(self.scores), quantum_ratios=np.asarray(self.quantum_ratios))
+
+    @classmethod
+    def load(cls, path):
+        data = np.load(path)
+        recommender = cls(int(data["k"]))
+        recommender.features = data["features"].tolist()
+        recommender.scores = list(data["scores"])
+        recommender.quantum_ratios = data["quantum_ratios"].tolist()
+        return recommender
+
+
+@functools.lru_cache(maxsize=1)
+def default_recommender():
+    """Recommender calibrated once per session on the default synthetic sweep"""
+    return Recommender().calibrate()
+
+
+def _quantum_for(algorithm, quantum):
+    """RR and MLFQ take the tuned quantum; Stride keeps its unit quantum like the optimizer"""
+    return quantum if algorithm in TUNED_QUANTUM_ALGORITHMS else None
+
+
+def _run(processes, algorithm, time_quantum):
+    rows, gantt = simulate(processes, make_policy(algorithm, time_quantum))
+    return compute_metrics(rows_to_columns(rows), gantt)
+
+
+def _cv(values):
+    """Coefficient of variation (0 for constant or empty input)"""
+    if not len(values):
+        return 0.0
+    mean = float(values.mean())
+    return float(values.std() / mean) if mean > 0 else 0.0
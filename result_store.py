@@ -0,0 +1,194 @@
+import json
+import os
+import struct
+import zlib
+import numpy as np
+
+# File layout (little endian):
+#   header   magic, version, flags, section count
+#   sections name, dtype, rows, offset, stored bytes, raw bytes  (one entry per column)
+#   data     each column's fixed-width array, 64-byte aligned (zlib stream when compressed)
+MAGIC = b"CPUSCHED"
+VERSION = 1
+HEADER = struct.Struct("<8sHHI")
+SECTION = struct.Struct("<16s8sQQQQ")
+NAME_SIZE = 16
+ALIGNMENT = 64
+FLAG_COMPRESSED = 1
+
+# Stored in integer columns for missing values (Priority "-")
+MISSING = np.iinfo(np.int64).min
+
+GANTT_PREFIX = "gantt."
+GANTT_COLUMNS = ("Start", "Completion", "PID")
+META_SECTION = "meta"
+
+# Bytes handed to zlib at a time, so compressing multi-GB columns needs no second full copy
+COMPRESS_BLOCK = 16 * 1024 * 1024
+
+
+def write_results(path, result, gantt=None, compress=False, metadata=None, extra=None):
+    """Write a result table (DataFrame or {column: values}) and optional Gantt segments
+
+    Integer columns are stored as int32 when they fit, otherwise int64; other numeric
+    columns as float64. "-" (no priority) becomes MISSING. With `compress`, every
+    column is zlib-compressed (smaller file, but reads decompress instead of mapping).
+    `extra` holds additional named arrays, read back with ResultFile.section().
+    """
+    names = list(result.columns if hasattr(result, "columns") else result.keys())
+    sections = [(name, _to_array(result[name])) for name in names]
+    if gantt is not None and len(gantt):
+        segments = gantt[list(GANTT_COLUMNS)].to_numpy() if hasattr(gantt, "to_numpy") else np.asarray(gantt)
+        sections += [(GANTT_PREFIX + name, _to_array(segments[:, i])) for i, name in enumerate(GANTT_COLUMNS)]
+    sections += [(name, _to_array(values)) for name, values in (extra or {}).items()]
+    meta = dict(metadata or {}, columns=names)
+    sections.append((META_SECTION, np.frombuffer(json.dumps(meta, default=_json_default).encode(), dtype=np.uint8)))
+
+    for name, _ in sections:
+        if len(name.encode()) > NAME_SIZE:
+            raise ValueError(f"Section name {name!r} is longer than {NAME_SIZE} bytes")
+
+    table_end = HEADER.size + SECTION.size * len(sections)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(b"\0" * table_end)  # Section table is filled in once offsets are known
+        entries = []
+        for name, values in sections:
+            f.write(b"\0" * (-f.tell() % ALIGNMENT))
+            offset = f.tell()
+            if compress:
+                stored = _write_compressed(f, values)
+            else:
+                values.tofile(f)
+                stored = values.nbytes
+            entries.append(SECTION.pack(name.encode(), values.dtype.str.encode(), len(values), offset, stored, values.nbytes))
+        f.seek(0)
+        f.write(HEADER.pack(MAGIC, VERSION, FLAG_COMPRESSED if compress else 0, len(sections)))
+        f.write(b"".join(entries))
+    os.replace(tmp_path, path)
+
+
+class ResultFile:
+    """Read-only, lazily loaded view of a result file written by write_results()
+
+    Columns of uncompressed files are memory-mapped, so opening is instant and only the
+    pages that are touched are read. Supports `file["Waiting"]`, `file.columns` and
+    `len(file)` like a DataFrame, so it can be passed straight to metrics.compute_metrics.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as f:
+            magic, self.version, flags, count = HEADER.unpack(f.read(HEADER.size))
+            if magic != MAGIC:
+                raise ValueError(f"{path} is not a CPU scheduler result file")
+            if self.version > VERSION:
+                raise ValueError(f"{path} was written by a newer version (format {self.version})")
+            self.sections = {}
+            for _ in range(count):
+                name, dtype, rows, offset, stored, raw = SECTION.unpack(f.read(SECTION.size))
+                self.sections[name.rstrip(b"\0").decode()] = (np.dtype(dtype.rstrip(b"\0").decode()), rows, offset, stored)
+        self.compressed = bool(flags & FLAG_COMPRESSED)
+        self._cache = {}
+        self.metadata = json.loads(self.section(META_SECTION).tobytes())
+        self.columns = self.metadata.pop("columns")
+
+    def __len__(self):
+        return self.sections[self.columns[0]][1] if self.columns else 0
+
+    def __getitem__(self, name):
+        if name not in self.columns:
+            raise KeyError(name)
+        return self.section(name)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self._cache.clear()
+
+    @property
+    def gantt(self):
+        """(n, 3) array of Start, Completion, PID segments, or None"""
+        if GANTT_PREFIX + "Start" not in self.sections:
+            return None
+        return np.column_stack([self.section(GANTT_PREFIX + name) for name in GANTT_COLUMNS])
+
+    def to_dataframe(self):
+        """Result table as a pandas DataFrame (MISSING priorities shown as "-")"""
+        import pandas as pd
+        df = pd.DataFrame({name: np.asarray(self[name]) for name in self.columns})
+        for name in self.columns:
+            if np.issubdtype(df[name].dtype, np.integer) and (df[name] == MISSING).any():
+                df[name] = df[name].astype(object).where(df[name] != MISSING, "-")
+        return df
+
+    def gantt_dataframe(self):
+        import pandas as pd
+        gantt = self.gantt
+        return None if gantt is None else pd.DataFrame(gantt, columns=list(GANTT_COLUMNS))
+
+    def section(self, name):
+        """Array stored under `name` (memory-mapped unless the file is compressed)"""
+        if name not in self._cache:
+            dtype, rows, offset, stored = self.sections[name]
+            if not rows:
+                values = np.empty(0, dtype=dtype)
+            elif self.compressed:
+                with open(self.path, "rb") as f:
+                    f.seek(offset)
+                    values = np.frombuffer(zlib.decompress(f.read(stored)), dtype=dtype)
+            else:
+                values = np.memmap(self.path, dtype=dtype, mode="r", offset=offset, shape=(rows,))
+            self._cache[name] = values
+        return self._cache[name]
+
+
+def read_results(path):
+    return ResultFile(path)
+
+
+def _to_array(values):
+    """Fixed-width array for a column ("-" -> MISSING, narrowest of int32/int64)"""
+    values = np.asarray(values)
+    if values.dtype == object or values.dtype.kind in "US":
+        values = np.array([_number(v) for v in values.tolist()])
+    if values.dtype.kind == "f" and len(values) and np.all(np.mod(values, 1) == 0):
+        values = values.astype(np.int64)
+    if values.dtype.kind in "iub":
+        info = np.iinfo(np.int32)
+        fits = not len(values) or (values.min() >= info.min and values.max() <= info.max)
+        return values.astype("<i4" if fits else "<i8")
+    if values.dtype.kind == "f":
+        return values.astype("<f8")
+    raise ValueError(f"Cannot store column of type {values.dtype}")
+
+
+def _json_default(value):
+    if isinstance(value, np.generic):
+        return value.item()
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+def _number(value):
+    if value is None or value == "-" or value == "":
+        return MISSING
+    if isinstance(value, str):
+        return float(value) if "." in value else int(value)
+    return value
+
+
+def _write_compressed(f, values):
+    compressor = zlib.compressobj(6)
+    data = memoryview(values.view(np.uint8))
+    stored = 0
+    for start in range(0, len(data), COMPRESS_BLOCK):
+        chunk = compressor.compress(data[start:start + COMPRESS_BLOCK])
+        f.write(chunk)
+        stored += len(chunk)
+    tail = compressor.flush()
+    f.write(tail)
+    return stored + len(tail)
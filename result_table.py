@@ -0,0 +1,79 @@
+import numpy as np
+
+
+class ResultTable:
+    """Per-process scheduler results as plain column arrays (no pandas needed)
+
+    A lightweight stand-in for the DataFrames the schedulers used to return:
+    `table["Waiting"]` is a numpy array, `table.columns` lists the column names and
+    `len(table)` is the number of processes, so metrics.compute_metrics and
+    result_store.write_results accept it directly. to_dataframe() is the pandas
+    adapter for display and export.
+    """
+
+    def __init__(self, data, columns=None):
+        self.columns = list(columns if columns is not None else data)
+        self._data = {col: _as_array(data[col]) for col in self.columns}
+
+    @classmethod
+    def from_rows(cls, rows, columns):
+        """Build from row lists/tuples in `columns` order"""
+        if not rows:
+            return cls({col: [] for col in columns}, columns)
+        return cls(dict(zip(columns, zip(*rows))), columns)
+
+    def __len__(self):
+        return len(self._data[self.columns[0]]) if self.columns else 0
+
+    def __getitem__(self, col):
+        return self._data[col]
+
+    def __setitem__(self, col, values):
+        values = _as_array(values) if np.ndim(values) else np.full(len(self), values, dtype=object)
+        if col not in self._data:
+            self.columns.append(col)
+        self._data[col] = values
+
+    def __contains__(self, col):
+        return col in self._data
+
+    @property
+    def empty(self):
+        return len(self) == 0
+
+    def rows(self, columns=None):
+        """Row lists for the given columns (all columns by default)"""
+        return [list(row) for row in zip(*(self._data[col].tolist() for col in (columns or self.columns)))]
+
+    def take(self, indices):
+        """New table with the rows at `indices`, in that order"""
+        return ResultTable({col: self._data[col][indices] for col in self.columns}, self.columns)
+
+    def sort_by(self, col):
+        return self.take(np.argsort(self._data[col], kind="stable"))
+
+    def head(self, n=5):
+        return self.take(slice(0, n))
+
+    def to_string(self):
+        rows = [self.columns] + [[str(value) for value in row] for row in self.rows()]
+        widths = [max(len(str(row[i])) for row in rows) for i in range(len(self.columns))]
+        return "\n".join("  ".join(str(value).rjust(width) for value, width in zip(row, widths)) for row in rows)
+
+    def to_dataframe(self):
+        import pandas as pd
+        return pd.DataFrame({col: self._data[col] for col in self.columns}, columns=self.columns)
+
+    def __repr__(self):
+        return f"ResultTable({len(self)} rows: {', '.join(self.columns)})"
+
+
+def _as_array(values):
+    """Integer/float columns become numeric arrays; mixed columns (Priority with "-") stay objects"""
+    if isinstance(values, np.ndarray):
+        return values
+    array = np.asarray(values)
+    if array.dtype.kind in "USO":
+        array = np.empty(len(values), dtype=object)
+        array[:] = list(values)
+    return array
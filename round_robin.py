@@ -1,11 +1,11 @@
-import pandas as pd
 from collections import deque
+from result_table import ResultTable
 
-def round_robin_scheduling(processes, time_quantum):
+def round_robin_scheduling(processes, time_quantum, progress=None):
     """Round Robin Scheduling Algorithm"""
 
     if not processes:
-        return pd.DataFrame(columns=["PID", "Arrival", "Burst", "Priority", "Completion", "Turnaround", "Waiting", "Response"]), []
+        return ResultTable.from_rows([], ["PID", "Arrival", "Burst", "Priority", "Completion", "Turnaround", "Waiting", "Response"]), []
 
     # Convert list of dictionaries to list of tuples (PID, Arrival, Burst)
     processes = [(p["PID"], p["Arrival"], p["Burst"]) for p in processes]
@@ -53,12 +53,15 @@ def round_robin_scheduling(processes, time_quantum):
             turnaround_time[pid] = completion_time[pid] - [p[1] for p in processes if p[0] == pid][0]
             waiting_time[pid] = turnaround_time[pid] - [p[2] for p in processes if p[0] == pid][0]
 
-    # Now we need to prepare the result in a DataFrame
+            if progress:
+                progress(len(completion_time), len(processes))  # Report completed processes
+
+    # Now we need to prepare the result rows
     result = []
     for p in processes:
         pid, arrival, burst = p
         result.append([pid, arrival, burst, "-", completion_time[pid], turnaround_time[pid], waiting_time[pid], first_response[pid] - arrival])
 
-    # Create a DataFrame with a 'Priority' column, set to "-"
-    df = pd.DataFrame(result, columns=["PID", "Arrival", "Burst", "Priority", "Completion", "Turnaround", "Waiting", "Response"])
-    return df, gantt_chart
+    # Create a result table with a 'Priority' column, set to "-"
+    table = ResultTable.from_rows(result, ["PID", "Arrival", "Burst", "Priority", "Completion", "Turnaround", "Waiting", "Response"])
+    return table, gantt_chart
@@ -5,6 +5,9 @@ import copy
 import random
 from threading import Thread
 
+# Algorithms the step-by-step animation knows how to demonstrate
+ANIMATED_ALGORITHMS = ("FCFS", "SJF", "SRTF", "Round Robin", "Priority(Non-Preemptive)", "Priority(Preemptive)")
+
 class SchedulerAnimationWindow:
     def __init__(self, parent, processes, algorithm, time_quantum=None):
         """Initialize the animation window with process data and selected algorithm"""
@@ -0,0 +1,340 @@
+import argparse
+import asyncio
+import hashlib
+import ipaddress
+import json
+import multiprocessing
+import os
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from algorithms import ALGORITHMS, PRIORITY_ALGORITHMS
+from event_core import simulate, rows_to_columns
+from metrics import compute_metrics
+from policies import make_policy
+from sim_logging import get_logger, add_logging_arguments, configure_from_args
+
+logger = get_logger(__name__)
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+
+# Largest request body accepted (bytes)
+MAX_BODY = 64 * 1024 * 1024
+
+# Result rows per NDJSON write
+STREAM_BATCH = 1000
+
+# Options forwarded to policies.make_policy
+POLICY_OPTIONS = ("aging_rate", "levels", "base_quantum", "quanta", "boost_period", "target_latency",
+                  "min_granularity", "quantum")
+
+# What each option must be: "int" (positive integer), "number" (non-negative) or "int list"
+OPTION_TYPES = {"aging_rate": "number", "levels": "int", "base_quantum": "int", "quanta": "int list",
+                "boost_period": "int", "target_latency": "number", "min_granularity": "number", "quantum": "int"}
+
+RESULT_FIELDS = ("PID", "Arrival", "Burst", "Priority", "Completion", "Turnaround", "Waiting", "Response")
+
+
+class BadRequest(Exception):
+    """Invalid workload submission (answered with HTTP 400)"""
+
+
+def run_workload(processes, algorithm, time_quantum=None, switch_cost=0, options=None):
+    """Simulate one workload; runs in a worker process. Returns (rows, gantt, metrics)"""
+    rows, gantt = simulate(processes, make_policy(algorithm, time_quantum, **(options or {})), switch_cost=switch_cost)
+    return rows, gantt, compute_metrics(rows_to_columns(rows), gantt)
+
+
+def parse_workload(payload):
+    """Validate a submitted workload and return run_workload's keyword arguments"""
+    if not isinstance(payload, dict):
+        raise BadRequest("Request body must be a JSON object")
+    algorithm = payload.get("algorithm", "FCFS")
+    if algorithm not in ALGORITHMS:
+        raise BadRequest(f"Unknown algorithm {algorithm!r}; expected one of {', '.join(ALGORITHMS)}")
+
+    processes = payload.get("processes")
+    if not isinstance(processes, list) or not processes:
+        raise BadRequest("'processes' must be a non-empty list")
+    cleaned = []
+    pids = set()
+    needs_priority = algorithm in PRIORITY_ALGORITHMS
+    for p in processes:
+        try:
+            process = {"PID": p["PID"], "Arrival": int(p["Arrival"]), "Burst": int(p["Burst"]),
+                       "Priority": p.get("Priority", "-")}
+        except (KeyError, TypeError, ValueError):
+            raise BadRequest("Every process needs integer PID, Arrival and Burst fields") from None
+        if not _is_int(process["PID"]):
+            raise BadRequest(f"PID {process['PID']!r} must be an integer")
+        if process["PID"] in pids:
+            raise BadRequest(f"Duplicate PID {process['PID']}")
+        pids.add(process["PID"])
+        if process["Arrival"] < 0 or process["Burst"] <= 0:
+            raise BadRequest(f"Process {process['PID']}: Arrival must be >= 0 and Burst > 0")
+        if not _is_int(process["Priority"]) and (needs_priority or process["Priority"] != "-"):
+            raise BadRequest(f"Process {process['PID']}: Priority must be an integer"
+                             + (f" for {algorithm}" if needs_priority else " or \"-\""))
+        cleaned.append(process)
+
+    try:
+        time_quantum = int(payload["time_quantum"]) if payload.get("time_quantum") is not None else None
+        switch_cost = int(payload.get("switch_cost", 0))
+    except (TypeError, ValueError):
+        raise BadRequest("'time_quantum' and 'switch_cost' must be integers") from None
+    if algorithm == "Round Robin" and not time_quantum or (time_quantum is not None and time_quantum <= 0):
+        raise BadRequest("Round Robin needs a positive 'time_quantum'")
+    options = payload.get("options") or {}
+    if not isinstance(options, dict):
+        raise BadRequest("'options' must be a JSON object")
+    options = {key: value for key, value in options.items() if key in POLICY_OPTIONS}
+    for key, value in options.items():
+        _check_option(key, value)
+    return {"processes": cleaned, "algorithm": algorithm, "time_quantum": time_quantum,
+            "switch_cost": switch_cost, "options": options}
+
+
+def _is_int(value):
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def _check_option(key, value):
+    """Raise BadRequest unless a policy option has the type OPTION_TYPES asks for"""
+    kind = OPTION_TYPES[key]
+    if key == "boost_period" and value is None:  # MLFQ without priority boosts
+        return
+    if kind == "int":
+        valid = _is_int(value) and value > 0
+    elif kind == "number":
+        valid = (_is_int(value) or isinstance(value, float)) and value >= 0
+    else:
+        valid = isinstance(value, list) and bool(value) and all(_is_int(item) and item > 0 for item in value)
+    if not valid:
+        expected = {"int": "a positive integer", "number": "a non-negative number",
+                    "int list": "a non-empty list of positive integers"}[kind]
+        raise BadRequest(f"Option {key!r} must be {expected}")
+
+
+class SimulationService:
+    """Local HTTP/JSON front end for the schedulers
+
+    POST /simulate   one workload; NDJSON lines: meta, row batches, gantt batches, metrics
+    POST /compare    one workload under several "algorithms" (default: all it can run); one metrics
+                     line per algorithm, or an error line ending the stream
+    GET  /algorithms names accepted in "algorithm"
+    GET  /health     liveness and cache statistics
+
+    Simulations run on a process pool. Results of recent workloads are kept in an
+    LRU cache, and identical queries that arrive while one is running share it.
+    """
+
+    def __init__(self, workers=None, cache_size=128, executor=None):
+        # Spawned (not forked) workers, so they never inherit open client sockets
+        self.executor = executor or ProcessPoolExecutor(max_workers=workers or os.cpu_count() or 1,
+                                                        mp_context=multiprocessing.get_context("spawn"))
+        self.cache_size = cache_size
+        self.cache = OrderedDict()  # key -> (rows, gantt, metrics)
+        self.in_flight = {}  # key -> Future shared by identical concurrent queries
+        self.hits = 0
+        self.misses = 0
+        self.server = None
+
+    async def run(self, workload):
+        """Result for a parsed workload, from the cache, a running twin or the worker pool"""
+        key = _workload_key(workload)
+        if key in self.cache:
+            self.hits += 1
+            self.cache.move_to_end(key)
+            return self.cache[key]
+        if key in self.in_flight:
+            self.hits += 1
+            return await asyncio.shield(self.in_flight[key])
+
+        self.misses += 1
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(self.executor, _run_kwargs, workload)
+        self.in_flight[key] = future
+        try:
+            result = await asyncio.shield(future)
+        finally:
+            self.in_flight.pop(key, None)
+        self.cache[key] = result
+        if len(self.cache) > self.cache_size:
+            self.cache.popitem(last=False)
+        return result
+
+    async def start(self, host=DEFAULT_HOST, port=DEFAULT_PORT):
+        if host != "localhost" and not ipaddress.ip_address(host).is_loopback:
+            raise ValueError(f"The simulation service only listens on loopback addresses, not {host}")
+        self.server = await asyncio.start_server(self.handle, host, port)
+        logger.info("simulation service listening on %s", ", ".join(
+            f"{sock.getsockname()[0]}:{sock.getsockname()[1]}" for sock in self.server.sockets))
+        return self.server
+
+    async def close(self):
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+    async def handle(self, reader, writer):
+        """Serve one HTTP/1.1 request per connection"""
+        try:
+            method, path, body = await _read_request(reader)
+            if method == "GET" and path == "/health":
+                await _send_json(writer, 200, {"status": "ok", "cached": len(self.cache), "hits": self.hits,
+                                               "misses": self.misses, "running": len(self.in_flight)})
+            elif method == "GET" and path == "/algorithms":
+                await _send_json(writer, 200, {"algorithms": list(ALGORITHMS)})
+            elif method == "POST" and path == "/simulate":
+                await self.stream_simulation(writer, _decode(body))
+            elif method == "POST" and path == "/compare":
+                await self.stream_comparison(writer, _decode(body))
+            else:
+                await _send_json(writer, 404, {"error": f"No route for {method} {path}"})
+        except BadRequest as e:
+            await _send_json(writer, 400, {"error": str(e)})
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        except Exception as e:
+            logger.exception("Request failed")
+            await _send_json(writer, 500, {"error": str(e)})
+        finally:
+            writer.close()
+
+    async def stream_simulation(self, writer, payload):
+        workload = parse_workload(payload)
+        rows, gantt, metrics = await self.run(workload)
+        await _start_stream(writer)
+        await _send_lines(writer, [{"type": "meta", "algorithm": workload["algorithm"], "processes": len(rows)}])
+        for start in range(0, len(rows), STREAM_BATCH):
+            await _send_lines(writer, [dict(zip(RESULT_FIELDS, row), type="row") for row in rows[start:start + STREAM_BATCH]])
+        for start in range(0, len(gantt), STREAM_BATCH):
+            await _send_lines(writer, [{"type": "gantt", "segments": gantt[start:start + STREAM_BATCH]}])
+        await _send_lines(writer, [{"type": "metrics", **metrics}])
+        await _end_stream(writer)
+
+    async def stream_comparison(self, writer, payload):
+        if not isinstance(payload, dict):
+            raise BadRequest("Request body must be a JSON object")
+        algorithms = payload.get("algorithms") or _default_algorithms(payload)
+        if not isinstance(algorithms, list):
+            raise BadRequest("'algorithms' must be a list")
+        workloads = [parse_workload(dict(payload, algorithm=algorithm)) for algorithm in algorithms]
+        await _start_stream(writer)
+
+        async def run(workload):
+            try:
+                return workload["algorithm"], await self.run(workload), None
+            except Exception as e:
+                return workload["algorithm"], None, e
+
+        # Lines go out in completion order, as soon as each algorithm finishes
+        tasks = [asyncio.ensure_future(run(workload)) for workload in workloads]
+        try:
+            for task in asyncio.as_completed(tasks):
+                algorithm, result, error = await task
+                if error is not None:
+                    # The 200 header is already out, so the failure is reported inside the stream
+                    logger.error("Comparison failed for %s", algorithm, exc_info=error)
+                    await _send_lines(writer, [{"type": "error", "algorithm": algorithm, "error": str(error)}])
+                    break
+                await _send_lines(writer, [{"type": "metrics", "algorithm": algorithm, **result[2]}])
+        finally:
+            for task in tasks:
+                task.cancel()
+        await _end_stream(writer)
+
+
+def _default_algorithms(payload):
+    """Algorithms /compare runs when none are named: those the workload has the inputs for"""
+    processes = payload.get("processes")
+    has_priority = isinstance(processes, list) and all(
+        isinstance(p, dict) and _is_int(p.get("Priority")) for p in processes)
+    has_quantum = payload.get("time_quantum") is not None
+    return [algorithm for algorithm in ALGORITHMS
+            if (has_priority or algorithm not in PRIORITY_ALGORITHMS) and (has_quantum or algorithm != "Round Robin")]
+
+
+def _run_kwargs(workload):
+    return run_workload(**workload)
+
+
+def _workload_key(workload):
+    return hashlib.sha1(json.dumps(workload, sort_keys=True, default=str).encode()).hexdigest()
+
+
+def _decode(body):
+    try:
+        return json.loads(body or b"{}")
+    except ValueError:
+        raise BadRequest("Request body is not valid JSON") from None
+
+
+async def _read_request(reader):
+    request_line = (await reader.readline()).decode("latin-1").split()
+    if len(request_line) != 3:
+        raise BadRequest("Malformed request line")
+    method, path, _ = request_line
+    headers = {}
+    while True:
+        line = (await reader.readline()).decode("latin-1").strip()
+        if not line:
+            break
+        name, _, value = line.partition(":")
+        headers[name.strip().lower()] = value.strip()
+    length = int(headers.get("content-length", 0))
+    if length > MAX_BODY:
+        raise BadRequest("Request body too large")
+    body = await reader.readexactly(length) if length else b""
+    return method.upper(), path.split("?", 1)[0], body
+
+
+_REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 500: "Internal Server Error"}
+
+
+async def _send_json(writer, status, payload):
+    body = json.dumps(payload).encode()
+    writer.write(f"HTTP/1.1 {status} {_REASONS[status]}\r\nContent-Type: application/json\r\n"
+                 f"Content-Length: {len(body)}\r\nConnection: close\r\n\r\n".encode() + body)
+    await writer.drain()
+
+
+async def _start_stream(writer):
+    writer.write(b"HTTP/1.1 200 OK\r\nContent-Type: application/x-ndjson\r\n"
+                 b"Transfer-Encoding: chunked\r\nConnection: close\r\n\r\n")
+    await writer.drain()
+
+
+async def _send_lines(writer, objects):
+    """Write one HTTP chunk holding one JSON document per line"""
+    data = "".join(json.dumps(obj) + "\n" for obj in objects).encode()
+    writer.write(f"{len(data):X}\r\n".encode() + data + b"\r\n")
+    await writer.drain()
+
+
+async def _end_stream(writer):
+    writer.write(b"0\r\n\r\n")
+    await writer.drain()
+
+
+async def serve(host=DEFAULT_HOST, port=DEFAULT_PORT, workers=None, cache_size=128):
+    service = SimulationService(workers, cache_size)
+    server = await service.start(host, port)
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        await service.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Local HTTP/JSON CPU scheduling simulation service")
+    parser.add_argument("--host", default=DEFAULT_HOST, help="loopback address to bind (default 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--workers", type=int, default=None, help="simulation worker processes (default: CPU count)")
+    parser.add_argument("--cache-size", type=int, default=128, help="recent workloads kept in the result cache")
+    add_logging_arguments(parser)
+    args = parser.parse_args()
+    configure_from_args(args)
+    asyncio.run(serve(args.host, args.port, args.workers, args.cache_size))
@@ -0,0 +1,87 @@
+import numpy as np
+from result_store import ResultFile, write_results, MISSING
+
+# Version of the session layout stored in the metadata (the file format itself is result_store's)
+SESSION_VERSION = 1
+
+PROCESS_PREFIX = "proc."
+PROCESS_COLUMNS = ("PID", "Arrival", "Burst", "Priority")
+
+# Burst histories are ragged, so they are stored flattened plus one length per process
+HISTORY_SECTION = PROCESS_PREFIX + "History"
+HISTORY_LENGTHS = PROCESS_PREFIX + "HistLen"
+
+# Optional absolute deadlines (MISSING for processes without one)
+DEADLINE_SECTION = PROCESS_PREFIX + "Deadline"
+
+
+def save_session(path, processes, settings=None, result=None, gantt=None, algorithm=None, optimizer=None,
+                 compress=False):
+    """Snapshot the process table, algorithm settings, last result and optimizer output
+
+    A session file is a result file (see result_store) with the processes stored as
+    extra columns, so it can also be opened with ResultFile or `cli.py info`.
+    """
+    extra = {PROCESS_PREFIX + col: [p[col] for p in processes] for col in PROCESS_COLUMNS}
+    histories = [p.get("History") or () for p in processes]
+    if any(histories):
+        extra[HISTORY_SECTION] = [burst for history in histories for burst in history]
+        extra[HISTORY_LENGTHS] = [len(history) for history in histories]
+    if any(p.get("Deadline") is not None for p in processes):
+        extra[DEADLINE_SECTION] = [p.get("Deadline", "-") for p in processes]
+    metadata = {"session": SESSION_VERSION, "algorithm": algorithm, "settings": settings or {},
+                "optimizer": optimizer}
+    write_results(path, result if result is not None else {}, gantt, compress=compress, metadata=metadata,
+                  extra=extra)
+
+
+class SessionFile(ResultFile):
+    """Lazily loaded session: opening reads only the header and metadata
+
+    Process columns and results are memory-mapped and only materialized by
+    processes() / to_dataframe(); the GUI displays the mapped result columns as they are.
+    """
+
+    def __init__(self, path):
+        super().__init__(path)
+        version = self.metadata.get("session")
+        if version is None:
+            raise ValueError(f"{path} is a result file, not a session")
+        if version > SESSION_VERSION:
+            raise ValueError(f"{path} was saved by a newer version (session {version})")
+        self.algorithm = self.metadata.get("algorithm")
+        self.settings = self.metadata.get("settings") or {}
+        self.optimizer = self.metadata.get("optimizer")
+
+    @property
+    def process_count(self):
+        return self.sections[PROCESS_PREFIX + "PID"][1]
+
+    @property
+    def has_results(self):
+        return bool(self.columns)
+
+    def process_columns(self):
+        """{column: array} view of the process table (Priority "-" stored as MISSING)"""
+        return {col: self.section(PROCESS_PREFIX + col) for col in PROCESS_COLUMNS}
+
+    def processes(self):
+        """The process table as ProcessManager dicts"""
+        columns = [self.section(PROCESS_PREFIX + col).tolist() for col in PROCESS_COLUMNS]
+        processes = [{"PID": pid, "Arrival": arrival, "Burst": burst, "Priority": "-" if priority == MISSING else priority}
+                     for pid, arrival, burst, priority in zip(*columns)]
+        if HISTORY_SECTION in self.sections:
+            bursts = self.section(HISTORY_SECTION).tolist()
+            ends = np.cumsum(self.section(HISTORY_LENGTHS)).tolist()
+            for process, start, end in zip(processes, [0] + ends, ends):
+                if end > start:
+                    process["History"] = bursts[start:end]
+        if DEADLINE_SECTION in self.sections:
+            for process, deadline in zip(processes, self.section(DEADLINE_SECTION).tolist()):
+                if deadline != MISSING:
+                    process["Deadline"] = deadline
+        return processes
+
+
+def load_session(path):
+    return SessionFile(path)
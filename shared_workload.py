@@ -0,0 +1,127 @@
+import multiprocessing
+import os
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+import numpy as np
+from event_core import simulate, rows_to_columns
+from metrics import compute_metrics
+from policies import make_policy
+from result_store import MISSING
+
+# Columns of a published workload (one int64 row each); Priority "-" and a missing
+# Deadline are stored as MISSING. Burst "History" follows in rows padded with MISSING.
+WORKLOAD_COLUMNS = ("PID", "Arrival", "Burst", "Priority", "Deadline")
+
+# What a worker receives instead of the data: a few bytes, whatever the workload size
+SharedArrayHandle = namedtuple("SharedArrayHandle", ["name", "shape", "dtype"])
+
+
+class SharedArray:
+    """A numpy array backed by multiprocessing.shared_memory
+
+    The creating process owns the block and unlinks it on close(); workers attach
+    through `handle` and get a zero-copy view of the same memory.
+    """
+
+    def __init__(self, shm, shape, dtype, owner):
+        self.shm = shm
+        self.owner = owner
+        self.array = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+
+    @classmethod
+    def create(cls, shape, dtype=np.float64):
+        size = max(1, int(np.prod(shape)) * np.dtype(dtype).itemsize)
+        return cls(shared_memory.SharedMemory(create=True, size=size), shape, dtype, owner=True)
+
+    @classmethod
+    def attach(cls, handle):
+        return cls(shared_memory.SharedMemory(name=handle.name), handle.shape, handle.dtype, owner=False)
+
+    @property
+    def handle(self):
+        return SharedArrayHandle(self.shm.name, self.array.shape, self.array.dtype.str)
+
+    def close(self):
+        self.array = None  # Release the view before the mapping is closed
+        self.shm.close()
+        if self.owner:
+            self.shm.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def publish_workload(processes):
+    """Copy the process table into shared memory once, as a (columns + longest history, n) int64 array"""
+    histories = [p.get("History") or () for p in processes]
+    depth = max(map(len, histories), default=0)
+    shared = SharedArray.create((len(WORKLOAD_COLUMNS) + depth, len(processes)), np.int64)
+    for row, col in enumerate(WORKLOAD_COLUMNS):
+        shared.array[row] = [MISSING if p.get(col, "-") in ("-", None) else p[col] for p in processes]
+    shared.array[len(WORKLOAD_COLUMNS):] = MISSING
+    for i, history in enumerate(histories):
+        shared.array[len(WORKLOAD_COLUMNS):len(WORKLOAD_COLUMNS) + len(history), i] = history
+    return shared
+
+
+# Workload most recently attached by this worker process: (name, SharedArray, processes)
+_attached = None
+
+
+def attach_workload(handle):
+    """Process dicts for a published workload, rebuilt once per worker process and reused"""
+    global _attached
+    if _attached is None or _attached[0] != handle.name:
+        if _attached is not None:
+            _attached[1].close()
+        shared = SharedArray.attach(handle)
+        columns = [shared.array[row].tolist() for row in range(len(WORKLOAD_COLUMNS))]
+        histories = shared.array[len(WORKLOAD_COLUMNS):].T.tolist()
+        processes = [dict(zip(WORKLOAD_COLUMNS, values)) for values in zip(*columns)]
+        for p, history in zip(processes, histories):
+            if p["Priority"] == MISSING:
+                p["Priority"] = "-"
+            if p["Deadline"] == MISSING:
+                del p["Deadline"]
+            history = [burst for burst in history if burst != MISSING]
+            if history:
+                p["History"] = history
+        _attached = (handle.name, shared, processes)
+    return _attached[2]
+
+
+def evaluate_configurations(processes, configurations, metrics=("avg_waiting", "avg_turnaround", "avg_response"),
+                            workers=None, executor=None):
+    """Metrics for every (algorithm, time_quantum) configuration, simulated in parallel
+
+    The workload is published to shared memory once and workers write their metric
+    row straight into a shared (configurations x metrics) result array, so only small
+    handles are pickled per task. Returns that array as a regular numpy array.
+    """
+    configurations = list(configurations)
+    with publish_workload(processes) as workload, \
+            SharedArray.create((len(configurations), len(metrics))) as results:
+        tasks = [(workload.handle, results.handle, i, algorithm, time_quantum, tuple(metrics))
+                 for i, (algorithm, time_quantum) in enumerate(configurations)]
+        if executor is not None:
+            list(executor.map(_evaluate_task, tasks))
+        else:
+            # Spawned, not forked: callers may be threaded (GUI workers), and forking a threaded process can deadlock
+            with ProcessPoolExecutor(max_workers=workers or os.cpu_count() or 1,
+                                     mp_context=multiprocessing.get_context("spawn")) as pool:
+                list(pool.map(_evaluate_task, tasks))
+        return results.array.copy()
+
+
+def _evaluate_task(task):
+    """Simulate one configuration and write its metrics row (runs in a worker process)"""
+    workload_handle, results_handle, index, algorithm, time_quantum, metrics = task
+    processes = attach_workload(workload_handle)
+    rows, gantt = simulate(processes, make_policy(algorithm, time_quantum))
+    values = compute_metrics(rows_to_columns(rows), gantt)
+    with SharedArray.attach(results_handle) as results:
+        results.array[index] = [values[metric] for metric in metrics]
@@ -0,0 +1,138 @@
+import json
+import logging
+
+ROOT_LOGGER = "cpu_scheduler"
+LOG_LEVELS = ("DEBUG", "INFO", "WARNING", "ERROR")
+
+_handler = None
+_sampler = None
+
+
+def get_logger(name):
+    """Return the logger for a module, e.g. get_logger(__name__)"""
+    return logging.getLogger(f"{ROOT_LOGGER}.{name}")
+
+
+def log_event(logger, level, event, **fields):
+    """Log a structured event; nothing is formatted unless the level is enabled"""
+    if logger.isEnabledFor(level):
+        logger.log(level, event, extra={"fields": fields}, stacklevel=2)
+
+
+class Preview:
+    """Lazy preview of a DataFrame or list, only rendered if the record is emitted"""
+
+    def __init__(self, data, rows=10):
+        self.data = data
+        self.rows = rows
+
+    def __str__(self):
+        data = self.data
+        if data is None:
+            return "None"
+        if hasattr(data, "head"):
+            text = data.head(self.rows).to_string()
+            if len(data) > self.rows:
+                text += f"\n... ({len(data)} rows)"
+            return text
+        if isinstance(data, (list, tuple)) and len(data) > self.rows:
+            return f"{list(data[:self.rows])} ... ({len(data)} items)"
+        return str(data)
+
+
+class DebugSampler(logging.Filter):
+    """Let through only a fraction of DEBUG records (higher levels always pass)"""
+
+    def __init__(self, rate=1.0):
+        super().__init__()
+        self.rate = rate
+        self._credit = 0.0
+
+    def filter(self, record):
+        if record.levelno > logging.DEBUG or self.rate >= 1.0:
+            return True
+        # Deterministic sampling: emit one record each time the credit reaches 1
+        self._credit += self.rate
+        if self._credit >= 1.0:
+            self._credit -= 1.0
+            return True
+        return False
+
+
+class StructuredFormatter(logging.Formatter):
+    """Render records as 'message key=value ...' or as one JSON object per line"""
+
+    def __init__(self, json_lines=False):
+        super().__init__("%(asctime)s %(levelname)s %(name)s: %(message)s")
+        self.json_lines = json_lines
+
+    def format(self, record):
+        fields = getattr(record, "fields", {})
+        if self.json_lines:
+            entry = {
+                "time": self.formatTime(record),
+                "level": record.levelname,
+                "logger": record.name,
+                "event": record.getMessage(),
+            }
+            entry.update({key: _jsonable(value) for key, value in fields.items()})
+            return json.dumps(entry)
+
+        text = super().format(record)
+        if fields:
+            text += " " + " ".join(f"{key}={value}" for key, value in fields.items())
+        return text
+
+
+def configure_logging(level="WARNING", debug_sample_rate=1.0, json_lines=False, log_file=None):
+    """Configure the scheduler loggers (safe to call again, e.g. from the GUI)"""
+    global _handler, _sampler
+
+    root = logging.getLogger(ROOT_LOGGER)
+    root.setLevel(level.upper() if isinstance(level, str) else level)
+    root.propagate = False
+
+    if _handler is not None:
+        root.removeHandler(_handler)
+        _handler.close()
+
+    _handler = logging.FileHandler(log_file) if log_file else logging.StreamHandler()
+    _handler.setFormatter(StructuredFormatter(json_lines=json_lines))
+    _sampler = DebugSampler(debug_sample_rate)
+    _handler.addFilter(_sampler)
+    root.addHandler(_handler)
+    return root
+
+
+def set_level(level):
+    logging.getLogger(ROOT_LOGGER).setLevel(level.upper() if isinstance(level, str) else level)
+
+
+def get_level():
+    return logging.getLevelName(logging.getLogger(ROOT_LOGGER).getEffectiveLevel())
+
+
+def add_logging_arguments(parser):
+    """Add the shared --log-* options to an argparse parser"""
+    parser.add_argument("--log-level", default="WARNING", choices=LOG_LEVELS, help="Logging level")
+    parser.add_argument("--log-sample", type=float, default=1.0,
+                        help="Fraction of DEBUG records to emit (e.g. 0.01)")
+    parser.add_argument("--log-json", action="store_true", help="Emit one JSON object per log line")
+    parser.add_argument("--log-file", default=None, help="Write logs to a file instead of stderr")
+
+
+def configure_from_args(args):
+    return configure_logging(args.log_level, args.log_sample, args.log_json, args.log_file)
+
+
+def _jsonable(value):
+    if isinstance(value, (str, int, float, bool)) or value is None:
+        return value
+    try:
+        return value.item()  # NumPy scalars
+    except AttributeError:
+        return str(value)
+
+
+# Library default: warnings and errors go to stderr until configure_logging() is called
+configure_logging()
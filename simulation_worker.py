@@ -0,0 +1,76 @@
+import queue
+from threading import Thread, Event
+from sim_logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class SimulationCancelled(Exception):
+    """Raised inside a running simulation once cancellation has been requested"""
+
+
+class SimulationWorker:
+    """Run a simulation on a background thread and report back through a queue"""
+
+    def __init__(self, target, *args, **kwargs):
+        self.target = target
+        self.args = args
+        self.kwargs = kwargs
+
+        # Messages for the GUI thread: ("progress", (done, total)), ("done", result),
+        # ("error", exception) or ("cancelled", None)
+        self.messages = queue.Queue()
+        self._cancel_event = Event()
+        self._last_percent = -1
+        self._thread = None
+
+    def start(self):
+        """Start the simulation thread"""
+        self._thread = Thread(target=self._run)
+        self._thread.daemon = True
+        self._thread.start()
+
+    def cancel(self):
+        """Ask the running simulation to stop at its next progress report"""
+        self._cancel_event.set()
+
+    @property
+    def cancelled(self):
+        return self._cancel_event.is_set()
+
+    def is_alive(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def progress(self, done, total):
+        """Progress callback handed to the scheduler (runs on the worker thread)"""
+        if self._cancel_event.is_set():
+            raise SimulationCancelled()
+
+        # Only post a message when the visible percentage changes
+        percent = int(done * 100 / total) if total else 100
+        if percent != self._last_percent:
+            self._last_percent = percent
+            self.messages.put(("progress", (done, total)))
+
+    def poll(self):
+        """Drain all pending messages without blocking (call from the GUI thread)"""
+        while True:
+            try:
+                yield self.messages.get_nowait()
+            except queue.Empty:
+                return
+
+    def _run(self):
+        try:
+            result = self.target(*self.args, progress=self.progress, **self.kwargs)
+        except SimulationCancelled:
+            self.messages.put(("cancelled", None))
+        except Exception as e:
+            logger.exception("Simulation worker failed")
+            self.messages.put(("error", e))
+        else:
+            # A cancel that arrives after the last progress report still discards the result
+            if self._cancel_event.is_set():
+                self.messages.put(("cancelled", None))
+            else:
+                self.messages.put(("done", result))
@@ -1,7 +1,22 @@
-import pandas as pd
+from burst_prediction import predicted_scheduling
+from result_table import ResultTable
 
-def sjf_scheduling(processes):
-    """Shortest Job First (SJF) Non-Preemptive Scheduling Algorithm"""
+def sjf_scheduling(processes, progress=None, alpha=None, predictions=None):
+    """Shortest Job First (SJF) Non-Preemptive Scheduling Algorithm
+
+    With `alpha`, jobs are ordered by a burst predicted from their "History" by
+    exponential averaging (the true burst still runs), like a real scheduler.
+    `predictions`, when given, is filled with the prediction used for each PID.
+    """
+
+    if alpha is not None:
+        rows, _, predicted = predicted_scheduling(processes, alpha, preemptive=False, progress=progress)
+        if predictions is not None:
+            predictions.update(predicted)
+        completed = [[pid, arrival, burst, '-', completion - burst, completion, turnaround, waiting, response]
+                     for pid, arrival, burst, _, completion, turnaround, waiting, response in rows]
+        completed.sort(key=lambda row: row[4])  # Execution order, like the oracle version
+        return ResultTable.from_rows(completed, ["PID", "Arrival", "Burst", "Priority", "Start", "Completion", "Turnaround", "Waiting", "Response"])
     
     # Sort processes by Arrival Time first, then by Burst Time
     processes.sort(key=lambda x: (x['Arrival'], x['Burst']))
@@ -42,6 +57,9 @@ def sjf_scheduling(processes):
         # Store the results for the current process
         result.append([pid, arrival, burst, priority, start_time, completion_time, turnaround_time, waiting_time, response_time])
 
-    # Create DataFrame with 'Priority' included
-    df = pd.DataFrame(result, columns=["PID", "Arrival", "Burst", "Priority", "Start", "Completion", "Turnaround", "Waiting", "Response"])
-    return df
+        if progress:
+            progress(len(result), len(processes))  # Report completed processes
+
+    # Create the result table with 'Priority' included
+    table = ResultTable.from_rows(result, ["PID", "Arrival", "Burst", "Priority", "Start", "Completion", "Turnaround", "Waiting", "Response"])
+    return table
@@ -0,0 +1,293 @@
+import argparse
+import heapq
+import time
+import numpy as np
+from event_core import Job, RESULT_COLUMNS
+from metrics import compute_metrics, count_context_switches
+from policies import make_policy
+from sim_logging import get_logger
+
+logger = get_logger(__name__)
+
+# simulate_smp() rows: the usual result columns plus the core each process finished on
+# and how many times it moved between cores
+SMP_RESULT_COLUMNS = RESULT_COLUMNS + ["Core", "Migrations"]
+
+# Jobs moved per periodic balancing pass at most
+MAX_BALANCE_MOVES = 64
+
+
+class SMPJob(Job):
+    """A job that remembers the core it last ran on and the cores it may run on"""
+    __slots__ = ("core", "allowed", "migrations")
+
+    def __init__(self, pid, arrival, burst, priority, seq, allowed, deadline=None):
+        super().__init__(pid, arrival, burst, priority, seq, deadline)
+        self.core = None
+        self.allowed = allowed  # Set of core numbers, or None for any core
+        self.migrations = 0
+
+
+def simulate_smp(processes, policy_factory, cores=4, migration_cost=0, steal=True, balance_interval=None,
+                 seed=0, progress=None):
+    """Event-driven multiprocessor simulation with one run queue per core
+
+    Returns (rows, gantts, usage): SMP_RESULT_COLUMNS rows, one Gantt segment list per
+    core and a usage dict (see smp_metrics).
+
+    Every core has its own policy instance (`policy_factory()`), so each run queue is
+    scheduled independently, as in SMP kernels:
+    - New processes go to an idle core if one is allowed, otherwise to the less loaded
+      of two randomly sampled cores (the least loaded allowed core for processes with
+      an "Affinity" list of core numbers).
+    - A job that resumes on a different core than it last ran on pays `migration_cost`
+      time units (a cold cache) before it makes progress.
+    - With `steal`, a core that runs out of work takes the next job of the core with
+      the longest queue; every `balance_interval` time units, jobs are also pushed from
+      the longest to the shortest queues until they differ by at most one.
+    Preemptive policies are re-evaluated on a core when a process is placed on it.
+    With one core the result equals event_core.simulate.
+    """
+    jobs = [SMPJob(p["PID"], p["Arrival"], p["Burst"], p.get("Priority", "-"), i, _affinity(p, cores),
+                   p.get("Deadline"))
+            for i, p in enumerate(sorted(processes, key=lambda p: p["Arrival"]))]
+    n = len(jobs)
+    rows = [None] * n
+    gantts = [[] for _ in range(cores)]
+    policies = [policy_factory() for _ in range(cores)]
+    rng = np.random.default_rng(seed)
+    samples = iter(())  # Pre-drawn core pairs for placement
+
+    running = [None] * cores
+    started = [0] * cores  # When the running job starts making progress (after any migration cost)
+    version = [0] * cores  # Invalidates slice-end events of preempted runs
+    busy = [0] * cores
+    idle = set(range(cores))
+    queued = 0
+    slice_ends = []  # Heap of (time, core, version)
+    usage = {"migrations": 0, "migration_overhead": 0, "steals": 0, "balance_moves": 0}
+
+    now = 0
+    idx = 0  # Next job to arrive
+    completed = 0
+    next_balance = balance_interval
+
+    def load(core):
+        return len(policies[core]) + (running[core] is not None)
+
+    def place(job):
+        nonlocal samples
+        allowed = job.allowed
+        candidates = idle if allowed is None else idle & allowed
+        if candidates:
+            return min(candidates)
+        if allowed is not None:
+            return min(allowed, key=load)
+        pair = next(samples, None)
+        if pair is None:
+            samples = iter(rng.integers(0, cores, (4096, 2)).tolist())
+            pair = next(samples)
+        return min(pair, key=load)
+
+    def stop(core, now):
+        """End the run on `core` at `now` (slice over, job done or preempted)"""
+        nonlocal queued, completed
+        job = running[core]
+        running[core] = None
+        version[core] += 1
+        idle.add(core)
+        ran = max(0, now - started[core])
+        if ran:
+            segments = gantts[core]
+            if segments and segments[-1][2] == job.pid and segments[-1][1] == started[core]:
+                segments[-1] = (segments[-1][0], now, job.pid)
+            else:
+                segments.append((started[core], now, job.pid))
+            busy[core] += ran
+            job.remaining -= ran
+        policy = policies[core]
+        policy.charge(job, ran, now)
+        if job.remaining:
+            policy.requeue(job, ran, now)
+            queued += 1
+            return
+        turnaround = now - job.arrival
+        rows[job.seq] = [job.pid, job.arrival, job.burst, job.priority, now, turnaround,
+                         turnaround - job.burst, job.first_run - job.arrival, core, job.migrations]
+        completed += 1
+        policy.complete(job, now)
+        if progress:
+            progress(completed, n)
+
+    def migrate(source, target, now):
+        """Move the next job of `source`'s queue to `target` if it may run there"""
+        job = policies[source].pick(now)
+        if job.allowed is not None and target not in job.allowed:
+            policies[source].putback(job, now)  # Stays at the head, so failed steals never reorder the queue
+            return False
+        policies[source].block(job, now)
+        policies[target].add(job, now)
+        return True
+
+    def dispatch(core, now):
+        nonlocal queued
+        policy = policies[core]
+        if not len(policy):
+            if not steal or not queued:
+                return
+            victim = max(range(cores), key=lambda c: len(policies[c]))
+            if not len(policies[victim]) or not migrate(victim, core, now):
+                return
+            usage["steals"] += 1
+        job = policy.pick(now)
+        queued -= 1
+        start = now
+        if job.core is not None and job.core != core:
+            job.migrations += 1
+            usage["migrations"] += 1
+            usage["migration_overhead"] += migration_cost
+            start += migration_cost
+        job.core = core
+        if job.first_run is None:
+            job.first_run = start
+        run = job.remaining
+        limit = policy.time_slice(job, start)
+        if limit is not None:
+            run = min(run, max(1, limit))
+        running[core] = job
+        started[core] = start
+        idle.discard(core)
+        heapq.heappush(slice_ends, (start + run, core, version[core]))
+
+    def balance(now):
+        moves = 0
+        while moves < MAX_BALANCE_MOVES:
+            lengths = [len(policy) for policy in policies]
+            source = max(range(cores), key=lengths.__getitem__)
+            target = min(range(cores), key=load)
+            if lengths[source] - load(target) <= 1 or source == target or not migrate(source, target, now):
+                break
+            moves += 1
+        usage["balance_moves"] += moves
+
+    while completed < n:
+        # Advance to the next arrival, slice end or (with queued work) balancing pass
+        candidates = []
+        if idx < n:
+            candidates.append(jobs[idx].arrival)
+        if slice_ends:
+            candidates.append(slice_ends[0][0])
+        if next_balance is not None and queued:
+            candidates.append(max(next_balance, now))
+        now = max(now, min(candidates))
+
+        # Arrivals first, so they queue ahead of jobs whose slice ends (or that they preempt) now
+        preempted = set()
+        while idx < n and jobs[idx].arrival <= now:
+            job = jobs[idx]
+            core = place(job)
+            policies[core].add(job, now)
+            queued += 1
+            if running[core] is not None and policies[core].preempt_on_arrival:
+                preempted.add(core)
+            idx += 1
+        for core in preempted:
+            stop(core, now)
+        while slice_ends and slice_ends[0][0] <= now:
+            _, core, run_version = heapq.heappop(slice_ends)
+            if run_version == version[core]:
+                stop(core, now)
+        if next_balance is not None and now >= next_balance:
+            balance(now)
+            next_balance = (now // balance_interval + 1) * balance_interval
+        if queued:
+            for core in sorted(idle):
+                dispatch(core, now)
+
+    usage.update(cores=cores, busy=busy)
+    return rows, gantts, usage
+
+
+def _affinity(process, cores):
+    """Cores a process may run on (None for any), checked against range(cores)"""
+    affinity = process.get("Affinity")
+    if affinity is None or (isinstance(affinity, (list, tuple, set, frozenset)) and not affinity):
+        return None
+    allowed = frozenset(affinity)
+    if not all(isinstance(core, int) and 0 <= core < cores for core in allowed):
+        raise ValueError(f"P{process['PID']}: Affinity {sorted(allowed, key=str)} must name cores 0..{cores - 1}")
+    return allowed
+
+
+def smp_scheduling(processes, algorithm, time_quantum=None, cores=4, progress=None, **options):
+    """simulate_smp() with a per-core instance of an algorithm's policy
+
+    SMP options (migration_cost, steal, balance_interval, seed) are passed through; the
+    rest go to the policy, as in policies.make_policy.
+    """
+    smp_options = {key: options.pop(key) for key in ("migration_cost", "steal", "balance_interval", "seed")
+                   if key in options}
+    return simulate_smp(processes, lambda: make_policy(algorithm, time_quantum, **options), cores,
+                        progress=progress, **smp_options)
+
+
+def smp_metrics(rows, gantts, usage):
+    """compute_metrics() for simulate_smp() output, with multiprocessor utilization and balance"""
+    columns = {col: list(values) for col, values in zip(SMP_RESULT_COLUMNS, zip(*rows))} if rows else \
+        {col: [] for col in SMP_RESULT_COLUMNS}
+    metrics = compute_metrics(columns)
+    busy = usage["busy"]
+    if rows:
+        span = max(columns["Completion"]) - min(columns["Arrival"])
+        metrics["utilization"] = sum(busy) / (usage["cores"] * span) if span else 0.0
+        metrics["idle_time"] = usage["cores"] * span - sum(busy)
+    metrics["context_switches"] = sum(count_context_switches(gantt) for gantt in gantts)
+    # Busiest core relative to the average one (1.0 = perfectly balanced)
+    metrics["imbalance"] = max(busy) * len(busy) / sum(busy) if sum(busy) else 1.0
+    metrics["migrations"] = usage["migrations"]
+    metrics["migration_overhead"] = usage["migration_overhead"]
+    return metrics
+
+
+def compare_strategies(processes, algorithm, time_quantum=None, cores=64, migration_costs=(0, 2, 5),
+                       balance_interval=50):
+    """Cache affinity vs balance: metrics for every (balancing strategy, migration cost) pair"""
+    strategies = {
+        "pinned": {"steal": False},  # Processes stay on the core they were placed on
+        f"balance/{balance_interval}": {"steal": False, "balance_interval": balance_interval},
+        "steal": {"steal": True},
+        f"steal+balance/{balance_interval}": {"steal": True, "balance_interval": balance_interval},
+    }
+    results = {}
+    for name, options in strategies.items():
+        for cost in migration_costs:
+            started = time.perf_counter()
+            rows, gantts, usage = smp_scheduling(processes, algorithm, time_quantum, cores, migration_cost=cost,
+                                                 **options)
+            results[name, cost] = smp_metrics(rows, gantts, usage)
+            logger.debug("%s, migration cost %s: %.2f s", name, cost, time.perf_counter() - started)
+    return results
+
+
+if __name__ == "__main__":
+    from workload_generator import generate_workload
+
+    parser = argparse.ArgumentParser(description="Per-core run queues: cache affinity vs load balance")
+    parser.add_argument("--cores", type=int, default=64)
+    parser.add_argument("--processes", type=int, default=50000)
+    parser.add_argument("--load", type=float, default=0.9, help="offered load per core")
+    parser.add_argument("-a", "--algorithm", default="Round Robin")
+    parser.add_argument("-q", "--quantum", type=int, default=4)
+    parser.add_argument("--migration-cost", type=int, nargs="+", default=[0, 2, 5])
+    parser.add_argument("--balance-interval", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    workload = generate_workload(args.processes, load=args.load * args.cores, seed=args.seed)
+    results = compare_strategies(workload, args.algorithm, args.quantum, args.cores, args.migration_cost,
+                                 args.balance_interval)
+    print(f"{'strategy':<24}{'migr. cost':>11}{'avg wait':>10}{'p99 wait':>10}{'util':>8}{'imbalance':>11}"
+          f"{'migrations':>12}")
+    for (name, cost), metrics in results.items():
+        print(f"{name:<24}{cost:>11}{metrics['avg_waiting']:>10.2f}{metrics['p99_waiting']:>10.2f}"
+              f"{metrics['utilization']:>8.1%}{metrics['imbalance']:>11.3f}{metrics['migrations']:>12}")
@@ -1,10 +1,23 @@
-import pandas as pd
-import numpy as np
+from burst_prediction import predicted_scheduling
+from result_table import ResultTable
 
-def srtf_scheduling(processes):
-    """Shortest Remaining Time First (SRTF) Scheduling Algorithm"""
+def srtf_scheduling(processes, progress=None, alpha=None, predictions=None):
+    """Shortest Remaining Time First (SRTF) Scheduling Algorithm
+
+    With `alpha`, jobs are ordered by predicted remaining time, using a burst predicted
+    from their "History" by exponential averaging (the true burst still runs).
+    `predictions`, when given, is filled with the prediction used for each PID.
+    """
     if not processes:
-        return pd.DataFrame(columns=["PID", "Arrival", "Burst", "Priority", "Completion", "Turnaround", "Waiting", "Response"]), []
+        return ResultTable.from_rows([], ["PID", "Arrival", "Burst", "Priority", "Completion", "Turnaround", "Waiting", "Response"]), []
+
+    if alpha is not None:
+        rows, gantt_chart, predicted = predicted_scheduling(processes, alpha, preemptive=True, progress=progress)
+        if predictions is not None:
+            predictions.update(predicted)
+        rows = [[pid, arrival, burst, "-", completion, turnaround, waiting, response]
+                for pid, arrival, burst, _, completion, turnaround, waiting, response in rows]
+        return ResultTable.from_rows(rows, ["PID", "Arrival", "Burst", "Priority", "Completion", "Turnaround", "Waiting", "Response"]), gantt_chart
     
     # Convert list of dictionaries to list of tuples (PID, Arrival, Burst)
     processes = [(p["PID"], p["Arrival"], p["Burst"]) for p in processes]
@@ -77,8 +90,11 @@ def srtf_scheduling(processes):
             
             turnaround_time[min_pid] = completion_time[min_pid] - arrival_time
             waiting_time[min_pid] = turnaround_time[min_pid] - burst_time
+
+            if progress:
+                progress(completed, n)  # Report completed processes
     
-    # Prepare the result in a DataFrame
+    # Prepare the result rows
     result = []
     for p in processes:
         pid, arrival, burst = p
@@ -93,7 +109,7 @@ def srtf_scheduling(processes):
             first_response[pid] - arrival
         ])
     
-    # Create the DataFrame
-    df = pd.DataFrame(result, columns=["PID", "Arrival", "Burst", "Priority", "Completion", "Turnaround", "Waiting", "Response"])
+    # Create the result table
+    table = ResultTable.from_rows(result, ["PID", "Arrival", "Burst", "Priority", "Completion", "Turnaround", "Waiting", "Response"])
     
-    return df, gantt_chart
\ No newline at end of file
+    return table, gantt_chart
\ No newline at end of file
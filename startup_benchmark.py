@@ -0,0 +1,81 @@
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+
+# The main window must be interactive within this many milliseconds
+STARTUP_BUDGET_MS = 300
+
+# Modules that must not be imported before the window appears (they are loaded on first use)
+HEAVY_MODULES = ("pandas", "matplotlib", "optimizer", "scheduler_animation", "gantt_chart", "stats_chart")
+
+# Runs in a fresh interpreter for every measurement, so nothing is cached in sys.modules
+_PROBE = """
+import json, sys, time
+started = time.perf_counter()
+import tkinter as tk
+import main
+imported = time.perf_counter()
+ready = None
+try:
+    root = tk.Tk()
+except tk.TclError:  # No display: only the import time can be measured
+    root = None
+if root is not None:
+    app = main.CPUSchedulerApp(root)
+    root.update()
+    ready = time.perf_counter()
+    root.destroy()
+print(json.dumps({"import_ms": (imported - started) * 1000,
+                  "ready_ms": None if ready is None else (ready - started) * 1000,
+                  "heavy": [m for m in %r if m in sys.modules]}))
+""" % (HEAVY_MODULES,)
+
+
+def measure_startup(runs=5):
+    """Median import / window-ready times (ms) over `runs` cold interpreter starts"""
+    samples = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        output = subprocess.run([sys.executable, "-c", _PROBE], capture_output=True, text=True, check=True).stdout
+        sample = json.loads(output.strip().splitlines()[-1])
+        sample["process_ms"] = (time.perf_counter() - started) * 1000
+        samples.append(sample)
+
+    ready = [s["ready_ms"] for s in samples if s["ready_ms"] is not None]
+    return {
+        "runs": runs,
+        "import_ms": statistics.median(s["import_ms"] for s in samples),
+        "ready_ms": statistics.median(ready) if ready else None,
+        "process_ms": statistics.median(s["process_ms"] for s in samples),
+        "heavy_modules": sorted({m for s in samples for m in s["heavy"]}),
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Measure GUI cold-start time")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--budget", type=float, default=STARTUP_BUDGET_MS, help="allowed startup time in ms")
+    args = parser.parse_args()
+
+    report = measure_startup(args.runs)
+    startup = report["ready_ms"] if report["ready_ms"] is not None else report["import_ms"]
+    print(f"import main:        {report['import_ms']:.0f} ms")
+    if report["ready_ms"] is not None:
+        print(f"window interactive: {report['ready_ms']:.0f} ms")
+    else:
+        print("window interactive: n/a (no display; budget checked against the import time)")
+    print(f"process wall time:  {report['process_ms']:.0f} ms (incl. interpreter start/exit)")
+
+    failed = False
+    if report["heavy_modules"]:
+        print(f"FAIL: imported at startup: {', '.join(report['heavy_modules'])}")
+        failed = True
+    if startup > args.budget:
+        print(f"FAIL: startup {startup:.0f} ms exceeds the {args.budget:.0f} ms budget")
+        failed = True
+    if not failed:
+        print(f"OK: within the {args.budget:.0f} ms budget")
+    sys.exit(1 if failed else 0)
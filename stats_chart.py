@@ -1,31 +1,59 @@
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-
-def plot_stats_chart(fcfs_df, frame):
-    avg_tat = fcfs_df["Turnaround"].mean()
-    avg_wt = fcfs_df["Waiting"].mean()
-    avg_rt = fcfs_df["Response"].mean()
-
-    stats = ["Avg Turnaround", "Avg Waiting", "Avg Response"]
-    values = [avg_tat, avg_wt, avg_rt]
-
-    fig, ax = plt.subplots(figsize=(2, 3)) 
-    ax.bar(stats, values, color=["#FF9999", "#66B3FF", "#99FF99"])
-
-    # Labels
-    for i, v in enumerate(values):
-        ax.text(i, v + 0.2, f"{v:.2f}", color="black", ha="center", fontweight="bold")
-
-    ax.set_ylim(0, max(values) * 1.2)
-    ax.set_ylabel("Time (ms)")
-    ax.set_title("Performance Metrics")
-    
-    # Remove grid lines
-    ax.grid(False)
-
-    # Clear previous graph and display new one
-    for widget in frame.winfo_children():
-        widget.destroy()
-    canvas = FigureCanvasTkAgg(fig, master=frame)
-    canvas.draw()
-    canvas.get_tk_widget().pack(fill="both", expand=True)
+import numpy as np
+from chart_canvas import ChartCanvas
+from metrics import compute_metrics, format_metric
+
+STATS = ["Turnaround", "Waiting", "Response"]
+SERIES = [("Avg", "avg", "#FF9999"), ("P95", "p95", "#66B3FF"), ("P99", "p99", "#99FF99")]
+BAR_WIDTH = 0.27
+
+
+def plot_stats_chart(fcfs_df, frame, gantt=None, note=None):
+    """Update the frame's persistent metrics bar chart in place (`note`: an extra title line)"""
+    metrics = compute_metrics(fcfs_df, gantt)
+
+    chart = ChartCanvas.of(frame, figsize=(2, 3))
+    ax = _stats_axes(chart)
+    ax.set_visible(True)
+    top = 0
+
+    for (label, prefix, color), bars, texts in zip(SERIES, chart.artists["bars"], chart.artists["labels"]):
+        values = [metrics[f"{prefix}_{stat.lower()}"] for stat in STATS]
+        top = max(top, max(values))
+
+        # Bar heights and their labels
+        for bar, text, v in zip(bars, texts, values):
+            bar.set_height(v)
+            text.set_y(v + 0.2)
+            text.set_text(f"{v:.1f}")
+
+    ax.set_ylim(0, max(top, 1) * 1.2)
+    ax.set_title(
+        "Performance Metrics\n"
+        f"CPU {format_metric('utilization', metrics['utilization'])} · "
+        f"Throughput {format_metric('throughput', metrics['throughput'])} · "
+        f"Idle {format_metric('idle_time', metrics['idle_time'])}"
+        + (f"\n{note}" if note else ""),
+        fontsize=9
+    )
+    chart.draw()
+
+
+def _stats_axes(chart):
+    """Axes, bars and value labels, created the first time the frame shows the chart"""
+    if "bars" not in chart.artists:
+        ax = chart.figure.add_subplot()
+        x = np.arange(len(STATS))
+        chart.artists["bars"], chart.artists["labels"] = [], []
+        for i, (label, prefix, color) in enumerate(SERIES):
+            offsets = x + (i - 1) * BAR_WIDTH
+            chart.artists["bars"].append(ax.bar(offsets, np.zeros(len(STATS)), BAR_WIDTH, label=label, color=color))
+            chart.artists["labels"].append([ax.text(offset, 0, "", color="black", ha="center", fontsize=7,
+                                                    fontweight="bold") for offset in offsets])
+        ax.set_xticks(x)
+        ax.set_xticklabels(STATS)
+        ax.set_ylabel("Time (ms)")
+        ax.legend(loc="upper left", fontsize=7)
+
+        # Remove grid lines
+        ax.grid(False)
+    return chart.figure.axes[0]
@@ -0,0 +1,169 @@
+import csv
+import time
+from collections import namedtuple
+import numpy as np
+from event_core import Job
+from metrics import MetricsAccumulator
+from policies import make_policy
+from sim_logging import get_logger
+
+logger = get_logger(__name__)
+
+# Completed jobs buffered before they are folded into the running aggregates
+CHUNK_SIZE = 10000
+
+StreamResult = namedtuple("StreamResult", ["metrics", "completed", "max_in_system", "end_time"])
+
+
+def poisson_source(rate, mean_burst=5.0, burst_cv=1.0, priority_levels=0, duration=None, limit=None, seed=None):
+    """Endless (or `duration`/`limit` bounded) stream of processes with Poisson arrivals
+
+    Inter-arrival times are exponential with the given `rate`; bursts are gamma
+    distributed with the given mean and coefficient of variation. Random numbers are
+    drawn in blocks so the generator stays cheap per process.
+    """
+    rng = np.random.default_rng(seed)
+    shape = 1.0 / (burst_cv * burst_cv) if burst_cv > 0 else None
+    pid, clock = 0, 0.0
+    while True:
+        gaps = rng.exponential(1.0 / rate, 4096)
+        bursts = rng.gamma(shape, mean_burst / shape, 4096) if shape else np.full(4096, mean_burst)
+        priorities = rng.integers(1, priority_levels + 1, 4096) if priority_levels else None
+        for i in range(4096):
+            clock += gaps[i]
+            arrival = int(clock)
+            if (duration is not None and arrival >= duration) or (limit is not None and pid >= limit):
+                return
+            pid += 1
+            yield {"PID": pid, "Arrival": arrival, "Burst": max(1, int(round(bursts[i]))),
+                   "Priority": int(priorities[i]) if priorities is not None else "-"}
+
+
+def trace_source(path, follow=False, poll_interval=1.0):
+    """Processes read from a CSV trace (PID,Arrival,Burst[,Priority[,Bursts]]), optionally tailing it
+
+    The optional Bursts field lists alternating CPU and I/O durations separated by spaces
+    ("4 10 3 8 5"); Burst then becomes the total CPU time.
+
+    With `follow`, the file is watched like `tail -f` and new lines are yielded as they
+    are appended; the stream ends when a line reading "EOF" is written.
+    """
+    with open(path, newline="") as f:
+        while True:
+            line = f.readline()
+            if not line:
+                if not follow:
+                    return
+                time.sleep(poll_interval)
+                continue
+            line = line.strip()
+            if line == "EOF":
+                return
+            if not line or line.startswith("#") or line.lower().startswith("pid"):
+                continue
+            fields = next(csv.reader([line]))
+            process = {"PID": int(fields[0]), "Arrival": int(fields[1]), "Burst": int(fields[2]), "Priority": "-"}
+            if len(fields) > 3 and fields[3].strip() not in ("", "-"):
+                process["Priority"] = int(fields[3])
+            if len(fields) > 4 and fields[4].strip():
+                process["Bursts"] = [int(value) for value in fields[4].split()]
+                process["Burst"] = sum(process["Bursts"][0::2])
+            yield process
+
+
+def stream_simulate(source, policy, progress=None, chunk_size=CHUNK_SIZE):
+    """Online event-driven simulation over an arrival-ordered stream of processes
+
+    Only jobs currently in the system are kept in memory: completed jobs are buffered
+    in small chunks and folded into a MetricsAccumulator, so arbitrarily long streams
+    run in bounded memory. `progress(completed, None)` is called after every chunk.
+    Processes with CPU/IO burst sequences ("Bursts") are rejected: they need the
+    I/O-aware engine (io_engine.simulate_io), which is not online.
+    """
+    arrivals = iter(source)
+    accumulator = MetricsAccumulator()
+    buffer = {col: [] for col in ("Arrival", "Burst", "Completion", "Turnaround", "Waiting", "Response")}
+
+    def pull():
+        p = next(arrivals, None)
+        if p is None:
+            return None
+        if len(p.get("Bursts") or ()) > 1:
+            raise ValueError(f"PID {p['PID']}: CPU/IO burst sequences cannot be streamed; simulate the trace with "
+                             f"the I/O-aware engine (cli.py run)")
+        return Job(p["PID"], p["Arrival"], p["Burst"], p.get("Priority", "-"), seq, p.get("Deadline"))
+
+    def flush():
+        if buffer["Arrival"]:
+            accumulator.add({col: np.asarray(values) for col, values in buffer.items()})
+            for values in buffer.values():
+                values.clear()
+
+    def admit(now):
+        nonlocal upcoming, in_system, seq
+        while upcoming is not None and upcoming.arrival <= now:
+            policy.add(upcoming, now)
+            in_system += 1
+            seq += 1
+            previous, upcoming = upcoming, pull()
+            if upcoming is not None and upcoming.arrival < previous.arrival:
+                raise ValueError(f"Stream is not ordered by arrival (PID {upcoming.pid} after {previous.pid})")
+
+    seq = 0
+    upcoming = pull()
+    now = upcoming.arrival if upcoming else 0
+    completed = in_system = max_in_system = 0
+    last_pid = None
+
+    while True:
+        admit(now)  # Admit everything that has arrived by now
+        max_in_system = max(max_in_system, in_system)
+
+        if not len(policy):
+            if upcoming is None:
+                break
+            now = upcoming.arrival  # CPU idle: jump to the next arrival
+            continue
+
+        job = policy.pick(now)
+        if last_pid is not None and last_pid != job.pid:
+            accumulator.context_switches += 1
+        last_pid = job.pid
+        if job.first_run is None:
+            job.first_run = now
+
+        run = job.remaining
+        limit = policy.time_slice(job, now)
+        if limit is not None:
+            run = min(run, max(1, limit))
+        if policy.preempt_on_arrival and upcoming is not None and upcoming.arrival < now + run:
+            run = upcoming.arrival - now
+
+        now += run
+        job.remaining -= run
+        policy.charge(job, run, now)
+
+        if job.remaining == 0:
+            turnaround = now - job.arrival
+            for col, value in zip(buffer, (job.arrival, job.burst, now, turnaround, turnaround - job.burst,
+                                           job.first_run - job.arrival)):
+                buffer[col].append(value)
+            completed += 1
+            in_system -= 1
+            policy.complete(job, now)
+            if len(buffer["Arrival"]) >= chunk_size:
+                flush()
+                if progress:
+                    progress(completed, None)
+        else:
+            admit(now)  # Jobs arriving during the slice queue up ahead of the preempted job
+            policy.requeue(job, run, now)
+
+    flush()
+    logger.debug("stream finished: %d processes, at most %d in the system", completed, max_in_system)
+    return StreamResult(accumulator.result(), completed, max_in_system, now)
+
+
+def stream_metrics(source, algorithm, time_quantum=None, progress=None, **options):
+    """Run one of algorithms.ALGORITHMS over a process stream"""
+    return stream_simulate(source, make_policy(algorithm, time_quantum, **options), progress=progress)
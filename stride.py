@@ -0,0 +1,60 @@
+import heapq
+from event_core import Policy, simulate, process_weight, RESULT_COLUMNS
+from result_table import ResultTable
+
+STRIDE1 = 1 << 20  # Large constant so strides stay integral for any ticket count
+
+
+class StridePolicy(Policy):
+    """Stride scheduling: each job advances its pass by its stride (STRIDE1 / tickets)
+    for every time unit it runs, and the job with the smallest pass runs next. This
+    is the deterministic counterpart of lottery scheduling."""
+
+    def __init__(self, quantum=1):
+        self.quantum = quantum
+        self.heap = []  # (pass, seq, job)
+        self.strides = {}
+        self.global_pass = 0
+
+    def __len__(self):
+        return len(self.heap)
+
+    def add(self, job, now):
+        tickets = job_tickets(job)
+        self.strides[job.seq] = STRIDE1 // tickets
+        # Newly arrived jobs join at the current global pass instead of pass 0
+        job.key = max(job.key, self.global_pass)
+        heapq.heappush(self.heap, (job.key, job.seq, job))
+
+    def pick(self, now):
+        pass_value, _, job = heapq.heappop(self.heap)
+        self.global_pass = max(self.global_pass, pass_value)
+        return job
+
+    def time_slice(self, job, now):
+        return self.quantum
+
+    def charge(self, job, ran, now):
+        job.key += self.strides[job.seq] * ran
+
+    def requeue(self, job, ran, now):
+        heapq.heappush(self.heap, (job.key, job.seq, job))
+
+    def complete(self, job, now):
+        del self.strides[job.seq]
+
+
+def job_tickets(job):
+    """Tickets for a job: derived from its priority like a CFS weight"""
+    return process_weight(job.priority)
+
+
+def stride_scheduling(processes, quantum=1, progress=None):
+    """Stride Scheduling Algorithm (Priority sets the ticket share, like a nice value)"""
+    if not processes:
+        return ResultTable.from_rows([], RESULT_COLUMNS), []
+
+    rows, gantt_chart = simulate(processes, StridePolicy(quantum), progress=progress)
+
+    table = ResultTable.from_rows(rows, RESULT_COLUMNS)
+    return table, gantt_chart
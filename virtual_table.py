@@ -0,0 +1,256 @@
+import operator
+import tkinter as tk
+from tkinter import ttk
+import numpy as np
+from result_store import MISSING
+
+# Operators accepted by VirtualTable.apply_filter_text, e.g. "Waiting >= 10"
+FILTER_OPERATORS = {
+    ">=": operator.ge,
+    "<=": operator.le,
+    "!=": operator.ne,
+    "==": operator.eq,
+    ">": operator.gt,
+    "<": operator.lt,
+    "=": operator.eq,
+}
+
+
+class VirtualTable:
+    """Treeview that only creates items for the visible rows of a columnar data set"""
+
+    def __init__(self, master, columns, height=10, column_width=135):
+        self.columns = list(columns)
+        self.height = height
+
+        self.frame = tk.Frame(master)
+        self.scrollbar = tk.Scrollbar(self.frame, orient="vertical", command=self._on_scrollbar)
+        self.tree = ttk.Treeview(self.frame, columns=self.columns, show="headings",
+                                 height=height, selectmode="extended")
+
+        for col in self.columns:
+            self.tree.heading(col, text=col, anchor="center", command=lambda c=col: self.sort_by(c))
+            self.tree.column(col, width=column_width, anchor="center")
+
+        self.tree.grid(row=0, column=0, sticky="nsew")
+        self.scrollbar.grid(row=0, column=1, sticky="ns")
+        self.frame.grid_rowconfigure(0, weight=1)
+        self.frame.grid_columnconfigure(0, weight=1)
+
+        # Mouse wheel scrolling (Windows/macOS and X11)
+        self.tree.bind("<MouseWheel>", lambda e: self.scroll(-1 if e.delta > 0 else 1))
+        self.tree.bind("<Button-4>", lambda e: self.scroll(-1))
+        self.tree.bind("<Button-5>", lambda e: self.scroll(1))
+        self.tree.bind("<<TreeviewSelect>>", self._on_select)
+
+        # Underlying columnar data; lists while rows are appended, arrays once set in bulk
+        self._data = {col: [] for col in self.columns}
+        self._sort_keys = {}  # Cached numeric sort keys per column
+        self._order = np.arange(0)  # View position -> data row index (after sort and filter)
+        self._mask = None  # Boolean filter mask over the data rows
+        self._sort_column = None
+        self._sort_descending = False
+        self._top = 0  # First visible view position
+        self._selected = set()  # Selected data row indices
+        self._refreshing = False
+
+        # One Treeview item per visible slot; values are swapped in on scroll
+        self._slots = []
+
+    def grid(self, **kwargs):
+        self.frame.grid(**kwargs)
+
+    def pack(self, **kwargs):
+        self.frame.pack(**kwargs)
+
+    # ---------------- Data ----------------
+
+    def __len__(self):
+        return len(self._data[self.columns[0]]) if self.columns else 0
+
+    def set_data(self, data):
+        """Replace the table contents with a mapping of column name -> sequence"""
+        self._data = {col: _as_column(data[col]) if col in data else np.full(self._length_of(data), "-", dtype=object)
+                      for col in self.columns}
+        self._selected.clear()
+        self._mask = None
+        self._top = 0
+        self._invalidate()
+
+    def append_row(self, values):
+        """Append a single row (sequence in column order) and keep the current view"""
+        for col, value in zip(self.columns, values):
+            column = self._data[col]
+            if isinstance(column, np.ndarray):
+                column = self._data[col] = column.tolist()
+            column.append(value)
+        self._mask = None
+        self._invalidate()
+
+    def clear(self):
+        self.set_data({col: [] for col in self.columns})
+
+    def column(self, col):
+        """Return the underlying values of a column as an array"""
+        return np.asarray(self._data[col])
+
+    def row(self, index):
+        """Return the values of one data row in column order (MISSING shown as '-')"""
+        return tuple("-" if isinstance(value, np.integer) and value == MISSING else value
+                     for value in (self._data[col][index] for col in self.columns))
+
+    def _length_of(self, data):
+        for values in data.values():
+            return len(values)
+        return 0
+
+    # ---------------- Sorting & Filtering ----------------
+
+    def sort_by(self, col, descending=None):
+        """Sort the view by a column (clicking the same heading toggles the order)"""
+        if descending is None:
+            descending = not self._sort_descending if col == self._sort_column else False
+        self._sort_column = col
+        self._sort_descending = descending
+        self._update_view()
+
+    def set_filter(self, mask):
+        """Show only the data rows where the boolean mask is True (None clears the filter)"""
+        self._mask = None if mask is None else np.asarray(mask, dtype=bool)
+        self._top = 0
+        self._update_view()
+
+    def apply_filter_text(self, text):
+        """Filter with a simple '<column> <operator> <number>' expression; empty text clears it"""
+        text = text.strip()
+        if not text:
+            self.set_filter(None)
+            return True
+
+        for symbol, op in FILTER_OPERATORS.items():
+            if symbol in text:
+                col, value = (part.strip() for part in text.split(symbol, 1))
+                break
+        else:
+            return False
+
+        col = next((c for c in self.columns if c.lower() == col.lower()), None)
+        if col is None:
+            return False
+        try:
+            value = float(value)
+        except ValueError:
+            return False
+
+        with np.errstate(invalid="ignore"):
+            self.set_filter(op(self._sort_key(col), value))
+        return True
+
+    def _sort_key(self, col):
+        """Numeric view of a column; non-numeric entries such as '-' become NaN"""
+        if col not in self._sort_keys:
+            values = self._data[col]
+            try:
+                key = np.asarray(values, dtype=float)
+            except (TypeError, ValueError):
+                key = np.array([_to_float(v) for v in values], dtype=float)
+            if isinstance(values, np.ndarray) and values.dtype == np.int64:
+                key[values == MISSING] = np.nan  # Stored "-", as in result files
+            self._sort_keys[col] = key
+        return self._sort_keys[col]
+
+    def _invalidate(self):
+        self._sort_keys = {}
+        self._update_view()
+
+    def _update_view(self):
+        order = np.arange(len(self))
+        if self._mask is not None and len(self._mask) == len(order):
+            order = order[self._mask]
+        if self._sort_column is not None and len(order):
+            key = self._sort_key(self._sort_column)[order]
+            if self._sort_descending:
+                key = -key
+            order = order[np.argsort(key, kind="stable")]
+        self._order = order
+        self._top = max(0, min(self._top, len(self._order) - self.height))
+        self.refresh()
+
+    # ---------------- Scrolling & Rendering ----------------
+
+    def scroll(self, rows):
+        self.scroll_to(self._top + rows)
+
+    def scroll_to(self, position):
+        position = max(0, min(int(position), len(self._order) - self.height))
+        if position != self._top:
+            self._top = position
+            self.refresh()
+
+    def _on_scrollbar(self, action, value, unit=None):
+        if action == "moveto":
+            self.scroll_to(float(value) * len(self._order))
+        elif action == "scroll":
+            step = self.height if unit == "pages" else 1
+            self.scroll(int(value) * step)
+
+    def refresh(self):
+        """Render the visible window of rows into the Treeview slots"""
+        visible = self._order[self._top:self._top + self.height]
+
+        # Create or drop slot items so there is exactly one per visible row
+        while len(self._slots) < len(visible):
+            self._slots.append(self.tree.insert("", "end", values=()))
+        while len(self._slots) > len(visible):
+            self.tree.delete(self._slots.pop())
+
+        self._refreshing = True
+        selected_slots = []
+        for slot, index in zip(self._slots, visible):
+            self.tree.item(slot, values=self.row(index))
+            if index in self._selected:
+                selected_slots.append(slot)
+        self.tree.selection_set(selected_slots)
+        self._refreshing = False
+
+        total = len(self._order)
+        if total:
+            self.scrollbar.set(self._top / total, min(1.0, (self._top + self.height) / total))
+        else:
+            self.scrollbar.set(0.0, 1.0)
+
+    # ---------------- Selection ----------------
+
+    def _on_select(self, event):
+        if self._refreshing:
+            return
+        selected = set(self.tree.selection())
+        for position, slot in enumerate(self._slots):
+            index = int(self._order[self._top + position])
+            if slot in selected:
+                self._selected.add(index)
+            else:
+                self._selected.discard(index)
+
+    def selected_rows(self):
+        """Data row indices of the current selection (including rows scrolled out of view)"""
+        return sorted(self._selected)
+
+
+def _to_float(value):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return np.nan
+
+
+def _as_column(values):
+    """Convert a sequence to an array, keeping mixed values like 3 and '-' as objects"""
+    if hasattr(values, "to_numpy"):  # pandas Series
+        values = values.to_numpy()
+    if isinstance(values, np.ndarray):
+        return values
+    values = list(values)
+    if any(isinstance(v, str) for v in values):
+        return np.array(values, dtype=object)
+    return np.asarray(values)
@@ -0,0 +1,69 @@
+import numpy as np
+
+
+def generate_workload(n, mean_burst=8.0, burst_cv=1.0, arrival_burstiness=1.0, load=0.9,
+                      priority_levels=5, seed=None):
+    """Synthetic process list with controllable shape
+
+    Bursts follow a gamma distribution with the given mean and coefficient of variation.
+    Inter-arrival gaps are gamma distributed too: `arrival_burstiness` is their coefficient
+    of variation (0 = evenly spaced, 1 = Poisson arrivals, > 1 = bursty) and their mean is
+    chosen so the CPU is offered `load` (total burst / arrival span). With
+    `priority_levels=0` processes get no priority ("-").
+    """
+    rng = np.random.default_rng(seed)
+    bursts = np.maximum(1, np.rint(_gamma(rng, mean_burst, burst_cv, n))).astype(int)
+    gaps = _gamma(rng, mean_burst / max(load, 1e-9), arrival_burstiness, n)
+    if n:
+        gaps[0] = 0
+    arrivals = np.rint(np.cumsum(gaps)).astype(int)
+    if priority_levels:
+        priorities = rng.integers(1, priority_levels + 1, n).tolist()
+    else:
+        priorities = ["-"] * n
+
+    return [{"PID": pid, "Arrival": arrival, "Burst": burst, "Priority": priority}
+            for pid, arrival, burst, priority in zip(range(1, n + 1), arrivals.tolist(), bursts.tolist(), priorities)]
+
+
+def generate_io_workload(n, cpu_bursts=5, mean_cpu=4.0, mean_io=4.0, burst_cv=1.0, load=0.9,
+                         priority_levels=5, seed=None):
+    """Processes that alternate CPU and I/O bursts ("Bursts": cpu, io, cpu, ..., cpu)
+
+    Every process gets `cpu_bursts` gamma-distributed CPU bursts separated by I/O bursts
+    with mean `mean_io`; arrivals are Poisson, spaced so the CPU is offered `load`.
+    "Burst" is the total CPU time.
+    """
+    rng = np.random.default_rng(seed)
+    cpu = np.maximum(1, np.rint(_gamma(rng, mean_cpu, burst_cv, (n, cpu_bursts)))).astype(int)
+    io = np.maximum(1, np.rint(_gamma(rng, mean_io, burst_cv, (n, cpu_bursts - 1)))).astype(int)
+    bursts = np.empty((n, 2 * cpu_bursts - 1), dtype=int)
+    bursts[:, 0::2], bursts[:, 1::2] = cpu, io
+    gaps = rng.exponential(mean_cpu * cpu_bursts / max(load, 1e-9), n)
+    if n:
+        gaps[0] = 0
+    arrivals = np.rint(np.cumsum(gaps)).astype(int)
+    priorities = rng.integers(1, priority_levels + 1, n).tolist() if priority_levels else ["-"] * n
+
+    return [{"PID": pid, "Arrival": arrival, "Burst": sum(sequence[0::2]), "Priority": priority, "Bursts": sequence}
+            for pid, arrival, sequence, priority in zip(range(1, n + 1), arrivals.tolist(), bursts.tolist(), priorities)]
+
+
+def random_workload(n, rng):
+    """Workload with randomly drawn shape parameters, used for calibration sweeps"""
+    return generate_workload(
+        n,
+        mean_burst=float(rng.uniform(2, 15)),
+        burst_cv=float(rng.uniform(0.1, 2.5)),
+        arrival_burstiness=float(rng.uniform(0.1, 3.0)),
+        load=float(rng.uniform(0.3, 1.5)),
+        priority_levels=int(rng.integers(1, 10)),
+        seed=int(rng.integers(2 ** 32)),
+    )
+
+
+def _gamma(rng, mean, cv, size):
+    if cv <= 0:
+        return np.full(size, float(mean))
+    shape = 1.0 / (cv * cv)
+    return rng.gamma(shape, mean / shape, size)